@@ -1,19 +1,44 @@
 #!/usr/bin/env python3
 """Scan all markdown files with github_url frontmatter, fetch real star counts
-from the GitHub API, and update the `stars:` field in-place."""
+from the GitHub API, and update the `stars:` field in-place.
+
+The unique owner/repo set is collected from every file first and resolved with
+aliased GraphQL queries (up to GRAPHQL_BATCH_SIZE repos per query). Without a
+token, or if GraphQL fails, it falls back to one cached REST call per repo.
+Requests are paced by the shared rate-limit scheduler (github_ratelimit.py).
+Pages are found through the collection index (collection_index.py) and
+patched through frontmatter.py, so unchanged pages are not reread and only
+the `stars:` line of each header is rewritten.
+
+GITHUB_API_URL / GITHUB_GRAPHQL_URL override the endpoints (both are set by
+GitHub Actions; see github_client.py), e.g. to point at the local stand-in
+server in smolbenchmark/mock_github.py."""
 
 import os
 import re
 import sys
-import time
 import urllib.request
 import urllib.error
 import json
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+import github_client
+from github_client import github_headers
+from github_cache import cached_urlopen, print_cache_report
+from frontmatter import PatchBatch
+from collection_index import CollectionIndex, load_index
+from github_ratelimit import SCHEDULER
+
 COLLECTIONS = ["_models", "_rl", "_projects", "_datasets"]
+# Slim listing indexes (see listing_index.py) also carry star counts
+LISTING_GLOBS = ["_data/listings/*.json", "assets/data/listings/*.json"]
 GH_TOKEN = os.environ.get("GH_TOKEN", "")
+GITHUB_API_URL = github_client.API_URL
+GITHUB_GRAPHQL_URL = github_client.GRAPHQL_URL
+GRAPHQL_BATCH_SIZE = 100
 
 _star_cache: dict[str, int] = {}
 
@@ -21,18 +46,16 @@ _star_cache: dict[str, int] = {}
 def gh_stars(owner_repo: str) -> int | None:
     if owner_repo in _star_cache:
         return _star_cache[owner_repo]
-    url = f"https://api.github.com/repos/{owner_repo}"
+    url = f"{GITHUB_API_URL}/repos/{owner_repo}"
     req = urllib.request.Request(url)
-    req.add_header("Accept", "application/vnd.github+json")
+    for name, value in github_headers(GH_TOKEN, accept="application/vnd.github+json").items():
+        req.add_header(name, value)
     req.add_header("X-GitHub-Api-Version", "2022-11-28")
-    if GH_TOKEN:
-        req.add_header("Authorization", f"Bearer {GH_TOKEN}")
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read())
-            stars = data.get("stargazers_count")
-            _star_cache[owner_repo] = stars
-            return stars
+        data = json.loads(cached_urlopen(req, timeout=10))
+        stars = data.get("stargazers_count")
+        _star_cache[owner_repo] = stars
+        return stars
     except urllib.error.HTTPError as e:
         print(f"  HTTP {e.code} for {owner_repo}", file=sys.stderr)
     except Exception as e:
@@ -40,6 +63,44 @@ def gh_stars(owner_repo: str) -> int | None:
     return None
 
 
+def build_stars_query(repos: list[str]) -> str:
+    """One aliased GraphQL query resolving stargazerCount for every repo in the batch."""
+    fields = []
+    for i, owner_repo in enumerate(repos):
+        owner, name = owner_repo.split("/", 1)
+        fields.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ stargazerCount }}"
+        )
+    return "query {\n  " + "\n  ".join(fields) + "\n}"
+
+
+def gh_stars_batch(repos: list[str]) -> dict[str, int | None]:
+    """Resolve star counts for many repos with ceil(n / GRAPHQL_BATCH_SIZE) GraphQL calls.
+
+    Repos GraphQL cannot resolve (missing, renamed, no access) map to None.
+    Raises on transport errors so the caller can fall back to REST.
+    """
+    stars: dict[str, int | None] = {}
+    for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+        batch = repos[start:start + GRAPHQL_BATCH_SIZE]
+        payload = json.dumps({"query": build_stars_query(batch)}).encode("utf-8")
+        req = urllib.request.Request(GITHUB_GRAPHQL_URL, data=payload, method="POST")
+        req.add_header("Content-Type", "application/json")
+        req.add_header("Authorization", f"Bearer {GH_TOKEN}")
+        SCHEDULER.acquire(GITHUB_GRAPHQL_URL)
+        status, headers, body = github_client.urlopen(req, timeout=30)
+        SCHEDULER.observe(GITHUB_GRAPHQL_URL, status, headers)
+        result = json.loads(body)
+
+        data = result.get("data") or {}
+        for error in result.get("errors") or []:
+            print(f"  GraphQL: {error.get('message', error)}", file=sys.stderr)
+        for i, owner_repo in enumerate(batch):
+            node = data.get(f"r{i}")
+            stars[owner_repo] = node.get("stargazerCount") if node else None
+    return stars
+
+
 def parse_github_url(url: str) -> str | None:
     """Extract owner/repo from any github.com URL."""
     m = re.search(r"github\.com/([^/]+/[^/?\s#]+)", url)
@@ -48,55 +109,98 @@ def parse_github_url(url: str) -> str | None:
     return m.group(1).rstrip("/")
 
 
-def update_file(path: Path) -> bool:
-    text = path.read_text(encoding="utf-8")
-
-    # Must have frontmatter
-    if not text.startswith("---"):
-        return False
-
-    fm_match = re.match(r"^---\n(.*?)\n---", text, re.DOTALL)
-    if not fm_match:
-        return False
-
-    fm = fm_match.group(1)
-    url_match = re.search(r'^github_url:\s*["\']?(.+?)["\']?\s*$', fm, re.MULTILINE)
-    if not url_match:
-        return False
-
-    owner_repo = parse_github_url(url_match.group(1).strip())
-    if not owner_repo:
-        return False
-
-    stars = gh_stars(owner_repo)
-    if stars is None:
-        return False
-
-    time.sleep(0.1)  # stay well within rate limits
-
-    stars_line = f"stars: {stars}"
-
-    if re.search(r'^stars:\s*\S+', fm, re.MULTILINE):
-        new_fm = re.sub(r'^stars:\s*\S+', stars_line, fm, flags=re.MULTILINE)
-    else:
-        new_fm = fm.rstrip() + f"\n{stars_line}"
-
-    if new_fm == fm:
-        return False  # nothing changed
-
-    new_text = text.replace(fm_match.group(1), new_fm, 1)
-    path.write_text(new_text, encoding="utf-8")
-    print(f"  {path.relative_to(REPO_ROOT)}: {stars} stars ({owner_repo})")
-    return True
-
-
-changed = 0
-for collection in COLLECTIONS:
-    collection_path = REPO_ROOT / collection
-    if not collection_path.is_dir():
-        continue
-    for md in sorted(collection_path.glob("*.md")):
-        if update_file(md):
+def collect_files(index: CollectionIndex) -> list[tuple[Path, str]]:
+    """(page, owner/repo) for every page with a github_url, from the collection index."""
+    files = []
+    for collection in COLLECTIONS:
+        for entry in index.entries(collection):
+            github_url = entry["frontmatter"].get("github_url")
+            owner_repo = parse_github_url(str(github_url).strip()) if github_url else None
+            if owner_repo:
+                files.append((index.path(entry), owner_repo))
+    return files
+
+
+def listing_files() -> list[Path]:
+    return [path for pattern in LISTING_GLOBS for path in sorted(REPO_ROOT.glob(pattern))]
+
+
+def listing_repos() -> set[str]:
+    repos = set()
+    for path in listing_files():
+        for item in json.loads(path.read_text(encoding="utf-8")).get("items", []):
+            owner_repo = parse_github_url(item.get("url") or "")
+            if owner_repo:
+                repos.add(owner_repo)
+    return repos
+
+
+def update_listings(stars_by_repo: dict[str, int | None]) -> int:
+    """Refresh `stars` on listing index items; returns the number of files rewritten."""
+    changed = 0
+    for path in listing_files():
+        data = json.loads(path.read_text(encoding="utf-8"))
+        dirty = False
+        for item in data.get("items", []):
+            stars = stars_by_repo.get(parse_github_url(item.get("url") or "") or "")
+            if stars is not None and item.get("stars") != stars:
+                item["stars"] = stars
+                dirty = True
+        if dirty:
+            path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            print(f"  {path.relative_to(REPO_ROOT)}: stars refreshed")
             changed += 1
+    return changed
 
-print(f"\nDone — updated {changed} file(s).")
+
+def resolve_stars(repos: list[str]) -> dict[str, int | None]:
+    if GH_TOKEN:
+        try:
+            stars = gh_stars_batch(repos)
+            calls = -(-len(repos) // GRAPHQL_BATCH_SIZE)
+            print(f"Resolved {len(repos)} repo(s) with {calls} GraphQL call(s)")
+            return stars
+        except Exception as e:
+            print(f"  GraphQL failed ({e}); falling back to REST", file=sys.stderr)
+
+    # Pacing and 403/429 retries are handled by the shared rate-limit scheduler
+    stars = {}
+    for i, owner_repo in enumerate(repos):
+        if SCHEDULER.exhausted(GITHUB_API_URL):
+            print(f"  Rate limit exhausted; skipping {len(repos) - i} remaining repo(s)", file=sys.stderr)
+            break
+        stars[owner_repo] = gh_stars(owner_repo)
+    return stars
+
+
+def main() -> None:
+    # Unchanged pages are not reread (see collection_index.py)
+    index = load_index(REPO_ROOT)
+    files = collect_files(index)
+    repos = sorted({owner_repo for _, owner_repo in files} | listing_repos())
+    print(f"Found {len(files)} file(s) referencing {len(repos)} unique repo(s)")
+
+    stars_by_repo = resolve_stars(repos)
+
+    # Only the `stars:` line is rewritten; each page is written at most once
+    batch = PatchBatch()
+    for path, owner_repo in files:
+        stars = stars_by_repo.get(owner_repo)
+        if stars is not None:
+            batch.set(path, stars=stars)
+    changed_paths = set(batch.commit())
+    for path in changed_paths:
+        index.touch(path)
+    index.save()
+    for path, owner_repo in files:
+        if path in changed_paths:
+            print(f"  {path.relative_to(REPO_ROOT)}: {stars_by_repo[owner_repo]} stars ({owner_repo})")
+    changed = len(changed_paths)
+    changed += update_listings(stars_by_repo)
+
+    print(f"\nDone — updated {changed} file(s).")
+    print_cache_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@
 """
 Add a single RL implementation from a GitHub folder URL into the site:
 - Updates _data/rl.json by appending or replacing the entry
-- Generates a new markdown in _rl/ without regenerating everything
+- Generates a new markdown in _rl/ without regenerating everything, under the
+  item's permanent name from _state/slugs.json (the same one refresh_rl.py uses)
 
 Usage:
   python3 add_rl_item.py --url https://github.com/<owner>/<repo>/tree/<branch>/<path>
@@ -15,14 +16,19 @@ Notes:
 import argparse
 import json
 import os
-import posixpath
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import requests
+from github_cache import cached_get, print_cache_report
+from github_client import API_URL
+from readme_store import dehydrate_entry
+from link_rewriter import absolutize_links
+from classifier import classify
+from collection_index import load_index
+from slug_registry import SlugRegistry
 
 
 BASE_PATH = Path(__file__).parent
@@ -51,7 +57,7 @@ def parse_github_folder_url(url: str) -> RepoRef:
 
 def github_contents_api_url(ref: RepoRef, file_path: Optional[str] = None) -> str:
     path = ref.path if file_path is None else f"{ref.path}/{file_path}"
-    return f"https://api.github.com/repos/{ref.owner}/{ref.repo}/contents/{path}?ref={ref.branch}"
+    return f"{API_URL}/repos/{ref.owner}/{ref.repo}/contents/{path}?ref={ref.branch}"
 
 
 def fetch_readme_text(ref: RepoRef) -> str:
@@ -59,17 +65,17 @@ def fetch_readme_text(ref: RepoRef) -> str:
     candidate_names = ["README.md", "Readme.md", "readme.md"]
     for name in candidate_names:
         url = github_contents_api_url(ref, name)
-        resp = requests.get(url)
+        resp = cached_get(url)
         if resp.status_code == 200:
             meta = resp.json()
             download_url = meta.get("download_url")
             if download_url:
-                r2 = requests.get(download_url)
+                r2 = cached_get(download_url)
                 r2.raise_for_status()
                 return r2.text
     # If not found individually, list directory and find a README*
     list_url = github_contents_api_url(ref)
-    resp = requests.get(list_url)
+    resp = cached_get(list_url)
     resp.raise_for_status()
     items = resp.json()
     if isinstance(items, list):
@@ -77,7 +83,7 @@ def fetch_readme_text(ref: RepoRef) -> str:
             if it.get("type") == "file" and re.match(r"(?i)^readme(\.[a-z0-9]+)?$", it.get("name", "")):
                 download_url = it.get("download_url")
                 if download_url:
-                    r2 = requests.get(download_url)
+                    r2 = cached_get(download_url)
                     r2.raise_for_status()
                     return r2.text
     return ""
@@ -85,41 +91,8 @@ def fetch_readme_text(ref: RepoRef) -> str:
 
 def absolutize_markdown_links(markdown_text: str, ref: RepoRef) -> str:
     """Convert relative markdown/HTML links to raw.githubusercontent.com absolute URLs."""
-    if not markdown_text:
-        return markdown_text
-
-    def to_absolute(url: str) -> str:
-        if not url:
-            return url
-        u = url.strip()
-        if re.match(r"^(?:https?:)?//", u) or u.startswith("mailto:") or u.startswith("#"):
-            return u
-        if u.startswith('/'):
-            resolved = u.lstrip('/')
-        else:
-            joined = posixpath.join(ref.path, u) if ref.path else u
-            resolved = posixpath.normpath(joined)
-        return f"https://raw.githubusercontent.com/{ref.owner}/{ref.repo}/{ref.branch}/{resolved}"
-
-    def repl_md_image(m):
-        return f"![{m.group(1)}]({to_absolute(m.group(2))}{m.group(3) or ''})"
-
-    def repl_md_link(m):
-        return f"[{m.group(1)}]({to_absolute(m.group(2))}{m.group(3) or ''})"
-
-    def repl_html_src(m):
-        return f"{m.group(1)}{to_absolute(m.group(2))}{m.group(3)}"
-
-    md_image_pattern = re.compile(r"!\[([^\]]*)\]\(([^\)\s]+)(\s+\"[^\"]*\")?\)")
-    md_link_pattern = re.compile(r"(?<!\!)\[([^\]]+)\]\(([^\)\s]+)(\s+\"[^\"]*\")?\)")
-    html_src_pattern = re.compile(r"(src=\")([^\"]+)(\")", re.IGNORECASE)
-    html_href_pattern = re.compile(r"(href=\")([^\"]+)(\")", re.IGNORECASE)
-
-    updated = md_image_pattern.sub(repl_md_image, markdown_text)
-    updated = md_link_pattern.sub(repl_md_link, updated)
-    updated = html_src_pattern.sub(repl_html_src, updated)
-    updated = html_href_pattern.sub(repl_html_src, updated)
-    return updated
+    raw_base_url = f"https://raw.githubusercontent.com/{ref.owner}/{ref.repo}/{ref.branch}"
+    return absolutize_links(markdown_text, raw_base_url, ref.path)
 
 
 def clean_display_name(name: str) -> str:
@@ -137,62 +110,6 @@ def clean_display_name(name: str) -> str:
     return ' '.join(out)
 
 
-def detect_environment(name: str, readme: str) -> str:
-    nl = name.lower()
-    cl = readme.lower()
-    if 'atari' in nl or 'atari' in cl or 'pong' in cl:
-        return 'Atari'
-    if 'mujoco' in nl or 'mujoco' in cl:
-        return 'MuJoCo'
-    if 'lunar' in nl or 'lunarlander' in cl:
-        return 'LunarLander'
-    if 'taxi' in nl or 'taxi' in cl:
-        return 'Taxi'
-    if 'frozenlake' in nl or 'frozen' in cl:
-        return 'Frozenlake'
-    if 'flappybird' in nl or 'flappy' in cl:
-        return 'Flappybird'
-    if 'vizdoom' in nl or 'vizdoom' in cl:
-        return 'Vizdoom'
-    if any(env in cl for env in ['gymnasium', 'gym']):
-        return 'Gymnasium'
-    return 'Custom Environment'
-
-
-def collect_categories_for_site(name: str, path: str, readme: str) -> List[str]:
-    """Emit only site-supported labels; add Value-Based for DQN*, Policy-Based for others when appropriate."""
-    nl, pl, cl = name.lower(), path.lower(), readme.lower()
-    cats: List[str] = []
-    # Multi-Agent
-    if any(t in nl or t in pl or t in cl for t in ['marl', 'multi-agent', 'multi agent', 'ippo', 'mappo', 'self-play', 'self play']):
-        cats.append('Multi-Agent')
-    # Actor-Critic
-    if any(t in nl for t in ['a2c', 'a3c', 'sac', 'td3', 'ddpg']) or ('actor' in nl or 'critic' in nl) or 'actor-critic' in cl:
-        if 'Actor-Critic' not in cats:
-            cats.append('Actor-Critic')
-    # Exploration
-    if 'rnd' in nl or 'exploration' in cl or 'curiosity' in cl:
-        if 'Exploration' not in cats:
-            cats.append('Exploration')
-    # Imitation
-    if any(t in nl for t in ['imitation', 'behavioral', 'cloning']) or 'dagger' in cl:
-        if 'Imitation Learning' not in cats:
-            cats.append('Imitation Learning')
-    # Value/Policy tagging per site rules
-    if any(t in nl or t in pl or t in cl for t in ['dqn', 'duel', 'q-learning', 'q learning']):
-        cats.append('Value-Based')
-    else:
-        cats.append('Policy-Based')
-    # Deduplicate while keeping order
-    seen = set()
-    ordered = []
-    for c in cats:
-        if c not in seen:
-            seen.add(c)
-            ordered.append(c)
-    return ordered or ['Other']
-
-
 def choose_primary_category(categories: List[str]) -> str:
     prio = ['Multi-Agent', 'Actor-Critic', 'Exploration', 'Imitation Learning', 'Game Environments', 'Other']
     for p in prio:
@@ -201,35 +118,38 @@ def choose_primary_category(categories: List[str]) -> str:
     return categories[0] if categories else 'Other'
 
 
-def upsert_rl_json(entry: Dict) -> None:
+def upsert_rl_json(entry: Dict) -> int:
+    """Add or replace the entry in rl.json; returns its 1-based position."""
     DATA_FILE.parent.mkdir(exist_ok=True)
+    entry = dehydrate_entry(entry)
     if DATA_FILE.exists():
         with open(DATA_FILE, 'r', encoding='utf-8') as f:
             data = json.load(f)
     else:
         data = {"rl_implementations": []}
     impls = data.get('rl_implementations', [])
-    replaced = False
+    position = None
     for i, impl in enumerate(impls):
         if impl.get('github_url') == entry['github_url']:
             impls[i] = entry
-            replaced = True
+            position = i + 1
             break
-    if not replaced:
+    if position is None:
         impls.append(entry)
+        position = len(impls)
     data['rl_implementations'] = impls
     with open(DATA_FILE, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
+    return position
 
 
-def next_markdown_index() -> int:
-    MODELS_DIR.mkdir(exist_ok=True)
-    max_idx = 0
-    for p in MODELS_DIR.glob('*.md'):
-        m = re.match(r"^(\d+)-", p.name)
-        if m:
-            max_idx = max(max_idx, int(m.group(1)))
-    return max_idx + 1
+def existing_page_stem(github_url: str) -> Optional[str]:
+    """Name (without .md) of the _rl page already describing this folder, if any."""
+    # Page headers come from the collection index instead of a directory scan
+    for page in load_index().entries('rl'):
+        if page['frontmatter'].get('github_url') == github_url:
+            return Path(page['path']).stem
+    return None
 
 
 def slugify(name: str) -> str:
@@ -238,9 +158,11 @@ def slugify(name: str) -> str:
     return s
 
 
-def write_markdown(entry: Dict) -> Path:
-    idx = next_markdown_index()
-    filename = f"{idx:02d}-{slugify(entry['display_name'])}.md"
+def write_markdown(entry: Dict, order: int) -> Path:
+    registry = SlugRegistry.load()
+    # Permanent name keyed by path, so refresh_rl.py keeps writing this page instead of replacing it
+    filename = registry.filename('rl', entry['path'], slugify(entry['display_name']), directory=MODELS_DIR,
+                                 legacy=existing_page_stem(entry['github_url']))
     filepath = MODELS_DIR / filename
     content = f"""---
 title: "{entry['display_name']}"
@@ -253,6 +175,7 @@ framework: "{entry['framework']}"
 environment: "{entry['environment']}"
 github_url: "{entry['github_url']}"
 date: {entry['github_date']}
+order: {order}
 ---
 
 ## Overview
@@ -272,8 +195,10 @@ date: {entry['github_date']}
 
 View the complete implementation, training scripts, and documentation on GitHub.
 """
+    MODELS_DIR.mkdir(exist_ok=True)
     with open(filepath, 'w', encoding='utf-8') as f:
         f.write(content)
+    registry.save()
     return filepath
 
 
@@ -288,13 +213,16 @@ def main():
 
     item_name = ref.path.split('/')[-1]
     display_name = clean_display_name(item_name)
-    categories = collect_categories_for_site(item_name, ref.path, readme)
+    # Site labels plus Value-/Policy-Based, and the environment (rules in _rules/classification.json)
+    labels = classify(['rl_site_categories', 'rl_value_or_policy', 'rl_environment'],
+                      name=item_name, path=ref.path, readme=readme)
+    categories = labels['rl_site_categories'] + [labels['rl_value_or_policy']]
     category = choose_primary_category(categories)
-    environment = detect_environment(item_name, readme)
+    environment = labels['rl_environment']
 
     created_date = datetime.now().strftime('%Y-%m-%d')
     github_url = f"https://github.com/{ref.owner}/{ref.repo}/tree/{ref.branch}/{ref.path}"
-    api_url = f"https://api.github.com/repos/{ref.owner}/{ref.repo}/contents/{ref.path}?ref={ref.branch}"
+    api_url = f"{API_URL}/repos/{ref.owner}/{ref.repo}/contents/{ref.path}?ref={ref.branch}"
 
     entry = {
         "name": item_name,
@@ -313,13 +241,14 @@ def main():
         "environment": environment,
     }
 
-    upsert_rl_json(entry)
-    md_path = write_markdown(entry)
+    order = upsert_rl_json(entry)
+    md_path = write_markdown(entry, order)
     print(f"✅ Added/updated RL entry and generated: {md_path.name}")
 
 
 if __name__ == '__main__':
     main()
+    print_cache_report()
 
 
 
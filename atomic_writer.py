@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Diff-aware, atomic file writes for the markdown generators.
+
+The generators used to unlink every file in their collection directory and
+write everything again, so each refresh touched every mtime and Jekyll
+rebuilt every page. Instead they now render into memory and hand the text to
+a DirectorySync:
+
+    sync = DirectorySync('_rl', '*.md')
+    for impl in implementations:
+        sync.write(filename, render(impl))
+    sync.remove_stale()
+    sync.report()
+
+- a file is only written when the SHA-256 of its current bytes differs from
+  the new content, so unchanged pages keep their mtime
+- writes go to a temp file in the same directory and are renamed over the
+  target, so a crash never leaves a half-written page
+- remove_stale() deletes exactly the files matching the directory's pattern
+  that were not written (or keep()-ed) in this run; pass `owned` to limit it
+  further to names the generator is known to have created
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """SHA-256 of a file's bytes, or None when it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def write_atomic(path, data):
+    """Write bytes to path through a temp file and a rename."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(path, content, encoding='utf-8'):
+    """Atomically write text to path unless it already holds exactly that text.
+
+    Returns 'created', 'updated' or 'unchanged'.
+    """
+    data = content.encode(encoding)
+    current = file_hash(path)
+    if current == content_hash(data):
+        return 'unchanged'
+    write_atomic(path, data)
+    return 'created' if current is None else 'updated'
+
+
+class DirectorySync:
+    """Writes one generated collection directory and removes what no longer belongs.
+
+    `pattern` selects the files this generator owns; anything else in the
+    directory (hand-written pages, other generators' files) is never touched.
+    """
+
+    def __init__(self, directory, pattern='*.md'):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.written = set()
+        self.counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'removed': 0}
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, filename, content):
+        """Write one file if its content changed; returns the write status."""
+        self.written.add(filename)
+        status = write_if_changed(self.directory / filename, content)
+        self.counts[status] += 1
+        return status
+
+    def keep(self, filename):
+        """Leave an existing file in place (e.g. when rendering it failed this run)."""
+        self.written.add(filename)
+
+    def remove_stale(self, owned=None):
+        """Delete owned files that were not written in this run; returns their names."""
+        removed = []
+        for path in sorted(self.directory.glob(self.pattern)):
+            if owned is not None and path.name not in owned:
+                continue
+            if path.is_file() and path.name not in self.written:
+                path.unlink()
+                removed.append(path.name)
+                print(f"🗑️  Removed stale file: {path.name}")
+        self.counts['removed'] += len(removed)
+        return removed
+
+    def report(self):
+        counts = self.counts
+        print(f"📝 {self.directory.name}: {counts['created']} created, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged, {counts['removed']} removed")
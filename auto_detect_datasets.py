@@ -6,21 +6,25 @@ creates markdown files for any new dataset implementations found.
 """
 
 import json
-import requests
 import os
 import sys
+import argparse
 from datetime import datetime
 import subprocess
 
+from github_cache import cached_get, print_cache_report
+from github_client import API_URL, github_headers
+from fetch_executor import run_ordered
+import tarball_ingest
+from readme_store import dehydrate_entries
+
 def get_github_folders(owner, repo, token=None):
     """Get all folders from the GitHub repository"""
-    headers = {}
-    if token:
-        headers['Authorization'] = f'token {token}'
+    headers = github_headers(token)
     
     try:
-        url = f"https://api.github.com/repos/{owner}/{repo}/contents"
-        response = requests.get(url, headers=headers)
+        url = f"{API_URL}/repos/{owner}/{repo}/contents"
+        response = cached_get(url, headers=headers)
         
         if response.status_code == 200:
             contents = response.json()
@@ -47,12 +51,15 @@ def get_existing_datasets():
         print(f"Error reading datasets.json: {e}")
         return []
 
-def detect_new_datasets(owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None):
+def detect_new_datasets(owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None, snapshot=None):
     """Detect new datasets in the repository"""
     print(f"Checking for new datasets in {owner}/{repo}...")
     
-    # Get all folders from repository
-    github_folders = get_github_folders(owner, repo, token)
+    # Get all folders from repository (or from an already downloaded tarball)
+    if snapshot is not None:
+        github_folders = [folder for folder in snapshot.top_level_folders() if not folder.startswith('.')]
+    else:
+        github_folders = get_github_folders(owner, repo, token)
     print(f"Found {len(github_folders)} folders in repository: {github_folders}")
     
     # Get existing datasets
@@ -69,39 +76,42 @@ def detect_new_datasets(owner="YuvrajSingh-mist", repo="Datasets-Collection", to
         print("✅ No new datasets found. All datasets are up to date.")
         return []
 
-def get_dataset_info(folder_name, owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None):
-    """Get dataset information from README and folder contents"""
-    headers = {}
-    if token:
-        headers['Authorization'] = f'token {token}'
-    
-    # Get README content
-    readme_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{folder_name}/README.md"
-    readme_content = f"Dataset implementation: {folder_name}"
+def describe_readme(folder_name, readme_content=None):
+    """Return (readme_content, description), with defaults when there is no README"""
     description = f"A comprehensive dataset for {folder_name.replace('-', ' ').replace('_', ' ').lower()}"
+    if readme_content is None:
+        return f"Dataset implementation: {folder_name}", description
+    
+    # Extract description from README (first paragraph after title)
+    lines = readme_content.split('\n')
+    for i, line in enumerate(lines):
+        if line.strip() and not line.startswith('#') and not line.startswith('|') and len(line.strip()) > 50:
+            description = line.strip()
+            break
+    return readme_content, description
+
+def fetch_readme(folder_name, owner, repo, headers):
+    """Return (readme_content, description) for a dataset folder"""
+    readme_url = f"{API_URL}/repos/{owner}/{repo}/contents/{folder_name}/README.md"
     
     try:
-        response = requests.get(readme_url, headers=headers)
+        response = cached_get(readme_url, headers=headers)
         if response.status_code == 200:
             import base64
             readme_data = response.json()
-            readme_content = base64.b64decode(readme_data['content']).decode('utf-8')
-            
-            # Extract description from README (first paragraph after title)
-            lines = readme_content.split('\n')
-            for i, line in enumerate(lines):
-                if line.strip() and not line.startswith('#') and not line.startswith('|') and len(line.strip()) > 50:
-                    description = line.strip()
-                    break
+            return describe_readme(folder_name, base64.b64decode(readme_data['content']).decode('utf-8'))
     except Exception as e:
         print(f"Could not fetch README for {folder_name}: {e}")
     
-    # Get commit date
-    commits_url = f"https://api.github.com/repos/{owner}/{repo}/commits?path={folder_name}&per_page=1"
+    return describe_readme(folder_name)
+
+def fetch_commit_date(folder_name, owner, repo, headers):
+    """Return the latest commit date (YYYY-MM-DD) touching a dataset folder"""
+    commits_url = f"{API_URL}/repos/{owner}/{repo}/commits?path={folder_name}&per_page=1"
     commit_date = datetime.now().strftime('%Y-%m-%d')
     
     try:
-        response = requests.get(commits_url, headers=headers)
+        response = cached_get(commits_url, headers=headers)
         if response.status_code == 200:
             commits = response.json()
             if commits:
@@ -109,40 +119,68 @@ def get_dataset_info(folder_name, owner="YuvrajSingh-mist", repo="Datasets-Colle
     except Exception as e:
         print(f"Could not fetch commit date for {folder_name}: {e}")
     
-    # Try to detect dataset format and size from folder contents
-    contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{folder_name}"
+    return commit_date
+
+def summarize_files(files):
+    """Detect (format, size, samples) of a dataset from its [(file name, size)] list"""
     dataset_format = "Unknown"
     size = "Unknown"
     samples = "Unknown"
+    names = [name for name, _ in files]
+    
+    # Detect format based on file extensions
+    if any(f.endswith('.csv') for f in names):
+        dataset_format = "CSV"
+    elif any(f.endswith('.json') for f in names):
+        dataset_format = "JSON"
+    elif any(f.endswith('.parquet') for f in names):
+        dataset_format = "Parquet"
+    elif any(f.endswith(('.txt', '.text')) for f in names):
+        dataset_format = "Text"
+    
+    # Try to get size info from file sizes
+    total_size = sum(file_size for _, file_size in files)
+    if total_size > 0:
+        if total_size > 1024*1024*1024:  # > 1GB
+            size = f"{total_size/(1024*1024*1024):.1f} GB"
+        elif total_size > 1024*1024:  # > 1MB
+            size = f"{total_size/(1024*1024):.1f} MB"
+        else:
+            size = f"{total_size/1024:.1f} KB"
+    
+    return dataset_format, size, samples
+
+def fetch_folder_stats(folder_name, owner, repo, headers):
+    """Detect (format, size, samples) of a dataset from its folder listing"""
+    contents_url = f"{API_URL}/repos/{owner}/{repo}/contents/{folder_name}"
     
     try:
-        response = requests.get(contents_url, headers=headers)
+        response = cached_get(contents_url, headers=headers)
         if response.status_code == 200:
             contents = response.json()
-            files = [item['name'] for item in contents if item['type'] == 'file']
-            
-            # Detect format based on file extensions
-            if any(f.endswith('.csv') for f in files):
-                dataset_format = "CSV"
-            elif any(f.endswith('.json') for f in files):
-                dataset_format = "JSON"
-            elif any(f.endswith('.parquet') for f in files):
-                dataset_format = "Parquet"
-            elif any(f.endswith(('.txt', '.text')) for f in files):
-                dataset_format = "Text"
-            
-            # Try to get size info from file sizes
-            total_size = sum(item.get('size', 0) for item in contents if item['type'] == 'file')
-            if total_size > 0:
-                if total_size > 1024*1024*1024:  # > 1GB
-                    size = f"{total_size/(1024*1024*1024):.1f} GB"
-                elif total_size > 1024*1024:  # > 1MB
-                    size = f"{total_size/(1024*1024):.1f} MB"
-                else:
-                    size = f"{total_size/1024:.1f} KB"
+            return summarize_files([(item['name'], item.get('size', 0)) for item in contents if item['type'] == 'file'])
     except Exception as e:
         print(f"Could not fetch contents for {folder_name}: {e}")
     
+    return summarize_files([])
+
+def get_datasets_info(folder_names, owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None, concurrency=None):
+    """Get dataset information for many folders, fanning out all requests at once
+    
+    Returns one info dict per folder, in the order of folder_names.
+    """
+    headers = github_headers(token)
+    fetchers = [fetch_readme, fetch_commit_date, fetch_folder_stats]
+    calls = [
+        lambda fetch=fetch, folder_name=folder_name: fetch(folder_name, owner, repo, headers)
+        for folder_name in folder_names
+        for fetch in fetchers
+    ]
+    results = run_ordered(calls, concurrency)
+    return [make_info(*results[3 * i:3 * i + 3]) for i in range(len(folder_names))]
+
+def make_info(readme, commit_date, stats):
+    (readme_content, description), (dataset_format, size, samples) = readme, stats
     return {
         "readme_content": readme_content,
         "description": description,
@@ -152,12 +190,35 @@ def get_dataset_info(folder_name, owner="YuvrajSingh-mist", repo="Datasets-Colle
         "samples": samples
     }
 
-def create_dataset_entry(folder_name, owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None):
+def get_datasets_info_from_snapshot(folder_names, snapshot, owner="YuvrajSingh-mist", repo="Datasets-Collection",
+                                    token=None, concurrency=None):
+    """Same info as get_datasets_info, with README and file listing taken from a tarball snapshot
+    
+    Only the commit dates still need one API request per folder.
+    """
+    headers = github_headers(token)
+    commit_dates = run_ordered(
+        [lambda folder_name=folder_name: fetch_commit_date(folder_name, owner, repo, headers) for folder_name in folder_names],
+        concurrency
+    )
+    return [
+        make_info(describe_readme(folder_name, snapshot.readmes.get(folder_name)),
+                  commit_date,
+                  summarize_files(snapshot.files.get(folder_name, [])))
+        for folder_name, commit_date in zip(folder_names, commit_dates)
+    ]
+
+def get_dataset_info(folder_name, owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None):
+    """Get dataset information from README and folder contents"""
+    return get_datasets_info([folder_name], owner, repo, token)[0]
+
+def create_dataset_entry(folder_name, owner="YuvrajSingh-mist", repo="Datasets-Collection", token=None, info=None):
     """Create a new dataset entry for the datasets.json file"""
     print(f"📝 Creating entry for {folder_name}...")
     
-    # Get dataset information
-    info = get_dataset_info(folder_name, owner, repo, token)
+    # Get dataset information (unless it was already fetched)
+    if info is None:
+        info = get_dataset_info(folder_name, owner, repo, token)
     
     # Infer tags and tasks from folder name and description
     name_lower = folder_name.lower()
@@ -208,7 +269,7 @@ def create_dataset_entry(folder_name, owner="YuvrajSingh-mist", repo="Datasets-C
     
     return dataset_entry
 
-def add_new_datasets_to_json(new_datasets, token=None):
+def add_new_datasets_to_json(new_datasets, token=None, snapshot=None):
     """Add new datasets to the datasets.json file"""
     datasets_file = "_data/datasets.json"
     
@@ -224,11 +285,22 @@ def add_new_datasets_to_json(new_datasets, token=None):
             "datasets": []
         }
     
+    # Fetch README, commit date and folder listing for every new dataset at once
+    if snapshot is not None:
+        print(f"⚡ Fetching commit dates for {len(new_datasets)} new datasets (README and files from tarball)...")
+        infos = get_datasets_info_from_snapshot(new_datasets, snapshot, token=token)
+    else:
+        print(f"⚡ Fetching {3 * len(new_datasets)} resources for {len(new_datasets)} new datasets...")
+        infos = get_datasets_info(new_datasets, token=token)
+    
     # Add new datasets
-    for folder_name in new_datasets:
-        dataset_entry = create_dataset_entry(folder_name, token=token)
+    for folder_name, info in zip(new_datasets, infos):
+        dataset_entry = create_dataset_entry(folder_name, token=token, info=info)
         datasets_data["datasets"].append(dataset_entry)
     
+    # READMEs go to the blob store; datasets.json keeps only their hashes
+    datasets_data["datasets"] = dehydrate_entries(datasets_data["datasets"])
+    
     # Update metadata
     datasets_data["total_datasets"] = len(datasets_data["datasets"])
     datasets_data["last_updated"] = datetime.now().isoformat()
@@ -240,16 +312,27 @@ def add_new_datasets_to_json(new_datasets, token=None):
     print(f"✅ Added {len(new_datasets)} new datasets to {datasets_file}")
 
 def main():
+    parser = argparse.ArgumentParser(description='Auto-detect new datasets from the Datasets-Collection repository')
+    parser.add_argument('--ingest', choices=['api', 'tarball'], default='api',
+                       help='api: contents API per folder (default); tarball: one repository tarball download')
+    args = parser.parse_args()
+    
     token = os.environ.get('GITHUB_TOKEN')
     if not token:
         print("Warning: No GITHUB_TOKEN found. API requests may be rate limited.")
     
+    snapshot = None
+    if args.ingest == 'tarball':
+        snapshot = tarball_ingest.fetch_snapshot("Datasets-Collection", token=token)
+        if snapshot is None:
+            return False
+    
     # Detect new datasets
-    new_datasets = detect_new_datasets(token=token)
+    new_datasets = detect_new_datasets(token=token, snapshot=snapshot)
     
     if new_datasets:
         # Add to datasets.json
-        add_new_datasets_to_json(new_datasets, token=token)
+        add_new_datasets_to_json(new_datasets, token=token, snapshot=snapshot)
         
         # Generate markdown files
         print("🔄 Generating dataset markdown files...")
@@ -269,4 +352,5 @@ def main():
 
 if __name__ == "__main__":
     success = main()
+    print_cache_report()
     sys.exit(0 if success else 1)
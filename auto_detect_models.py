@@ -6,23 +6,28 @@ creates markdown files for any new model implementations found.
 """
 
 import json
-import requests
 import os
 import sys
 import argparse
 from datetime import datetime
-import subprocess
 
+from github_cache import cached_get, print_cache_report
+from github_client import API_URL, github_headers
+from fetch_executor import run_ordered
+from readme_store import dehydrate_entries
+from markdown_pipeline import run_pipeline
+from profiler import add_profile_argument, profiled, span, start_profile
+import regenerate_models
+
+@profiled
 def get_github_folders(owner, repo, token=None):
     """Get all folders from the GitHub repository"""
-    headers = {}
-    if token:
-        headers['Authorization'] = f'token {token}'
+    headers = github_headers(token)
     
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents"
+    url = f"{API_URL}/repos/{owner}/{repo}/contents"
     
     try:
-        response = requests.get(url, headers=headers)
+        response = cached_get(url, headers=headers)
         response.raise_for_status()
         
         folders = []
@@ -69,6 +74,7 @@ def get_existing_models():
     
     return folder_names
 
+@profiled
 def detect_new_models(owner="YuvrajSingh-mist", repo="Paper-Replications", token=None):
     """Detect new models that don't have markdown files yet"""
     print(f"Checking for new models in {owner}/{repo}...")
@@ -91,18 +97,15 @@ def detect_new_models(owner="YuvrajSingh-mist", repo="Paper-Replications", token
         print("✅ No new models found. All models are up to date.")
         return []
 
-def create_model_entry(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replications", token=None):
-    """Create a new model entry for the models.json file"""
-    headers = {}
-    if token:
-        headers['Authorization'] = f'token {token}'
-    
-    # Get README content
-    readme_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{folder_name}/README.md"
+@profiled
+def fetch_readme(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replications", token=None):
+    """Fetch a folder's README.md through the contents API"""
+    headers = github_headers(token)
+    readme_url = f"{API_URL}/repos/{owner}/{repo}/contents/{folder_name}/README.md"
     readme_content = "Implementation from scratch"
     
     try:
-        response = requests.get(readme_url, headers=headers)
+        response = cached_get(readme_url, headers=headers)
         if response.status_code == 200:
             import base64
             readme_data = response.json()
@@ -110,12 +113,17 @@ def create_model_entry(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replic
     except Exception as e:
         print(f"Could not fetch README for {folder_name}: {e}")
     
-    # Get commit date
-    commits_url = f"https://api.github.com/repos/{owner}/{repo}/commits?path={folder_name}&per_page=1"
+    return readme_content
+
+@profiled
+def fetch_commit_date(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replications", token=None):
+    """Fetch the latest commit date (YYYY-MM-DD) touching a folder"""
+    headers = github_headers(token)
+    commits_url = f"{API_URL}/repos/{owner}/{repo}/commits?path={folder_name}&per_page=1"
     commit_date = datetime.now().strftime('%Y-%m-%d')
     
     try:
-        response = requests.get(commits_url, headers=headers)
+        response = cached_get(commits_url, headers=headers)
         if response.status_code == 200:
             commits = response.json()
             if commits:
@@ -123,6 +131,19 @@ def create_model_entry(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replic
     except Exception as e:
         print(f"Could not fetch commit date for {folder_name}: {e}")
     
+    return commit_date
+
+def create_model_entry(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replications", token=None,
+                       readme_content=None, commit_date=None):
+    """Create a new model entry for the models.json file
+    
+    readme_content / commit_date can be passed in when they were already fetched.
+    """
+    if readme_content is None:
+        readme_content = fetch_readme(folder_name, owner, repo, token)
+    if commit_date is None:
+        commit_date = fetch_commit_date(folder_name, owner, repo, token)
+    
     # Create model entry
     model_entry = {
         "name": folder_name.replace('-', ' ').replace('_', ' ').title(),
@@ -135,7 +156,8 @@ def create_model_entry(folder_name, owner="YuvrajSingh-mist", repo="Paper-Replic
     
     return model_entry
 
-def add_new_models_to_json(new_models, token=None):
+@profiled
+def add_new_models_to_json(new_models, token=None, concurrency=None):
     """Add new models to the models.json file"""
     models_file = "_data/models.json"
     
@@ -155,12 +177,25 @@ def add_new_models_to_json(new_models, token=None):
     else:
         models_data = []
     
-    # Add new models
+    # Fetch README and commit date for every new model at once; results keep input order
+    print(f"⚡ Fetching {2 * len(new_models)} resources for {len(new_models)} new models...")
+    calls = []
     for folder_name in new_models:
+        calls.append(lambda folder_name=folder_name: fetch_readme(folder_name, token=token))
+        calls.append(lambda folder_name=folder_name: fetch_commit_date(folder_name, token=token))
+    with span('fetch', calls=len(calls)):
+        results = run_ordered(calls, concurrency)
+    
+    # Add new models
+    for i, folder_name in enumerate(new_models):
         print(f"📝 Creating entry for {folder_name}...")
-        model_entry = create_model_entry(folder_name, token=token)
+        model_entry = create_model_entry(folder_name, token=token,
+                                         readme_content=results[2 * i], commit_date=results[2 * i + 1])
         models_data.append(model_entry)
     
+    # READMEs go to the blob store; models.json keeps only their hashes
+    models_data = dehydrate_entries(models_data)
+    
     # Save updated models.json - maintain the original structure
     if os.path.exists(models_file):
         with open(models_file, 'r') as f:
@@ -187,7 +222,11 @@ def main():
     parser = argparse.ArgumentParser(description='Auto-detect new models from Paper-Replications repository')
     parser.add_argument('--source', default='paper-replications', 
                        help='Source repository type (default: paper-replications)')
+    parser.add_argument('--concurrency', type=int, default=None,
+                       help='Maximum concurrent GitHub requests (default: GITHUB_FETCH_CONCURRENCY or 8)')
+    add_profile_argument(parser)
     args = parser.parse_args()
+    start_profile(args.profile, 'auto_detect_models')
     
     token = os.environ.get('GITHUB_TOKEN')
     if not token:
@@ -200,24 +239,28 @@ def main():
     
     if new_models:
         # Add to models.json
-        add_new_models_to_json(new_models, token=token)
+        add_new_models_to_json(new_models, token=token, concurrency=args.concurrency)
         
         # Regenerate all markdown files with latest guidelines
         print("🔄 Regenerating all model markdown files with latest guidelines...")
         print("  ✅ Using model-implementation layout")
         print("  ✅ Converting images to GitHub hyperlinks")
         print("  ✅ Using exact GitHub API data")
+        # In-process: no interpreter start-up per step, and the image pass
+        # reads and writes each page at most once
         try:
-            subprocess.run(['python', 'regenerate_models.py'], check=True)
+            with span('regenerate_models'):
+                regenerate_models.main()
             print("  ✅ Model files regenerated successfully!")
             
             # Ensure images are converted to links
             print("🖼️ Converting any images to GitHub hyperlinks...")
-            subprocess.run(['python', 'fix_images_direct.py'], check=True)
+            with span('fix_images_direct'):
+                run_pipeline(['_models'], ['fix_images_direct'])
             print("  ✅ Image conversion completed!")
             
             print("✅ Successfully regenerated all model files!")
-        except subprocess.CalledProcessError as e:
+        except Exception as e:
             print(f"❌ Error regenerating model files: {e}")
             return False
         
@@ -230,4 +273,5 @@ def main():
 
 if __name__ == "__main__":
     success = main()
+    print_cache_report()
     sys.exit(0 if success else 1)
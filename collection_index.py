@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Persisted index of the collection pages (_models, _rl, _datasets, _smolhub,
+_projects).
+
+Date, star and validation updates used to rescan their directories and
+reread every page on each run, and fetch_github_dates matched every page
+title against every model name in a nested loop. The index keeps, per page:
+
+    {"path": "_models/14-gpt.md", "collection": "models", "size": 8123,
+     "mtime": 1718000000000000000, "sha256": "...",
+     "frontmatter": {"title": "GPT", ...}, "key": "gpt"}
+
+in .cache/collection_index.json. refresh() stats every page and rereads only
+those whose size or mtime changed, so a run over unchanged pages reads no
+page at all. Lookups go through a {collection: {key: path}} map; the key is
+the title (or file stem) lowercased with spaces, hyphens and underscores
+removed, close to the normalisation the date matching always used.
+
+Usage:
+    index = load_index()                       # load, refresh, save
+    entry = index.lookup('models', 'Llama 4')  # by normalized title
+    match_names({normalize_key(n): n for n in names}, title)   # exact, else longest contained name
+    for entry in index.entries('rl'):
+        entry['frontmatter'].get('github_url')
+    index.touch(path)                          # re-index a page after patching it
+
+    python collection_index.py                 # refresh and show counts
+    python collection_index.py --find models "Llama 4"
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import yaml
+
+from atomic_writer import write_if_changed
+from frontmatter import split as split_frontmatter
+
+BASE_PATH = Path(__file__).parent
+INDEX_FILE = BASE_PATH / ".cache" / "collection_index.json"
+COLLECTIONS = ["_models", "_rl", "_datasets", "_smolhub", "_projects"]
+INDEX_VERSION = 1
+
+
+def normalize_key(text):
+    """Lookup key of a title: lowercase without spaces, hyphens or underscores."""
+    return ''.join(ch for ch in str(text).lower() if ch not in ' -_')
+
+
+def _jsonable(value):
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+class CollectionIndex:
+    """{page path: entry} for every collection page, plus key lookups."""
+
+    def __init__(self, root=BASE_PATH, index_file=INDEX_FILE, collections=COLLECTIONS):
+        self.root = Path(root)
+        self.index_file = Path(index_file)
+        self.collections = list(collections)
+        self.pages = {}
+        self.keys = {}
+        self.reread = 0
+        self.dirty = True
+
+    @classmethod
+    def load(cls, root=BASE_PATH, index_file=INDEX_FILE, collections=COLLECTIONS):
+        index = cls(root, index_file, collections)
+        try:
+            with open(index.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version') == INDEX_VERSION and data.get('collections') == index.collections:
+            index.pages = data.get('pages', {})
+            index.dirty = False
+        index._build_keys()
+        return index
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+        write_if_changed(self.index_file, json.dumps({
+            'version': INDEX_VERSION,
+            'collections': self.collections,
+            'pages': self.pages,
+        }, sort_keys=True, ensure_ascii=False))
+
+    def _read(self, path, relative, stat):
+        data = path.read_bytes()
+        header, _ = split_frontmatter(data.decode('utf-8', errors='replace'))
+        frontmatter = {}
+        if header is not None:
+            try:
+                frontmatter = header.data
+            except yaml.YAMLError:
+                frontmatter = None
+            if not isinstance(frontmatter, dict):
+                # Unparseable header: keep the plain scalars
+                frontmatter = {key: header.value(key) for key in header.keys()}
+        frontmatter = _jsonable(frontmatter)
+        self.reread += 1
+        self.dirty = True
+        return {
+            'path': relative,
+            'collection': path.parent.name.lstrip('_'),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'frontmatter': frontmatter,
+            'key': normalize_key(frontmatter.get('title') or path.stem),
+        }
+
+    def refresh(self):
+        """Re-stat every page; reread only new pages and pages whose size or mtime changed."""
+        pages = {}
+        for collection in self.collections:
+            directory = self.root / collection
+            if not directory.is_dir():
+                continue
+            # os.scandir rather than Path.glob: pathlib objects dominate a warm refresh
+            with os.scandir(directory) as scan:
+                names = sorted(item.name for item in scan if item.name.endswith('.md') and item.is_file())
+            for name in names:
+                relative = f"{collection}/{name}"
+                stat = os.stat(os.path.join(directory, name))
+                entry = self.pages.get(relative)
+                if entry is None or entry['size'] != stat.st_size or entry['mtime'] != stat.st_mtime_ns:
+                    entry = self._read(directory / name, relative, stat)
+                pages[relative] = entry
+        if pages.keys() != self.pages.keys():
+            self.dirty = True
+        self.pages = pages
+        self._build_keys()
+        return self
+
+    def touch(self, path):
+        """Re-index one page (e.g. after patching it)."""
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        relative = path.relative_to(self.root).as_posix()
+        if path.exists():
+            self.pages[relative] = self._read(path, relative, path.stat())
+        elif self.pages.pop(relative, None):
+            self.dirty = True
+        self._build_keys()
+
+    def _build_keys(self):
+        self.keys = {}
+        for relative, entry in sorted(self.pages.items()):
+            self.keys.setdefault(entry['collection'], {}).setdefault(entry['key'], relative)
+
+    def entries(self, collection=None):
+        """Entries of one collection ('models', 'rl', ...) or of all, in path order."""
+        return [entry for relative, entry in sorted(self.pages.items())
+                if collection is None or entry['collection'] == collection.lstrip('_')]
+
+    def get(self, path):
+        path = Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.root)
+        return self.pages.get(path.as_posix())
+
+    def lookup(self, collection, key):
+        """Entry whose normalized key equals key, or None."""
+        relative = self.keys.get(collection.lstrip('_'), {}).get(normalize_key(key))
+        return self.pages[relative] if relative else None
+
+    def path(self, entry):
+        return self.root / entry['path']
+
+
+def match_names(names, text):
+    """The name in a {normalized key: name} map matching text: exact key, else the longest contained key.
+
+    The exact lookup is a dict hit; only texts with no exact match scan the names.
+    """
+    key = normalize_key(text)
+    if key in names:
+        return names[key]
+    contained = [name_key for name_key in names if name_key and name_key in key]
+    return names[max(contained, key=len)] if contained else None
+
+
+def load_index(root=BASE_PATH, index_file=INDEX_FILE, collections=COLLECTIONS):
+    """Load the persisted index, refresh it against the pages on disk and save it."""
+    index = CollectionIndex.load(root, index_file, collections).refresh()
+    index.save()
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Refresh and query the collection page index')
+    parser.add_argument('--rebuild', action='store_true', help='Reread every page instead of only changed ones')
+    parser.add_argument('--find', nargs=2, metavar=('COLLECTION', 'TEXT'), help='Look up a page by title')
+    args = parser.parse_args()
+
+    if args.rebuild:
+        index = CollectionIndex().refresh()
+        index.save()
+    else:
+        index = load_index()
+
+    if args.find:
+        collection, text = args.find
+        entries = index.entries(collection)
+        names = {entry['key']: entry['path'] for entry in entries}
+        relative = match_names(names, text)
+        if not relative:
+            print(f"❌ No {collection} page matches {text!r}")
+            return False
+        print(json.dumps(index.pages[relative], indent=2, ensure_ascii=False))
+        return True
+
+    for collection in index.collections:
+        print(f"📁 {collection}: {len(index.entries(collection))} pages")
+    print(f"🔄 Reread {index.reread} of {len(index.pages)} pages ({index.index_file})")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Append-only checkpoints for resumable GitHub crawls.
+
+A crawl that stopped halfway (rate limit, network error, Ctrl-C, CI
+timeout) used to throw away every fetch it had made, and the next run
+started over. With a checkpoint each finished step is appended to
+.cache/crawls/<name>.jsonl as soon as it completes, so a rerun replays the
+finished steps and carries on where the last run stopped:
+
+    checkpoint = CrawlCheckpoint('rl-contents', key={'repository': ..., 'ref': ...})
+    for record in checkpoint.records:       # steps finished by earlier runs
+        ...
+    checkpoint.append({'path': ..., 'entry': ...})
+    ...                                      # crawl complete: write the catalog, then
+    checkpoint.clear()
+
+- the first line holds the key; a checkpoint written for another key
+  (repository, ref, depth, ...) is discarded instead of resumed
+- a torn last line (the process died mid-write) is dropped on load
+- README bodies go to a content-addressed store next to the file
+  (readme_store with store_dir=checkpoint.blobs), so records stay small and
+  appending costs the same at step 10 and step 100000
+- the catalog is only written once the crawl is complete, so a half-crawled
+  run never replaces a good one; the checkpoint is cleared after that
+
+.cache/ is not committed. Pass resume=False (refresh_rl.py --restart) or
+delete the file to start over.
+"""
+
+import json
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+
+from atomic_writer import write_atomic
+
+CHECKPOINT_DIR = Path(__file__).parent / ".cache" / "crawls"
+
+
+class CrawlCheckpoint:
+    """Finished steps of one crawl, kept on disk until the crawl is committed."""
+
+    def __init__(self, name, key, directory=None, resume=True):
+        self.directory = Path(directory or CHECKPOINT_DIR)
+        self.path = self.directory / f"{name}.jsonl"
+        self.blobs = self.directory / name
+        # Compare keys the way they come back from disk
+        self.key = json.loads(json.dumps(key))
+        self.created = None
+        self.appended = 0
+        self._file = None
+        self.records = self._load() if resume else []
+        if not resume:
+            self._remove()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.read().split('\n')
+        except FileNotFoundError:
+            return []
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get('key') != self.key:
+            print(f"🗑️  Discarding checkpoint {self.path.name}: it belongs to another crawl")
+            self._remove()
+            return []
+        records = []
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # Torn last write: everything before it is intact
+                break
+        self.created = header.get('created')
+        return records
+
+    def __len__(self):
+        return len(self.records) + self.appended
+
+    def _open(self):
+        if self._file is not None:
+            return
+        self.created = self.created or datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        # Rewrite what was resumed first, so a torn line from the last run is not followed by new records
+        lines = [json.dumps({'key': self.key, 'created': self.created})]
+        lines += [json.dumps(record, ensure_ascii=False) for record in self.records]
+        write_atomic(self.path, ('\n'.join(lines) + '\n').encode('utf-8'))
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def append(self, record):
+        """Record one finished step (flushed right away, so it survives the process dying)."""
+        self._open()
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.appended += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def reset(self):
+        """Forget every record (e.g. when they no longer replay against the crawl)."""
+        self.close()
+        self._remove()
+        self.records = []
+        self.appended = 0
+        self.created = None
+
+    def clear(self):
+        """The crawl was committed: delete the checkpoint and its README blobs."""
+        self.reset()
+
+    def _remove(self):
+        self.path.unlink(missing_ok=True)
+        shutil.rmtree(self.blobs, ignore_errors=True)
@@ -1,40 +1,18 @@
 #!/usr/bin/env python3
+"""
+Show which classification rules fire for a sample README (see classifier.py)
+"""
+
+from classifier import get_classifier
 
 def categorize_model(name, description, readme_content):
-    """Categorize the model based on its content"""
-    content = (name + " " + description + " " + readme_content).lower()
-    
+    """Categorize the model and print the rule behind every label"""
     print(f"Checking content for: {name}")
-    print(f"Content contains 'whisper': {'whisper' in content}")
-    print(f"Content contains 'audio': {'audio' in content}")
-    print(f"Content contains 'speech': {'speech' in content}")
-    print(f"Content contains 'attention': {'attention' in content}")
-    
-    # Check more specific categories first
-    if any(term in content for term in ['audio', 'speech', 'clap', 'whisper']):
-        print("✅ Matched Audio/Speech")
-        return "Audio/Speech"
-    elif any(term in content for term in ['computer vision', 'clip', 'siglip', 'vit', 'vision transformer', 'resnet', 'efficientnet', 'yolo', 'object detection', 'image classification', 'semantic segmentation']):
-        print("✅ Matched Computer Vision")
-        return "Computer Vision"
-    elif any(term in content for term in ['gan', 'dcgan', 'cyclegan', 'cgan', 'generative']):
-        print("✅ Matched Generative Models")
-        return "Generative Models"
-    elif any(term in content for term in ['fine', 'tuning', 'peft', 'dpo']):
-        print("✅ Matched Fine-tuning")
-        return "Fine-tuning"
-    elif any(term in content for term in ['training', 'ddp', 'distributed', 'optimization']):
-        print("✅ Matched Training Methods")
-        return "Training Methods"
-    elif any(term in content for term in ['gpt', 'llama', 'bert', 'transformer', 'language model', 'text', 'nlp']):
-        print("✅ Matched Language Models")
-        return "Language Models"
-    elif any(term in content for term in ['attention', 'differential']):
-        print("✅ Matched Attention Mechanisms")
-        return "Attention Mechanisms"
-    else:
-        print("✅ Matched Other")
-        return "Other"
+    result, reasons = get_classifier().classify(
+        'models', explain=True, name=name, description=description, readme=readme_content)
+    for reason in reasons:
+        print(f"✅ {reason}")
+    return result['model_category']
 
 # Test with Whisper data
 name = "Whisper"
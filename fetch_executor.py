@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Bounded-concurrency fetch executor shared by the GitHub fetchers.
+
+Every README / commit-date / folder-listing request for a batch of items is
+submitted at once to a thread pool of at most GITHUB_FETCH_CONCURRENCY
+workers (default 8). Results always come back in submission order, so the
+generated JSON is identical to a sequential run.
+
+The HTTP cache, the rate-limit scheduler and the pooled session are all
+thread-safe, so the fetch functions need no changes to run here. Each call
+runs in a copy of the submitter's contextvars, so profiler spans opened in a
+worker nest under the stage that submitted it.
+
+Usage:
+    from fetch_executor import run_ordered, map_ordered
+
+    readmes = map_ordered(fetch_readme, folders)
+    readme, date = run_ordered([lambda: fetch_readme(f), lambda: fetch_date(f)])
+"""
+
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+DEFAULT_CONCURRENCY = int(os.environ.get('GITHUB_FETCH_CONCURRENCY', 8))
+
+
+def run_ordered(calls, max_workers=None):
+    """Run zero-argument callables concurrently and return their results in order.
+
+    An exception raised by a call is re-raised here once the pool has drained.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    workers = max(1, min(max_workers or DEFAULT_CONCURRENCY, len(calls)))
+    if workers == 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as pool:
+        futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def map_ordered(func, items, max_workers=None):
+    """Concurrent map(func, items) with results in input order."""
+    return run_ordered([partial(func, item) for item in items], max_workers)
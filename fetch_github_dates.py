@@ -1,42 +1,56 @@
 #!/usr/bin/env python3
 """
-Fetch GitHub creation/commit dates for models and datasets
-This script fetches the actual creation dates from GitHub API and updates
-the JSON files with accurate date information.
+Fetch GitHub creation/commit dates for models, datasets and RL implementations
+This script fetches the actual creation dates and updates the JSON files with
+accurate date information.
+
+By default dates come from one `git log` pass over a local blobless clone of
+each source repo (see git_dates.py): first commit -> created_date/github_date,
+latest commit -> last_commit_date. `--engine api` uses one GitHub API request
+per folder instead.
 """
 
 import json
 import os
 import argparse
-import requests
+from pathlib import Path
 from datetime import datetime
-import time
 
+from github_cache import cached_get, print_cache_report
+from frontmatter import patch
+from collection_index import load_index, match_names, normalize_key
+from github_client import API_URL, github_headers
+from github_ratelimit import SCHEDULER
+import git_dates
+from profiler import add_profile_argument, profiled, start_profile
+
+@profiled
 def get_github_commit_date(repo_owner, repo_name, folder_path, github_token=None):
     """Get the first commit date for a specific folder from GitHub API"""
-    headers = {
-        'Accept': 'application/vnd.github.v3+json',
-        'User-Agent': 'SmolHub-Website'
-    }
-    
-    if github_token:
-        headers['Authorization'] = f'token {github_token}'
+    headers = github_headers(github_token)
     
     try:
         # Get commits for the specific folder
-        url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/commits"
+        url = f"{API_URL}/repos/{repo_owner}/{repo_name}/commits"
         params = {
             'path': folder_path,
             'per_page': 1
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = cached_get(url, headers=headers, params=params)
         
         if response.status_code == 200:
+            # Commits are listed newest first; with per_page=1 the "last" page holds the first commit
+            last_page = response.links.get('last', {}).get('url')
+            if last_page:
+                response = cached_get(last_page, headers=headers)
+                if response.status_code != 200:
+                    print(f"Warning: Could not get commit date for {folder_path} (status: {response.status_code})")
+                    return None
             commits = response.json()
             if commits:
                 # Get the first commit date
-                first_commit = commits[0]
+                first_commit = commits[-1]
                 commit_date = first_commit['commit']['author']['date']
                 # Convert to just date (YYYY-MM-DD format)
                 date_obj = datetime.fromisoformat(commit_date.replace('Z', '+00:00'))
@@ -53,7 +67,43 @@ def get_github_commit_date(repo_owner, repo_name, folder_path, github_token=None
         print(f"Error getting commit date for {folder_path}: {e}")
         return None
 
-def update_models_with_github_dates(github_token=None):
+def folder_dates_lookup(repo_name, engine, github_token=None):
+    """Return lookup(folder) -> {'first': date, 'last': date} or None.
+
+    The git engine computes every folder's dates up front from one history pass;
+    if the clone fails it falls back to per-folder API requests.
+    """
+    if engine == 'git':
+        folder_dates = git_dates.load_folder_dates(repo_name)
+        if folder_dates is not None:
+            return lambda folder: git_dates.lookup_folder(folder_dates, folder)
+        print("↩️  Falling back to the GitHub API for commit dates")
+
+    budget = SCHEDULER.budget(API_URL)
+    if budget['remaining'] is not None:
+        print(f"🚦 GitHub API budget: {budget['remaining']}/{budget['limit']} requests left")
+
+    def api_lookup(folder):
+        # Pacing is handled by the shared rate-limit scheduler inside cached_get
+        if SCHEDULER.exhausted(API_URL):
+            return None
+        commit_date = get_github_commit_date('YuvrajSingh-mist', repo_name, folder, github_token)
+        return {'first': commit_date, 'last': None} if commit_date else None
+
+    return api_lookup
+
+def apply_folder_dates(item, dates):
+    """Write first/last commit dates onto a JSON entry; returns True when found."""
+    if not dates or not dates.get('first'):
+        return False
+    item['created_date'] = dates['first']
+    item['github_date'] = dates['first']
+    if dates.get('last'):
+        item['last_commit_date'] = dates['last']
+    return True
+
+@profiled
+def update_models_with_github_dates(github_token=None, engine='git'):
     """Update models.json with GitHub commit dates"""
     json_path = '_data/models.json'
     
@@ -66,6 +116,7 @@ def update_models_with_github_dates(github_token=None):
         data = json.load(f)
     
     print("🔄 Fetching GitHub commit dates for models...")
+    lookup = folder_dates_lookup('Paper-Replications', engine, github_token)
     updated_count = 0
     
     for i, model in enumerate(data.get('models', []), 1):
@@ -73,17 +124,8 @@ def update_models_with_github_dates(github_token=None):
         print(f"Processing {i}/{len(data['models'])}: {model_name}")
         
         # Get actual commit date from GitHub
-        commit_date = get_github_commit_date(
-            'YuvrajSingh-mist', 
-            'Paper-Replications', 
-            model_name, 
-            github_token
-        )
-        
-        if commit_date:
-            model['created_date'] = commit_date
-            model['github_date'] = commit_date
-            print(f"  ✅ Found date: {commit_date}")
+        if apply_folder_dates(model, lookup(model_name)):
+            print(f"  ✅ Found date: {model['created_date']}")
             updated_count += 1
         else:
             # Keep existing date or use fallback
@@ -91,9 +133,6 @@ def update_models_with_github_dates(github_token=None):
                 model['created_date'] = '2024-01-01'
                 model['github_date'] = '2024-01-01'
             print(f"  ⚠️  Using fallback date: {model.get('created_date', '2024-01-01')}")
-        
-        # Small delay to avoid rate limiting
-        time.sleep(0.3)
     
     # Add last_updated timestamp
     data['last_updated'] = datetime.now().isoformat()
@@ -105,7 +144,8 @@ def update_models_with_github_dates(github_token=None):
     print(f"\n✅ Updated models.json with GitHub commit dates! ({updated_count} models updated)")
     return True
 
-def update_datasets_with_github_dates(github_token=None):
+@profiled
+def update_datasets_with_github_dates(github_token=None, engine='git'):
     """Update datasets.json with GitHub commit dates"""
     json_path = '_data/datasets.json'
     
@@ -118,6 +158,7 @@ def update_datasets_with_github_dates(github_token=None):
         data = json.load(f)
     
     print("🔄 Fetching GitHub commit dates for datasets...")
+    lookup = folder_dates_lookup('Datasets-Collection', engine, github_token)
     updated_count = 0
     
     for i, dataset in enumerate(data.get('datasets', []), 1):
@@ -125,17 +166,8 @@ def update_datasets_with_github_dates(github_token=None):
         print(f"Processing {i}/{len(data['datasets'])}: {dataset_name}")
         
         # Get actual commit date from GitHub
-        commit_date = get_github_commit_date(
-            'YuvrajSingh-mist', 
-            'Datasets-Collection', 
-            dataset_name, 
-            github_token
-        )
-        
-        if commit_date:
-            dataset['created_date'] = commit_date
-            dataset['github_date'] = commit_date
-            print(f"  ✅ Found date: {commit_date}")
+        if apply_folder_dates(dataset, lookup(dataset_name)):
+            print(f"  ✅ Found date: {dataset['created_date']}")
             updated_count += 1
         else:
             # Keep existing date or use fallback
@@ -143,9 +175,6 @@ def update_datasets_with_github_dates(github_token=None):
                 dataset['created_date'] = '2024-01-01'
                 dataset['github_date'] = '2024-01-01'
             print(f"  ⚠️  Using fallback date: {dataset.get('created_date', '2024-01-01')}")
-        
-        # Small delay to avoid rate limiting
-        time.sleep(0.3)
     
     # Add last_updated timestamp
     data['last_updated'] = datetime.now().isoformat()
@@ -157,6 +186,40 @@ def update_datasets_with_github_dates(github_token=None):
     print(f"\n✅ Updated datasets.json with GitHub commit dates! ({updated_count} datasets updated)")
     return True
 
+@profiled
+def update_rl_with_github_dates(github_token=None, engine='git'):
+    """Update rl.json with GitHub commit dates (nested implementation paths included)"""
+    json_path = '_data/rl.json'
+    
+    if not os.path.exists(json_path):
+        print(f"File {json_path} not found!")
+        return False
+    
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    implementations = data.get('rl_implementations', [])
+    print("🔄 Fetching GitHub commit dates for RL implementations...")
+    lookup = folder_dates_lookup('Reinforcement-Learning', engine, github_token)
+    updated_count = 0
+    
+    for i, impl in enumerate(implementations, 1):
+        path = impl.get('path', impl.get('name', ''))
+        print(f"Processing {i}/{len(implementations)}: {path}")
+        
+        if apply_folder_dates(impl, lookup(path)):
+            print(f"  ✅ Found date: {impl['created_date']}")
+            updated_count += 1
+        else:
+            print(f"  ⚠️  Keeping existing date: {impl.get('created_date')}")
+    
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    print(f"\n✅ Updated rl.json with GitHub commit dates! ({updated_count} implementations updated)")
+    return True
+
+@profiled
 def update_model_markdown_files():
     """Update model markdown files to use github_date from JSON"""
     models_dir = '_models'
@@ -174,54 +237,35 @@ def update_model_markdown_files():
     with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     
-    # Create a mapping of model names to github dates
+    # Map normalized model names to github dates so each title is one lookup
     name_to_date = {}
     for model in data.get('models', []):
         name = model.get('name', '')
         github_date = model.get('github_date', model.get('created_date', '2024-01-01'))
-        name_to_date[name] = github_date
+        name_to_date.setdefault(normalize_key(name), github_date)
     
     print("🔄 Updating model markdown files with GitHub dates...")
     updated_count = 0
     
-    # Get all markdown files
-    for filename in os.listdir(models_dir):
-        if filename.endswith('.md'):
-            file_path = os.path.join(models_dir, filename)
+    # Titles come from the collection index, so unchanged pages are not reread;
+    # only the date line of each header is rewritten
+    index = load_index()
+    for entry in index.entries('models'):
+        filename = Path(entry['path']).name
+        title = entry['frontmatter'].get('title')
+        if title:
+            # Exact title match, else the longest model name contained in it
+            github_date = match_names(name_to_date, str(title))
             
-            # Read the file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract title from frontmatter
-            import re
-            title_match = re.search(r'title:\s*["\']([^"\']+)["\']', content)
-            if title_match:
-                title = title_match.group(1)
-                
-                # Find matching date in our mapping
-                github_date = None
-                for model_name, date in name_to_date.items():
-                    if model_name.lower().replace(' ', '').replace('-', '') in title.lower().replace(' ', '').replace('-', ''):
-                        github_date = date
-                        break
-                
-                if github_date:
-                    # Update the date in frontmatter
-                    content = re.sub(
-                        r'date:\s*\d{4}-\d{2}-\d{2}',
-                        f'date: {github_date}',
-                        content
-                    )
-                    
-                    # Write back to file
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    
+            if github_date:
+                # Update the date in frontmatter
+                if patch(index.path(entry), date=datetime.strptime(github_date[:10], '%Y-%m-%d').date()):
+                    index.touch(entry['path'])
                     print(f"  ✅ Updated {filename} -> {github_date}")
                     updated_count += 1
-                else:
-                    print(f"  ⚠️  No GitHub date found for {filename} (title: {title})")
+            else:
+                print(f"  ⚠️  No GitHub date found for {filename} (title: {title})")
+    index.save()
     
     print(f"\n✅ Updated {updated_count} markdown files with GitHub dates!")
     return True
@@ -232,9 +276,13 @@ def main():
     parser = argparse.ArgumentParser(description='Fetch GitHub creation dates for models and datasets')
     parser.add_argument('--source', default='paper-replications', 
                        help='Source repository type (default: paper-replications)')
-    parser.add_argument('--only', choices=['models', 'datasets', 'both'], default='both',
-                       help='Limit updates to only models, only datasets, or both (default)')
+    parser.add_argument('--only', choices=['models', 'datasets', 'rl', 'both', 'all'], default='both',
+                       help='Limit updates to models, datasets, rl, both models and datasets (default), or all')
+    parser.add_argument('--engine', choices=['git', 'api'], default='git',
+                       help='git: one history pass over a local blobless clone (default); api: one request per folder')
+    add_profile_argument(parser)
     args = parser.parse_args()
+    start_profile(args.profile, 'fetch_github_dates')
     
     # You can pass a GitHub token as environment variable for higher rate limits
     github_token = os.environ.get('GITHUB_TOKEN')
@@ -252,16 +300,22 @@ def main():
     
     models_success = False
     datasets_success = False
+    rl_success = False
 
     # Update models.json with GitHub dates (if requested)
-    if args.only in ('models', 'both'):
+    if args.only in ('models', 'both', 'all'):
         print("\n📁 UPDATING MODELS...")
-        models_success = update_models_with_github_dates(github_token)
+        models_success = update_models_with_github_dates(github_token, args.engine)
 
     # Update datasets.json with GitHub dates (if requested)
-    if args.only in ('datasets', 'both'):
+    if args.only in ('datasets', 'both', 'all'):
         print("\n📊 UPDATING DATASETS...")
-        datasets_success = update_datasets_with_github_dates(github_token)
+        datasets_success = update_datasets_with_github_dates(github_token, args.engine)
+
+    # Update rl.json with GitHub dates (if requested)
+    if args.only in ('rl', 'all'):
+        print("\n🎮 UPDATING RL IMPLEMENTATIONS...")
+        rl_success = update_rl_with_github_dates(github_token, args.engine)
 
     # Update model markdown files only if models were updated successfully
     if models_success:
@@ -272,7 +326,7 @@ def main():
     print("🎉 GitHub dates update completed!")
     print("=" * 60)
     
-    if models_success or datasets_success:
+    if models_success or datasets_success or rl_success:
         print("✅ JSON files updated with actual GitHub creation dates")
         print("✅ Model pages will now show authentic creation dates")
         print("✅ Dataset pages will now show authentic creation dates")
@@ -281,3 +335,4 @@ def main():
 
 if __name__ == '__main__':
     main()
+    print_cache_report()
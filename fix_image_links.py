@@ -4,10 +4,11 @@ Fix all image links in model markdown files to use raw.githubusercontent.com URL
 This will replace broken GitHub blob URLs and remove local image references
 """
 
-import os
 import re
 from pathlib import Path
 
+from markdown_pipeline import run_pipeline
+
 def fix_github_image_url(url):
     """Convert GitHub blob URL to raw.githubusercontent.com URL"""
     if 'github.com' in url and '/blob/' in url:
@@ -15,15 +16,8 @@ def fix_github_image_url(url):
         return url.replace('github.com', 'raw.githubusercontent.com').replace('/blob/', '/')
     return url
 
-def process_file(file_path):
-    """Process a single markdown file to fix image links"""
-    print(f"Processing {file_path}...")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
-    
+def fix_image_links_pass(content, doc=None):
+    """Pipeline pass: drop local image references and point GitHub image URLs at raw.githubusercontent.com"""
     # Pattern 1: Remove local image references like <img src="data/..."/>
     local_img_pattern = r'<!-- Main image reference -->\s*<img src="[^"]*" alt="[^"]*"[^>]*>\s*'
     content = re.sub(local_img_pattern, '', content, flags=re.MULTILINE)
@@ -54,15 +48,7 @@ def process_file(file_path):
     
     # Remove fallback reference comments if they're now redundant
     content = re.sub(r'<!-- Fallback reference -->\s*\n', '', content)
-    
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"  ✅ Fixed image links in {file_path}")
-        return True
-    else:
-        print(f"  ℹ️  No changes needed in {file_path}")
-        return False
+    return content
 
 def main():
     """Fix image links in all model files"""
@@ -74,18 +60,10 @@ def main():
         print("❌ _models directory not found!")
         return
     
-    fixed_count = 0
-    total_count = 0
-    
-    for md_file in sorted(models_dir.glob("*.md")):
-        total_count += 1
-        if process_file(md_file):
-            fixed_count += 1
-    
-    print("\n" + "=" * 50)
-    print(f"📊 Summary: Fixed {fixed_count}/{total_count} files")
+    # One read and at most one write per file (see markdown_pipeline.py)
+    changed = run_pipeline([models_dir], ['fix_image_links'])
     
-    if fixed_count > 0:
+    if changed:
         print("✅ Image links have been fixed!")
         print("🔗 All GitHub image URLs now use raw.githubusercontent.com")
         print("🗑️  Local image references have been removed")
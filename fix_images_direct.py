@@ -7,79 +7,24 @@ Uses the github_url from each file's frontmatter directly
 import os
 import re
 
-def convert_image_to_link(match, raw_base_url):
-    """Convert an image markdown to a hyperlink"""
-    alt_text = match.group(1)
-    image_path = match.group(2)
-    
-    # Create appropriate link text based on alt text
-    if 'loss' in alt_text.lower():
-        link_text = "📊 View Training Loss Curves"
-    elif 'train' in alt_text.lower() and 'val' in alt_text.lower():
-        link_text = "📈 View Train and Validation Loss"
-    elif 'result' in alt_text.lower():
-        link_text = "🖼️ View Results"
-    elif 'sample' in alt_text.lower():
-        link_text = "🎨 View Generated Samples"
-    elif 'architecture' in alt_text.lower():
-        link_text = "🏗️ View Model Architecture"
-    elif 'output' in alt_text.lower():
-        link_text = "📋 View Model Output"
-    elif 'arithmetic' in alt_text.lower():
-        link_text = "🔢 View Latent Arithmetic"
-    else:
-        link_text = f"🔗 View {alt_text}"
-    
-    # Create raw GitHub URL
-    github_image_url = f"{raw_base_url}/{image_path}"
-    
-    # Return as hyperlink
-    return f"[{link_text}]({github_image_url})"
+from link_rewriter import images_to_links, raw_base_url_for
+from markdown_pipeline import run_pipeline
 
-def update_markdown_file(filepath):
-    """Update a single markdown file"""
-    print(f"Processing {filepath}...")
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Extract GitHub URL from frontmatter
+def raw_base_url_of(content):
+    """raw.githubusercontent.com base URL for the github_url in a page's frontmatter, or None"""
     github_url_match = re.search(r'github_url:\s*"([^"]+)"', content)
     if not github_url_match:
-        print(f"  ⚠️  No github_url found in {filepath}")
-        return False
-    
-    github_url = github_url_match.group(1)
-    # Convert to raw base URL
-    raw_base_url = (
-        github_url
-        .replace('https://github.com/', 'https://raw.githubusercontent.com/')
-        .replace('/tree/master/', '/master/')
-        .replace('/tree/main/', '/main/')
-    )
-    
-    # Find all image references
-    image_pattern = r'!\[([^\]]*)\]\(([^)]+\.(jpg|jpeg|png|gif|svg))\)'
-    images_found = re.findall(image_pattern, content)
+        return None
     
-    if not images_found:
-        print(f"  ✅ No images found in {filepath}")
-        return False
-    
-    print(f"  🖼️  Found {len(images_found)} images: {[img[1] for img in images_found]}")
-    
-    # Replace all image references with hyperlinks
-    def replace_image(match):
-        return convert_image_to_link(match, raw_base_url)
-    
-    updated_content = re.sub(image_pattern, replace_image, content)
-    
-    # Write back to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(updated_content)
+    return raw_base_url_for(github_url_match.group(1))
+
+def images_to_links_pass(content, doc=None):
+    """Pipeline pass: turn image embeds into links to the raw files in the model's repo"""
+    raw_base_url = raw_base_url_of(content)
+    if not raw_base_url:
+        return content
     
-    print(f"  ✅ Updated {len(images_found)} image references in {filepath}")
-    return True
+    return images_to_links(content, raw_base_url)
 
 def main():
     """Main function to update all markdown files"""
@@ -89,22 +34,10 @@ def main():
         print(f"❌ Models directory {models_dir} not found")
         return
     
-    # Get all markdown files
-    markdown_files = []
-    for filename in os.listdir(models_dir):
-        if filename.endswith('.md'):
-            filepath = os.path.join(models_dir, filename)
-            markdown_files.append(filepath)
-    
-    print(f"🔍 Found {len(markdown_files)} markdown files to process")
-    
-    # Process each file
-    updated_count = 0
-    for filepath in sorted(markdown_files):
-        if update_markdown_file(filepath):
-            updated_count += 1
+    # One read and at most one write per file (see markdown_pipeline.py)
+    changed = run_pipeline([models_dir], ['fix_images_direct'])
     
-    print(f"\n🎉 Successfully updated {updated_count} markdown files!")
+    print(f"\n🎉 Successfully updated {len(changed)} markdown files!")
     print("📝 All local image references have been converted to GitHub hyperlinks")
 
 if __name__ == "__main__":
@@ -6,15 +6,11 @@ and improve the content to reflect 'From Scratch Implementation'
 
 import os
 import re
-import json
 
-def fix_model_file(file_path):
-    """Fix a single model markdown file"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
-    
+from markdown_pipeline import run_pipeline
+
+def fix_models_pass(content, doc=None):
+    """Pipeline pass: replace 'Paper Replications' wording with 'From Scratch Implementation'"""
     # Update excerpt to remove "Paper Replications repository"
     content = re.sub(
         r'(excerpt:\s*["\'][^"\']*?)from the Paper Replications repository([^"\']*["\'])',
@@ -39,16 +35,7 @@ def fix_model_file(file_path):
     content = content.replace('Paper Replications repository', 'From Scratch Implementation')
     content = content.replace('from the Paper Replications', 'from scratch')
     content = content.replace('Paper-Replications', 'From-Scratch-Implementation')
-    
-    # Only write if content changed
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"Fixed: {os.path.basename(file_path)}")
-        return True
-    else:
-        print(f"No changes needed: {os.path.basename(file_path)}")
-        return False
+    return content
 
 def main():
     """Main function to fix all model files"""
@@ -58,21 +45,9 @@ def main():
         print(f"Models directory '{models_dir}' not found!")
         return
     
-    # Get all markdown files in models directory
-    model_files = []
-    for filename in os.listdir(models_dir):
-        if filename.endswith('.md'):
-            model_files.append(os.path.join(models_dir, filename))
-    
-    print(f"Found {len(model_files)} model files to check")
-    
-    # Fix each file
-    fixed_count = 0
-    for file_path in sorted(model_files):
-        if fix_model_file(file_path):
-            fixed_count += 1
-    
-    print(f"\nFixed {fixed_count} out of {len(model_files)} model files!")
+    # One read and at most one write per file (see markdown_pipeline.py)
+    changed = run_pipeline([models_dir], ['fix_models'])
+    print(f"\nFixed {len(changed)} model files!")
 
 if __name__ == '__main__':
     main()
@@ -6,6 +6,8 @@ Fix models.json file to remove 'Paper Replications' references
 import json
 import os
 
+from readme_store import dehydrate_entries, hydrate_entries
+
 def fix_models_json():
     """Fix the models.json file"""
     json_path = '_data/models.json'
@@ -17,6 +19,7 @@ def fix_models_json():
     # Load the JSON data
     with open(json_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
+    hydrate_entries(data.get('models', []))
     
     fixed_count = 0
     
@@ -41,7 +44,8 @@ def fix_models_json():
                 model['readme_content'] = new_content
                 print(f"Fixed readme content for: {model.get('name', 'Unknown')}")
     
-    # Write back to file
+    # Write back to file; READMEs go back to the blob store
+    data['models'] = dehydrate_entries(data.get('models', []))
     with open(json_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
     
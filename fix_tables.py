@@ -11,8 +11,8 @@ Usage:
 """
 
 import sys
-import os
-from pathlib import Path
+
+from markdown_pipeline import run_pipeline
 
 def is_table_separator(line: str) -> bool:
     if '|' not in line:
@@ -95,43 +95,18 @@ def fix_tables_in_text(text: str) -> str:
         i += 1
     return '\n'.join(fixed)
 
-def process_file(path: Path) -> bool:
-    try:
-        original = path.read_text(encoding='utf-8')
-        fixed = fix_tables_in_text(original)
-        if fixed != original:
-            path.write_text(fixed, encoding='utf-8')
-            print(f"✅ Fixed tables: {path}")
-            return True
-        else:
-            print(f"ℹ️ No table changes needed: {path}")
-            return False
-    except Exception as e:
-        print(f"❌ Failed to process {path}: {e}")
-        return False
+def fix_tables_pass(content: str, doc=None) -> str:
+    """Pipeline pass wrapper around fix_tables_in_text"""
+    return fix_tables_in_text(content)
 
 def main(argv):
     if len(argv) < 2:
         print("Usage: python3 fix_tables.py <file_or_dir> [more files/dirs...]")
         return 1
-    changed = 0
-    for arg in argv[1:]:
-        p = Path(arg)
-        if p.is_dir():
-            for md in p.rglob('*.md'):
-                if process_file(md):
-                    changed += 1
-        elif p.is_file():
-            if process_file(p):
-                changed += 1
-        else:
-            print(f"Skipping non-existent path: {arg}")
-    print(f"\n📊 Table fixing complete. Files changed: {changed}")
+    # One read and at most one write per file (see markdown_pipeline.py)
+    changed = run_pipeline(argv[1:], ['fix_tables'], recursive=True)
+    print(f"\n📊 Table fixing complete. Files changed: {len(changed)}")
     return 0
 
 if __name__ == '__main__':
     raise SystemExit(main(sys.argv))
-
-
-
-
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Frontmatter reading and in-place patching for the collection pages.
+
+Every script used to parse frontmatter its own way (regexes over the whole
+file, line.split(':'), yaml.safe_load) and to read and rewrite the full file
+to change one key. This module is the one implementation:
+
+    header = read_header('_models/gpt.md')     # reads up to the closing '---' only
+    header.value('github_url')                 # top-level scalar, quotes stripped
+    header.data                                # full YAML (libyaml loader when available)
+
+    patch('_models/gpt.md', stars=512, date=date(2025, 3, 7))
+
+    with PatchBatch() as batch:                # one write per file, however many keys
+        batch.set(path, stars=512)
+        batch.set(path, category="Vision")
+
+- patches edit only the lines of the keys they touch (a key's indented or
+  "- " continuation lines are replaced with it); every other header line
+  and the body bytes are kept exactly, and new keys are appended
+- values are written YAML-style: strings double-quoted, numbers and bools
+  bare, dates as YYYY-MM-DD, lists inline (["a", "b"])
+- a file is only rewritten when its header actually changes, atomically
+  (see atomic_writer)
+
+Usage:
+    python frontmatter.py show _models/gpt.md
+    python frontmatter.py set _models/gpt.md category="Vision" stars=12
+"""
+
+import argparse
+import datetime
+import io
+import json
+import re
+import sys
+from functools import cached_property
+from pathlib import Path
+
+import yaml
+
+from atomic_writer import write_atomic
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+DELIMITER = '---'
+KEY_RE = re.compile(r'^([A-Za-z0-9_-]+):(.*)$')
+# A '---' line closing the header (never the opening one at offset 0)
+CLOSING_RE = re.compile(rb'(?<=\n)---[ \t]*(?:\r?\n|\r|\Z)')
+CHUNK_SIZE = 4096
+
+
+class Header:
+    """The frontmatter block of one page: its lines between the '---' delimiters."""
+
+    def __init__(self, lines, newline='\n', size=0):
+        self.lines = lines          # header lines without line endings
+        self.newline = newline
+        self.size = size            # length of the page up to and including the closing '---' line
+        self.dirty = False
+
+    @property
+    def text(self):
+        return '\n'.join(self.lines)
+
+    @cached_property
+    def data(self):
+        """The header parsed as YAML ({} when empty); raises yaml.YAMLError."""
+        return yaml.load(self.text, Loader=YamlLoader) or {}
+
+    def _find(self, key):
+        """Line index of a top-level key, or None."""
+        prefix = key + ':'
+        for index, line in enumerate(self.lines):
+            if line.startswith(prefix):
+                return index
+        return None
+
+    def keys(self):
+        keys = []
+        for line in self.lines:
+            match = KEY_RE.match(line)
+            if match and match.group(1) not in keys:
+                keys.append(match.group(1))
+        return keys
+
+    def value(self, key, default=None):
+        """A top-level scalar as written, surrounding quotes stripped (no YAML parsing)."""
+        index = self._find(key)
+        if index is None:
+            return default
+        value = self.lines[index][len(key) + 1:].strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+            value = value[1:-1]
+        return value
+
+    def set(self, key, value):
+        """Set a top-level key; returns True when the header changed."""
+        line = f"{key}: {format_value(value)}"
+        index = self._find(key)
+        if index is None:
+            self.lines.append(line)
+        else:
+            end = index + 1
+            while end < len(self.lines) and self.lines[end][:1] in (' ', '\t', '-') \
+                    and not self.lines[end].startswith(DELIMITER):
+                end += 1
+            if self.lines[index:end] == [line]:
+                return False
+            self.lines[index:end] = [line]
+        self.__dict__.pop('data', None)
+        self.dirty = True
+        return True
+
+    def render(self):
+        nl = self.newline
+        return DELIMITER + nl + ''.join(line + nl for line in self.lines) + DELIMITER + nl
+
+
+def format_value(value):
+    """A value as it is written in the site's frontmatter."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.strftime('%Y-%m-%d')
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(format_value(item) for item in value) + ']'
+    if value is None:
+        return 'null'
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def _parse_lines(lines, decode=None):
+    """Header from an iterator over a page's lines (with endings); None without frontmatter.
+
+    size counts the raw lines, so it is in bytes when they are bytes.
+    """
+    first = next(lines, '')
+    text = decode(first) if decode else first
+    if text.rstrip() != DELIMITER:
+        return None
+    newline = '\r\n' if text.endswith('\r\n') else '\n'
+    size = len(first)
+    body = []
+    for line in lines:
+        size += len(line)
+        stripped = (decode(line) if decode else line).rstrip('\r\n')
+        if stripped.rstrip() == DELIMITER:
+            return Header(body, newline, size)
+        body.append(stripped)
+    return None
+
+
+def split(text):
+    """(Header or None, body) of a page held in memory."""
+    header = _parse_lines(iter(io.StringIO(text, newline='')))
+    if header is None:
+        return None, text
+    return header, text[header.size:]
+
+
+def read_header(path):
+    """The Header of a page, reading the file only up to the closing '---' (None if there is none)."""
+    with open(path, 'rb') as f:
+        data = f.read(CHUNK_SIZE)
+        if not data.startswith(b'---'):
+            return None
+        start = 0
+        while True:
+            match = CLOSING_RE.search(data, start)
+            if match and (match.end() < len(data) or data.endswith(b'\n')):
+                break
+            more = f.read(CHUNK_SIZE)
+            if not more:
+                if match:
+                    break
+                return None
+            # the closing line may straddle the chunk boundary
+            start = match.start() if match else max(0, len(data) - 8)
+            data += more
+    raw = data[:match.end()]
+    first_end = raw.index(b'\n') + 1 if b'\n' in raw[:match.start()] else None
+    if first_end is None or raw[:first_end].strip() != b'---':
+        return None
+    newline = '\r\n' if raw[:first_end].endswith(b'\r\n') else '\n'
+    lines = raw[first_end:match.start()].decode('utf-8').split('\n')[:-1]
+    if newline == '\r\n':
+        lines = [line.rstrip('\r') for line in lines]
+    # size in bytes, so the body can be copied without decoding it
+    return Header(lines, newline, len(raw))
+
+
+def load(path):
+    """Parsed frontmatter of a page ({} when it has none)."""
+    header = read_header(path)
+    return header.data if header else {}
+
+
+def _write_header(path, header):
+    """Rewrite a page with a new header, copying the body bytes as they are."""
+    with open(path, 'rb') as f:
+        f.seek(header.size)
+        body = f.read()
+    write_atomic(path, header.render().encode('utf-8') + body)
+
+
+def patch(path, updates=None, **keys):
+    """Set frontmatter keys of a page in one write; returns True when the file changed."""
+    updates = dict(updates or {}, **keys)
+    header = read_header(path)
+    if header is None:
+        return False
+    for key, value in updates.items():
+        header.set(key, value)
+    if not header.dirty:
+        return False
+    _write_header(path, header)
+    return True
+
+
+class PatchBatch:
+    """Collects patches per file and applies each file's patches with one write."""
+
+    def __init__(self):
+        self.pending = {}
+
+    def set(self, path, updates=None, **keys):
+        self.pending.setdefault(Path(path), {}).update(updates or {}, **keys)
+
+    def commit(self):
+        """Apply every pending patch; returns the paths that changed."""
+        changed = [path for path, updates in self.pending.items() if patch(path, updates)]
+        self.pending = {}
+        return changed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+
+
+def _parse_assignment(assignment):
+    """key=value with the value read as a date (YYYY-MM-DD), JSON, or else a plain string."""
+    key, _, raw = assignment.partition('=')
+    try:
+        return key, datetime.date.fromisoformat(raw)
+    except ValueError:
+        pass
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Read or patch page frontmatter')
+    sub = parser.add_subparsers(dest='command', required=True)
+    show_parser = sub.add_parser('show', help='Print the parsed frontmatter of pages')
+    show_parser.add_argument('paths', nargs='+')
+    set_parser = sub.add_parser('set', help='Set keys (key=value, value as JSON or a plain string)')
+    set_parser.add_argument('path')
+    set_parser.add_argument('assignments', nargs='+')
+    args = parser.parse_args()
+
+    if args.command == 'show':
+        for path in args.paths:
+            print(f"📄 {path}")
+            print(json.dumps(load(path), indent=2, ensure_ascii=False, default=str))
+        return True
+
+    updates = dict(_parse_assignment(assignment) for assignment in args.assignments)
+    if read_header(args.path) is None:
+        print(f"❌ {args.path} has no frontmatter")
+        return False
+    if patch(args.path, updates):
+        print(f"✅ Updated {args.path}: {', '.join(updates)}")
+    else:
+        print(f"ℹ️  {args.path} already up to date")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -9,6 +9,7 @@
  */
 
 const fs = require('fs');
+const crypto = require('crypto');
 const path = require('path');
 
 // Use built-in fetch for Node.js 18+ or fallback to node-fetch
@@ -40,6 +41,23 @@ const REPO_OWNER = 'YuvrajSingh-mist';
 const REPO_NAME = 'Paper-Replications';
 const OUTPUT_FILE = path.join(__dirname, '_data', 'models.json');
 
+// README bodies live in the content-addressed store (see readme_store.py);
+// catalog entries keep only the SHA-256 of the text
+const README_STORE_DIR = path.join(__dirname, '_readmes');
+
+function readmeRef(text) {
+    if (!text) {
+        return { readme_content: '' };
+    }
+    const digest = crypto.createHash('sha256').update(text, 'utf8').digest('hex');
+    const blobPath = path.join(README_STORE_DIR, digest.slice(0, 2), `${digest}.md`);
+    if (!fs.existsSync(blobPath)) {
+        fs.mkdirSync(path.dirname(blobPath), { recursive: true });
+        fs.writeFileSync(blobPath, text, 'utf8');
+    }
+    return { readme_sha256: digest };
+}
+
 console.log('🚀 Starting models data generation...');
 console.log(`📂 Repository: ${REPO_OWNER}/${REPO_NAME}`);
 console.log(`📄 Output file: ${OUTPUT_FILE}`);
@@ -135,7 +153,7 @@ async function generateModelsData() {
                 name: folder.name,
                 display_name: formatDisplayName(folder.name),
                 description: description,
-                readme_content: readmeContent,
+                ...readmeRef(readmeContent),
                 github_url: `https://github.com/${REPO_OWNER}/${REPO_NAME}/tree/master/${folder.name}`,
                 api_url: folder.url,
                 download_url: folder.download_url
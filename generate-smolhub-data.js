@@ -9,6 +9,7 @@
  */
 
 const fs = require('fs');
+const crypto = require('crypto');
 const path = require('path');
 
 // Use built-in fetch for Node.js 18+ or fallback to node-fetch
@@ -41,6 +42,23 @@ const OUTPUT_FILE = path.join(__dirname, '_data', 'smolhub_playground.json');
 // Exclude non-project directories
 const EXCLUDED_DIRS = ['hf-spaces'];
 
+// README bodies live in the content-addressed store (see readme_store.py);
+// catalog entries keep only the SHA-256 of the text
+const README_STORE_DIR = path.join(__dirname, '_readmes');
+
+function readmeRef(text) {
+    if (!text) {
+        return { readme_content: '' };
+    }
+    const digest = crypto.createHash('sha256').update(text, 'utf8').digest('hex');
+    const blobPath = path.join(README_STORE_DIR, digest.slice(0, 2), `${digest}.md`);
+    if (!fs.existsSync(blobPath)) {
+        fs.mkdirSync(path.dirname(blobPath), { recursive: true });
+        fs.writeFileSync(blobPath, text, 'utf8');
+    }
+    return { readme_sha256: digest };
+}
+
 console.log('🚀 Starting SmolHub playground data generation...');
 console.log(`📂 Repository: ${REPO_OWNER}/${REPO_NAME}`);
 console.log(`🌿 Branch: ${REPO_BRANCH}`);
@@ -280,7 +298,7 @@ async function generateSmolHubData() {
                 name: folder.name,
                 display_name: formatDisplayName(folder.name),
                 description: description,
-                readme_content: readmeContent,
+                ...readmeRef(readmeContent),
                 tags: projectTags,
                 github_url: `https://github.com/${REPO_OWNER}/${REPO_NAME}/tree/${REPO_BRANCH}/${folder.name}`,
                 api_url: folder.url,
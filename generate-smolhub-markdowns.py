@@ -5,12 +5,24 @@ SmolHub Playground Markdown Generator
 This script generates markdown files for SmolHub playground projects from the JSON data.
 """
 
+import argparse
 import json
 import os
 import re
+import sys
 from pathlib import Path
 from datetime import datetime
 
+from atomic_writer import DirectorySync
+from slug_registry import SlugRegistry
+from render_pool import add_jobs_argument, render_ordered, report_errors
+from readme_store import readme_of
+from link_rewriter import WEB_IMAGE_EXTENSIONS, has_extension, is_absolute, rewrite_links
+from profiler import add_profile_argument, profiled, span, start_profile
+
+STANDALONE_IMAGE_RE = re.compile(r'(images/[^)\s]+\.(?:png|jpg|jpeg|gif|svg|webp))')
+
+@profiled
 def load_smolhub_data():
     """Load SmolHub data from JSON file"""
     data_file = Path(__file__).parent / '_data' / 'smolhub_playground.json'
@@ -96,39 +108,28 @@ def convert_images_to_links(content, github_url):
     if not content or not github_url:
         return content
     
-    # Pattern to match image markdown: ![alt](path) or ![alt](./path) or images/file
-    image_patterns = [
-        (r'!\[([^\]]*)\]\(([^)]+\.(?:png|jpg|jpeg|gif|svg|webp))\)', True),  # ![alt](image.png)
-        (r'(images/[^)\s]+\.(?:png|jpg|jpeg|gif|svg|webp))', False),          # images/file.png
-    ]
+    raw_url = github_url.replace('/tree/', '/raw/')
     
-    for pattern, is_markdown in image_patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            if is_markdown and isinstance(match, tuple) and len(match) == 2:
-                # For ![alt](image) pattern
-                alt_text, image_path = match
-                # Create GitHub raw URL
-                github_image_url = f"{github_url.replace('/tree/', '/raw/')}/{image_path}"
-                # Replace in content
-                content = content.replace(f'![{alt_text}]({image_path})', f'![{alt_text}]({github_image_url})')
-            elif not is_markdown:
-                # For images/file.png pattern (standalone)
-                image_path = match
-                github_image_url = f"{github_url.replace('/tree/', '/raw/')}/{image_path}"
-                # Only replace if it's not already part of a markdown link
-                if f']({image_path})' not in content and f'[{image_path}]' not in content:
-                    content = content.replace(image_path, f'[🖼️ {image_path}]({github_image_url})')
+    # ![alt](image) -> ![alt](GitHub raw URL)
+    def replace_image(alt_text, image_path, title):
+        if is_absolute(image_path) or not has_extension(image_path, WEB_IMAGE_EXTENSIONS):
+            return None
+        return f'![{alt_text}]({raw_url}/{image_path}{title})'
     
-    return content
+    # Standalone images/file.png paths in prose become links; code is left alone
+    def replace_standalone(text):
+        return STANDALONE_IMAGE_RE.sub(lambda m: f'[🖼️ {m.group(1)}]({raw_url}/{m.group(1)})', text)
+    
+    return rewrite_links(content, on_image=replace_image, on_text=replace_standalone)
 
+@profiled
 def create_markdown_from_json(project_data, file_number):
     """Create markdown content from JSON project data"""
     name = project_data.get('name', 'Unknown Project')
     display_name = project_data.get('display_name', name)
     description = project_data.get('description', 'SmolHub playground project')
     github_url = project_data.get('github_url', '')
-    readme_content = project_data.get('readme_content', '')
+    readme_content = readme_of(project_data)
     tags = project_data.get('tags', ['playground'])
     project_date = project_data.get('created_date', '2025-08-08')
     
@@ -172,6 +173,7 @@ excerpt: "{description[:200]}{'...' if len(description) > 200 else ''} 🎮<br/>
 collection: smolhub
 github_url: "{github_url}"
 date: {project_date}
+order: {file_number}
 tags: [{', '.join([f'"{tag}"' for tag in tags])}]
 ---
 
@@ -194,83 +196,85 @@ tags: [{', '.join([f'"{tag}"' for tag in tags])}]
 
     return frontmatter
 
-def generate_smolhub_markdowns():
+def generate_smolhub_markdowns(jobs=None):
     """Main function to generate SmolHub markdown files"""
     print("🚀 Starting SmolHub playground markdown generation...")
     
     # Load SmolHub data
     smolhub_data = load_smolhub_data()
     if not smolhub_data:
-        return
+        return False
     
     projects = smolhub_data.get('projects', [])
     print(f"📊 Found {len(projects)} playground projects")
     
-    # Create _smolhub directory if it doesn't exist
+    # Only playground-*.md pages are generated; anything else in _smolhub is hand-written
     smolhub_dir = Path(__file__).parent / '_smolhub'
-    smolhub_dir.mkdir(exist_ok=True)
-    
-    # Clear existing auto-generated files to prevent duplicates
-    print("🧹 Cleaning up old auto-generated files...")
-    for old in smolhub_dir.glob('playground-*.md'):
-        try:
-            old.unlink()
-        except Exception:
-            pass
-    manual_files = 0
+    sync = DirectorySync(smolhub_dir, 'playground-*.md')
+    registry = SlugRegistry.load()
+    manual_files = sum(1 for path in smolhub_dir.glob('*.md') if not path.name.startswith('playground-'))
     
     generated_count = 0
     updated_count = 0
     
-    # Generate markdown files
+    # Permanent filenames are assigned here, in list order
+    pages = []
     for i, project in enumerate(projects, 1):
         # Skip excluded directories if present in data (defensive)
         if project.get('name') in ['hf-spaces']:
             print(f"⏭️  Skipping excluded project: {project.get('name')}")
             continue
         project_name = project.get('name', f'project-{i}')
-        filename = f"playground-{i:02d}-{project_name.lower().replace(' ', '-')}.md"
-        file_path = smolhub_dir / filename
-        
-        # Generate markdown content
-        try:
-            markdown_content = create_markdown_from_json(project, i)
-            
-            # Check if file exists and has changed
-            file_exists = file_path.exists()
-            needs_update = True
-            
-            if file_exists:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    existing_content = f.read()
-                needs_update = existing_content != markdown_content
+        # Permanent filename; the list position only goes into the frontmatter
+        slug = project_name.lower().replace(' ', '-')
+        filename = registry.filename('smolhub', project_name, f"playground-{slug}", directory=smolhub_dir,
+                                     legacy=f"playground-{i:02d}-{slug}")
+        pages.append((i, project, filename))
+    
+    # Render in worker processes; results come back in list order and are written here
+    with span('render', pages=len(pages)):
+        results = render_ordered(create_markdown_from_json, [(project, i) for i, project, _ in pages], jobs)
+    
+    errors = []
+    with span('write pages'):
+        for (i, project, filename), (markdown_content, error) in zip(pages, results):
+            if error:
+                # Keep the previous page rather than deleting it as stale
+                sync.keep(filename)
+                errors.append((filename, error))
+                continue
+            status = sync.write(filename, markdown_content)
             
-            if needs_update:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
-                
-                if file_exists:
-                    print(f"✏️  Updated: {filename}")
-                    updated_count += 1
-                else:
-                    print(f"✅ Generated: {filename}")
-                    generated_count += 1
+            if status == 'updated':
+                print(f"✏️  Updated: {filename}")
+                updated_count += 1
+            elif status == 'created':
+                print(f"✅ Generated: {filename}")
+                generated_count += 1
             else:
                 print(f"⏭️  Skipped: {filename} (no changes)")
-                
-        except Exception as e:
-            print(f"❌ Error generating {filename}: {e}")
-            continue
+        
+        registry.save()
+        removed = sync.remove_stale()
     
     # Summary
     print(f"\n📋 Summary:")
     print(f"   📄 Manual files preserved: {manual_files}")
     print(f"   ✅ New files generated: {generated_count}")
     print(f"   ✏️  Files updated: {updated_count}")
+    print(f"   🗑️  Stale files removed: {len(removed)}")
     print(f"   📊 Total playground projects: {len(projects)}")
     
     print(f"\n🎉 SmolHub playground markdown generation complete!")
     print(f"📁 Files are ready in: {smolhub_dir}")
+    
+    report_errors(errors)
+    return not errors
 
 if __name__ == "__main__":
-    generate_smolhub_markdowns()
+    parser = argparse.ArgumentParser(description='Generate SmolHub playground markdown files')
+    add_jobs_argument(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profile(args.profile, 'generate-smolhub-markdowns')
+    sys.exit(0 if generate_smolhub_markdowns(args.jobs) else 1)
@@ -4,12 +4,22 @@ Generate dataset markdown files from datasets.json
 This script creates standardized markdown files for all datasets in the datasets.json file.
 """
 
+import argparse
 import json
 import os
 import re
 from datetime import datetime
 from pathlib import Path
 
+from atomic_writer import DirectorySync
+from slug_registry import SlugRegistry
+from render_pool import add_jobs_argument, render_ordered, report_errors
+from listing_index import write_listing_index
+from readme_store import readme_of
+from link_rewriter import WEB_IMAGE_EXTENSIONS, has_extension, rewrite_links
+from profiler import add_profile_argument, profiled, span, start_profile
+
+@profiled
 def load_datasets_data():
     """Load datasets data from JSON file"""
     datasets_file = "_data/datasets.json"
@@ -43,35 +53,19 @@ def convert_images_to_links(content, github_url):
     if not content or not github_url:
         return content
     
-    # Pattern to match image markdown: ![alt](path) or ![alt](./path) or images/file
-    image_patterns = [
-        (r'!\[([^\]]*)\]\(([^)]+\.(?:png|jpg|jpeg|gif|svg|webp))\)', True),  # ![alt](image.png)
-        (r'<img[^>]+src=["\']([^"\']+\.(?:png|jpg|jpeg|gif|svg|webp))["\'][^>]*>', False),  # <img src="image.png">
-        (r'((?:images?|assets?|figures?)/[^)\s]+\.(?:png|jpg|jpeg|gif|svg|webp))', False)  # images/file.png
-    ]
-    
     base_url = github_url.replace('/tree/main/', '/raw/main/').replace('/tree/master/', '/raw/master/')
     
-    for pattern, is_markdown in image_patterns:
-        def replace_image(match):
-            if is_markdown:
-                alt_text = match.group(1)
-                image_path = match.group(2)
-                if not image_path.startswith('http'):
-                    if image_path.startswith('./'):
-                        image_path = image_path[2:]
-                    full_url = f"{base_url}/{image_path}"
-                    return f"![{alt_text}]({full_url})"
-                return match.group(0)
-            else:
-                # Handle other patterns
-                return match.group(0)  # For now, keep as-is
-        
-        content = re.sub(pattern, replace_image, content, flags=re.IGNORECASE)
+    # ![alt](image.png) or ![alt](./image.png); code blocks are left alone
+    def replace_image(alt_text, image_path, title):
+        if image_path.startswith('http') or not has_extension(image_path, WEB_IMAGE_EXTENSIONS, ignore_case=True):
+            return None
+        if image_path.startswith('./'):
+            image_path = image_path[2:]
+        return f"![{alt_text}]({base_url}/{image_path}{title})"
     
-    return content
+    return rewrite_links(content, on_image=replace_image)
 
-def generate_frontmatter(dataset):
+def generate_frontmatter(dataset, order=None):
     """Generate YAML frontmatter for dataset"""
     tags = dataset.get('tags', [])
     if isinstance(tags, str):
@@ -101,7 +95,10 @@ format: {dataset.get('format', 'Unknown')}
 samples: {dataset.get('samples', 'Unknown')}
 license: {dataset.get('license', 'Unknown')}
 last_updated: {dataset.get('last_updated', datetime.now().isoformat())}
-tags:"""
+"""
+    if order is not None:
+        frontmatter += f"order: {order}\n"
+    frontmatter += "tags:"
     
     for tag in tags:
         frontmatter += f"\n  - {tag}"
@@ -161,7 +158,7 @@ When using this dataset, please cite the original repository:
 """
     
     # Add README content if available
-    readme_content = dataset.get('readme_content', '')
+    readme_content = readme_of(dataset)
     if readme_content and len(readme_content) > 100:
         # Clean and convert images
         readme_content = clean_content(readme_content)
@@ -189,15 +186,22 @@ def generate_filename(dataset):
     filename = filename.strip('-')  # Remove leading/trailing hyphens
     return f"{filename}.md"
 
-def create_dataset_markdown(dataset):
+@profiled
+def create_dataset_markdown(dataset, order=None):
     """Create a complete markdown file for a dataset"""
-    frontmatter = generate_frontmatter(dataset)
+    frontmatter = generate_frontmatter(dataset, order)
     content = generate_dataset_content(dataset)
     
     return frontmatter + content
 
 def main():
     """Main function to generate all dataset markdown files"""
+    parser = argparse.ArgumentParser(description='Generate dataset markdown files from _data/datasets.json')
+    add_jobs_argument(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profile(args.profile, 'generate_dataset_files')
+    
     print("🔄 Generating dataset markdown files...")
     
     # Load datasets data
@@ -210,35 +214,49 @@ def main():
         print("⚠️ No datasets found in datasets.json")
         return False
     
-    # Create _datasets directory if it doesn't exist
+    # Every page in _datasets comes from datasets.json; unchanged ones are not rewritten
     datasets_dir = Path("_datasets")
-    datasets_dir.mkdir(exist_ok=True)
+    sync = DirectorySync(datasets_dir, '*.md')
+    registry = SlugRegistry.load()
     
-    generated_count = 0
+    # Permanent filenames, assigned the first time a dataset is seen
+    filenames = []
     for dataset in datasets:
-        try:
-            # Generate filename
-            filename = generate_filename(dataset)
-            filepath = datasets_dir / filename
-            
-            # Generate markdown content
-            markdown_content = create_dataset_markdown(dataset)
-            
-            # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
-            print(f"  ✅ Generated: {filename}")
-            generated_count += 1
-            
-        except Exception as e:
-            dataset_name = dataset.get('name', 'Unknown')
-            print(f"  ❌ Error generating {dataset_name}: {e}")
+        slug = generate_filename(dataset)[:-len('.md')]
+        filenames.append(registry.filename('datasets', dataset.get('name', slug), slug,
+                                           directory=datasets_dir, legacy=slug))
+    
+    # Render in worker processes; results come back in list order and are written here
+    with span('render', pages=len(datasets)):
+        results = render_ordered(create_dataset_markdown,
+                                 [(dataset, index) for index, dataset in enumerate(datasets, 1)], args.jobs)
     
+    generated_count = 0
+    errors = []
+    with span('write pages'):
+        for dataset, filename, (markdown_content, error) in zip(datasets, filenames, results):
+            if error:
+                # Keep the previous page rather than deleting it as stale
+                sync.keep(filename)
+                errors.append((dataset.get('name', 'Unknown'), error))
+                continue
+            status = sync.write(filename, markdown_content)
+            if status != 'unchanged':
+                print(f"  ✅ {status.capitalize()}: {filename}")
+            generated_count += 1
+        
+        registry.save()
+        sync.remove_stale()
+    sync.report()
     print(f"\n✅ Successfully generated {generated_count} dataset markdown files!")
     print(f"📁 Files saved in: {datasets_dir}")
     
-    return True
+    # Slim card index for the datasets listing page
+    with span('write_listing_index'):
+        write_listing_index('datasets', datasets)
+    
+    report_errors(errors)
+    return not errors
 
 if __name__ == "__main__":
     success = main()
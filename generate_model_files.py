@@ -9,9 +9,17 @@ import json
 import os
 import re
 import argparse
+import sys
 from datetime import datetime
 from pathlib import Path
 
+from atomic_writer import DirectorySync
+from slug_registry import SlugRegistry
+from render_pool import add_jobs_argument, render_ordered, report_errors
+from readme_store import readme_of
+from classifier import classify
+from profiler import add_profile_argument, profiled, span, start_profile
+
 
 def slugify(text):
     """Convert text to a URL-friendly slug"""
@@ -36,126 +44,19 @@ def clean_markdown_content(content):
     return content
 
 
-def extract_framework_and_dataset(readme_content, description):
-    """Extract framework and dataset information from readme content"""
-    framework = "PyTorch"  # Default
-    dataset = "Custom"     # Default
-    
-    # Look for framework mentions
-    content_lower = (readme_content + " " + description).lower()
-    if 'pytorch' in content_lower:
-        framework = "PyTorch"
-    elif 'tensorflow' in content_lower:
-        framework = "TensorFlow"
-    elif 'jax' in content_lower:
-        framework = "JAX"
-    
-    # Look for dataset mentions
-    dataset_patterns = {
-        'tinystories': 'TinyStories',
-        'tinyshakespeare': 'TinyShakespeare', 
-        'imagenet': 'ImageNet',
-        'cifar': 'CIFAR',
-        'mnist': 'MNIST',
-        'celeba': 'CelebA',
-        'flickr': 'Flickr',
-        'cornell': 'Cornell Movie Dialogs',
-        'cityscapes': 'Cityscapes',
-        'gigaspeech': 'Gigaspeech',
-        'ultrafeedback': 'UltraFeedback',
-        'fineweb': 'FineWeb'
-    }
-    
-    for pattern, name in dataset_patterns.items():
-        if pattern in content_lower:
-            dataset = name
-            break
-    
-    return framework, dataset
-
-
-def categorize_model(name, description, readme_content):
-    """Manual categorization based on model name - no automatic detection"""
-    # Manual mapping for specific models
-    manual_categories = {
-        'whisper': 'Audio/Speech',
-        'clap': 'Audio/Speech', 
-        'moonshine': 'Audio/Speech',
-        'tts': 'Audio/Speech',
-        'clip': 'Computer Vision',
-        'siglip': 'Computer Vision',
-        'vit': 'Computer Vision',
-        'llava': 'Computer Vision',
-        'paligemma': 'Computer Vision',
-        'vae': 'Generative Models',
-        'cgans': 'Generative Models',
-        'dcgans': 'Generative Models',
-        'cyclegan': 'Generative Models',
-        'wgans': 'Generative Models',
-        'pix2pix': 'Generative Models',
-        'mixtral': 'Language Models',
-        'llama': 'Language Models',
-        'gpt': 'Language Models',
-        'bert': 'Language Models',
-        'gemma': 'Language Models',
-        'deepseekv3': 'Language Models',
-        'kimi-k2': 'Language Models',
-        'transformer': 'Language Models',
-        'encoder-decoder': 'Sequential Models',
-        'seq2seq': 'Sequential Models',
-        'rnn': 'Sequential Models',
-        'lstm': 'Sequential Models',
-        'gru': 'Sequential Models',
-        'attention': 'Attention Mechanisms',
-        'differential': 'Attention Mechanisms',
-        'lora': 'Fine-tuning',
-        'peft': 'Fine-tuning',
-        'dpo': 'Fine-tuning',
-        'orpo': 'Fine-tuning',
-        'simplepo': 'Fine-tuning',
-        'ddp': 'Training Methods'
-    }
-    
-    name_lower = name.lower()
-    for key, category in manual_categories.items():
-        if key in name_lower:
-            return category
-    
-    return "Other"
-
-
-def extract_key_features(readme_content):
-    """Extract key features from readme content"""
-    features = []
-    
-    # Look for common patterns
-    if 'mixture of experts' in readme_content.lower() or 'moe' in readme_content.lower():
-        features.append("Mixture of Experts (MoE)")
-    if 'attention' in readme_content.lower():
-        features.append("Attention Mechanism")
-    if 'transformer' in readme_content.lower():
-        features.append("Transformer Architecture")
-    if 'distributed' in readme_content.lower() or 'ddp' in readme_content.lower():
-        features.append("Distributed Training")
-    if 'gradient checkpointing' in readme_content.lower():
-        features.append("Memory Optimization")
-    if 'fine-tuning' in readme_content.lower() or 'finetuning' in readme_content.lower():
-        features.append("Fine-tuning")
-    
-    return features
-
-
+@profiled
 def generate_model_markdown(model_data, index):
     """Generate markdown content for a single model"""
     name = model_data.get('name', 'Unknown Model')
     description = model_data.get('description', '')
-    readme_content = model_data.get('readme_content', '')
+    readme_content = readme_of(model_data)
     github_url = model_data.get('github_url', '')
     
-    # Extract additional information
-    framework, dataset = extract_framework_and_dataset(readme_content, description)
-    category = categorize_model(name, description, readme_content)
-    features = extract_key_features(readme_content)
+    # Extract additional information (rules in _rules/classification.json)
+    labels = classify('models', name=name, description=description, readme=readme_content)
+    framework, dataset = labels['model_framework'], labels['model_dataset']
+    category = labels['model_category']
+    features = labels['model_features']
     
     # Clean the readme content
     cleaned_readme = clean_markdown_content(readme_content)
@@ -178,6 +79,7 @@ framework: "{framework}"
 dataset: "{dataset}"
 github_url: "{github_url}"
 date: {model_date}
+order: {index}
 ---
 
 """
@@ -237,7 +139,10 @@ def main():
     parser = argparse.ArgumentParser(description='Generate model markdown files')
     parser.add_argument('--source', default='paper-replications', 
                        help='Source repository type (default: paper-replications)')
+    add_jobs_argument(parser)
+    add_profile_argument(parser)
     args = parser.parse_args()
+    start_profile(args.profile, 'generate_model_files')
     
     print(f"🔧 Generating model files for source: {args.source}")
     
@@ -253,12 +158,9 @@ def main():
         print(f"❌ Error: {models_json_path} not found!")
         return
     
-    # Create output directory if it doesn't exist
-    output_dir.mkdir(exist_ok=True)
-    
     # Load the models data
     try:
-        with open(models_json_path, 'r', encoding='utf-8') as f:
+        with span('load models.json'), open(models_json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
     except Exception as e:
         print(f"❌ Error reading models.json: {e}")
@@ -270,33 +172,39 @@ def main():
     
     models = data['models']
     
-    # Clean up existing files
-    for existing_file in output_dir.glob('*.md'):
-        existing_file.unlink()
-        print(f"🗑️  Removed old file: {existing_file.name}")
+    # Pages are only rewritten when their content changes; stale ones are removed at the end
+    sync = DirectorySync(output_dir, '*.md')
+    registry = SlugRegistry.load()
     
-    # Generate markdown files for each model
-    successful_count = 0
+    # Permanent filenames are assigned here, in list order
+    filenames = []
     for index, model in enumerate(models, 1):
-        try:
-            name = model.get('name', f'model-{index}')
-            slug = slugify(name)
-            filename = f"{index:02d}-{slug}.md"
-            filepath = output_dir / filename
-            
-            # Generate the markdown content
-            content = generate_model_markdown(model, index)
-            
-            # Write the file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ Generated: {filename}")
-            successful_count += 1
-            
-        except Exception as e:
-            print(f"❌ Error generating file for model {model.get('name', 'unknown')}: {e}")
+        name = model.get('name', f'model-{index}')
+        filenames.append(registry.filename('models', name, slugify(name), directory=output_dir,
+                                           legacy=f"{index:02d}-{slugify(name)}"))
+    
+    # Render in worker processes; results come back in list order and are written here
+    with span('render', pages=len(models)):
+        results = render_ordered(generate_model_markdown,
+                                 [(model, index) for index, model in enumerate(models, 1)], args.jobs)
     
+    successful_count = 0
+    errors = []
+    with span('write pages'):
+        for model, filename, (content, error) in zip(models, filenames, results):
+            if error:
+                # Keep the previous page rather than deleting it as stale
+                sync.keep(filename)
+                errors.append((model.get('name', 'unknown'), error))
+                continue
+            status = sync.write(filename, content)
+            if status != 'unchanged':
+                print(f"✅ {status.capitalize()}: {filename}")
+            successful_count += 1
+        
+        registry.save()
+        sync.remove_stale()
+    sync.report()
     print(f"\n🎉 Successfully generated {successful_count} model files in {output_dir}")
     print(f"📁 Files are ready to be used by Jekyll!")
     
@@ -305,7 +213,10 @@ def main():
     print(f"   - Total models processed: {len(models)}")
     print(f"   - Files generated: {successful_count}")
     print(f"   - Output directory: {output_dir}")
+    
+    report_errors(errors)
+    return not errors
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
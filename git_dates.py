@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Compute first/last commit dates for every folder of a source repository from
+one pass over its local git history.
+
+Instead of one `/commits?path=` API request per model or dataset, the source
+repo (Paper-Replications, Datasets-Collection or Reinforcement-Learning) is
+kept as a blobless bare clone under .cache/repos/ and `git log --name-only`
+is walked once. Every path touched by a commit credits that commit's date to
+all of its parent folders, so top-level and nested folders are covered in the
+same pass.
+
+Usage:
+    python git_dates.py Paper-Replications            # print folder dates
+    python git_dates.py Reinforcement-Learning --json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from profiler import profiled
+
+REPO_OWNER = "YuvrajSingh-mist"
+CLONES_DIR = Path(__file__).parent / ".cache" / "repos"
+
+# Marks the start of a commit record in the log output (file paths never start with NUL)
+COMMIT_MARKER = "\x00"
+
+
+def run_git(args, cwd=None):
+    """Run a git command and return stdout, or None on failure."""
+    try:
+        result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, encoding='utf-8')
+    except OSError as e:
+        print(f"❌ Could not run git: {e}")
+        return None
+    if result.returncode != 0:
+        print(f"❌ git {' '.join(args)} failed: {result.stderr.strip()}")
+        return None
+    return result.stdout
+
+
+@profiled
+def ensure_clone(repo_name, owner=REPO_OWNER, clones_dir=CLONES_DIR):
+    """Create or update a blobless bare clone of the repo and return its path.
+
+    Only commits and trees are downloaded; file contents are never needed to
+    list the paths a commit touched.
+    """
+    clone_path = Path(clones_dir) / f"{repo_name}.git"
+    url = f"https://github.com/{owner}/{repo_name}.git"
+
+    if clone_path.exists():
+        print(f"🔄 Fetching {owner}/{repo_name} into {clone_path}")
+        fetched = run_git(['fetch', '--quiet', '--filter=blob:none', '--prune', 'origin',
+                           '+refs/heads/*:refs/heads/*'], cwd=clone_path)
+        if fetched is None:
+            return None
+    else:
+        print(f"📥 Cloning {owner}/{repo_name} (blobless) into {clone_path}")
+        clone_path.parent.mkdir(parents=True, exist_ok=True)
+        if run_git(['clone', '--quiet', '--bare', '--filter=blob:none', url, str(clone_path)]) is None:
+            return None
+    return clone_path
+
+
+def to_date(timestamp):
+    """Unix timestamp -> YYYY-MM-DD in UTC (same calendar date the GitHub API reports)."""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+@profiled
+def compute_folder_dates(repo_path, ref='HEAD'):
+    """Walk the history once and return {folder: {'first': date, 'last': date}}.
+
+    Folders are repo-relative ('MARL', 'MARL/IPPO', ...). Rename detection is
+    disabled so the blobless clone never has to fetch file contents.
+    """
+    output = run_git(['-c', 'core.quotePath=false', 'log', ref, '--no-renames', '--name-only',
+                      '--format=%x00%at'], cwd=repo_path)
+    if output is None:
+        return None
+
+    first_seen = {}
+    last_seen = {}
+    timestamp = None
+    for line in output.split('\n'):
+        if line.startswith(COMMIT_MARKER):
+            timestamp = int(line[1:])
+            continue
+        if not line or timestamp is None:
+            continue
+        parts = line.split('/')
+        # Credit every parent folder of the touched file
+        for depth in range(1, len(parts)):
+            folder = '/'.join(parts[:depth])
+            if folder not in first_seen or timestamp < first_seen[folder]:
+                first_seen[folder] = timestamp
+            if folder not in last_seen or timestamp > last_seen[folder]:
+                last_seen[folder] = timestamp
+
+    return {
+        folder: {'first': to_date(first_seen[folder]), 'last': to_date(last_seen[folder])}
+        for folder in sorted(first_seen)
+    }
+
+
+def load_folder_dates(repo_name, owner=REPO_OWNER):
+    """Clone/fetch the repo and compute dates for all of its folders (None on failure)."""
+    clone_path = ensure_clone(repo_name, owner)
+    if clone_path is None:
+        return None
+    dates = compute_folder_dates(clone_path)
+    if dates is not None:
+        print(f"🕰️  Computed commit dates for {len(dates)} folders of {owner}/{repo_name}")
+    return dates
+
+
+def lookup_folder(folder_dates, folder):
+    """Find a folder's dates, falling back to a case-insensitive match."""
+    if folder in folder_dates:
+        return folder_dates[folder]
+    folder_lower = folder.lower()
+    for name, dates in folder_dates.items():
+        if name.lower() == folder_lower:
+            return dates
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute folder commit dates from local git history')
+    parser.add_argument('repo', help='Repository name, e.g. Paper-Replications')
+    parser.add_argument('--owner', default=REPO_OWNER, help=f'Repository owner (default: {REPO_OWNER})')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+    args = parser.parse_args()
+
+    dates = load_folder_dates(args.repo, args.owner)
+    if dates is None:
+        return False
+
+    if args.json:
+        print(json.dumps(dates, indent=2, ensure_ascii=False))
+    else:
+        for folder, folder_dates in dates.items():
+            print(f"{folder_dates['first']}  {folder_dates['last']}  {folder}")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
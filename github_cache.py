@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk HTTP cache for every GitHub fetcher in this repo.
+
+Response bodies are stored under .cache/github/ keyed by URL together with the
+ETag / Last-Modified validators GitHub sent. The next request for the same URL
+is sent as a conditional request (If-None-Match / If-Modified-Since); a 304
+answer is served from disk and is not counted against the GitHub rate limit.
+
+The storage side only uses the standard library so that
+.github/scripts/update_stars.py (urllib, no extra packages in CI) can share it.
+
+Every request is also paced by the shared rate-limit scheduler
+(github_ratelimit.SCHEDULER), which retries secondary-limit 403/429 answers,
+and sent through the pooled client in github_client.py (timeouts, run
+deadline, 5xx/connection retries, request and byte counters).
+
+Usage:
+    from github_cache import cached_get, print_cache_report
+
+    response = cached_get(url, headers=headers)
+    ...
+    print_cache_report()
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+from pathlib import Path
+
+import github_client
+from github_ratelimit import SCHEDULER
+
+CACHE_DIR = Path(os.environ.get('GITHUB_CACHE_DIR', Path(__file__).parent / '.cache' / 'github'))
+
+# Response headers worth replaying when a body is served from disk
+STORED_HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Link']
+
+
+class HttpCache:
+    """URL-keyed body store with conditional-request validators and hit/miss counters."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        folder = self.cache_dir / key[:2]
+        return folder / f"{key}.json", folder / f"{key}.body"
+
+    def load(self, url):
+        """Return the cached entry for a URL (metadata plus body bytes) or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta['body'] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url:
+            return None
+        return meta
+
+    def conditional_headers(self, url):
+        """Validators to send with the next request for this URL."""
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, status, headers, body):
+        """Persist a 200 response that carries a validator; others are not worth keeping."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if status != 200 or not (etag or last_modified):
+            return
+        meta_path, body_path = self._paths(url)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            'url': url,
+            'status': status,
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': {name: headers[name] for name in STORED_HEADERS if headers.get(name)},
+        }
+        # Write body first and swap files in atomically so a crash never pairs old meta with a new body
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        body_tmp = body_path.with_name(body_path.name + suffix)
+        meta_tmp = meta_path.with_name(meta_path.name + suffix)
+        body_tmp.write_bytes(body)
+        with open(meta_tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(body_tmp, body_path)
+        os.replace(meta_tmp, meta_path)
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def report(self):
+        """Print the hit/miss summary for this run."""
+        total = self.hits + self.misses
+        if not total:
+            return
+        print(f"🗄️  HTTP cache: {self.hits} hits (304 revalidated), {self.misses} misses "
+              f"of {total} cacheable requests ({self.cache_dir})")
+
+
+CACHE = HttpCache()
+
+
+def _cached_response(entry, url):
+    """Rebuild a requests.Response from a cache entry."""
+    import requests
+
+    response = requests.models.Response()
+    response.status_code = entry.get('status', 200)
+    response._content = entry['body']
+    response.headers = requests.structures.CaseInsensitiveDict(entry.get('headers', {}))
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = url
+    response.from_cache = True
+    return response
+
+
+def cached_get(url, headers=None, params=None, cache=None, **kwargs):
+    """Drop-in for requests.get that revalidates against the on-disk cache.
+
+    A 304 answer is turned into a normal 200 response carrying the cached body,
+    so callers keep using .status_code / .json() / .text unchanged.
+    """
+    import requests
+
+    cache = cache or CACHE
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    request_headers = dict(headers or {})
+    entry = cache.load(full_url)
+    if entry:
+        request_headers.update(cache.conditional_headers(full_url))
+
+    attempt = 0
+    while True:
+        SCHEDULER.acquire(full_url)
+        response = github_client.get(full_url, headers=request_headers, **kwargs)
+        delay = SCHEDULER.observe(full_url, response.status_code, response.headers,
+                                  response.content, attempt)
+        if delay is None:
+            break
+        print(f"⏳ Rate limited ({response.status_code}) on {full_url}; retrying in {delay:.0f}s")
+        time.sleep(delay)
+        attempt += 1
+
+    if response.status_code == 304 and entry:
+        cache.record(hit=True)
+        return _cached_response(entry, full_url)
+
+    cache.record(hit=False)
+    cache.store(full_url, response.status_code, response.headers, response.content)
+    return response
+
+
+def cached_urlopen(request, timeout=None, cache=None):
+    """urllib counterpart of cached_get; returns the response body bytes.
+
+    HTTP errors other than 304 are re-raised exactly like urllib.request.urlopen.
+    """
+    cache = cache or CACHE
+    url = request.full_url
+    entry = cache.load(url)
+    if entry:
+        for name, value in cache.conditional_headers(url).items():
+            request.add_header(name, value)
+
+    attempt = 0
+    while True:
+        SCHEDULER.acquire(url)
+        try:
+            status, headers, body = github_client.urlopen(request, timeout=timeout)
+            SCHEDULER.observe(url, status, headers)
+            cache.record(hit=False)
+            cache.store(url, status, headers, body)
+            return body
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry:
+                SCHEDULER.observe(url, e.code, e.headers)
+                cache.record(hit=True)
+                return entry['body']
+            delay = SCHEDULER.observe(url, e.code, e.headers, e.read(), attempt)
+            if delay is None:
+                raise
+            print(f"⏳ Rate limited ({e.code}) on {url}; retrying in {delay:.0f}s")
+            time.sleep(delay)
+            attempt += 1
+
+
+def print_cache_report():
+    """Print the cache, rate limiter and HTTP client summaries (call at the end of a run)."""
+    CACHE.report()
+    SCHEDULER.report()
+    github_client.report()
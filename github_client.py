@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for every GitHub fetcher in this repo.
+
+- one pooled keep-alive requests.Session (GITHUB_POOL_SIZE connections per host)
+- a timeout on every request (GITHUB_REQUEST_TIMEOUT seconds)
+- an optional deadline for the whole run (GITHUB_RUN_DEADLINE seconds, or
+  set_run_deadline()); once it passes, requests fail immediately instead of
+  stalling CI
+- exponential-backoff retries on 5xx answers and connection errors
+- per-run request / retry / byte counters (report()); listeners appended to
+  STATS.listeners see every increment (profiler.py charges them to stages)
+- one place for the endpoints: GITHUB_API_URL, GITHUB_RAW_URL and
+  GITHUB_GRAPHQL_URL point every fetcher at another server, e.g. the local
+  stand-in in smolbenchmark/mock_github.py
+
+github_cache.cached_get / cached_urlopen send everything through here, so
+scripts normally never call this module directly apart from github_headers().
+The urllib variant (urlopen) keeps .github/scripts/update_stars.py free of
+third-party packages; it gets the same timeouts, retries and counters but no
+connection pooling.
+"""
+
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from profiler import span
+
+POOL_SIZE = int(os.environ.get('GITHUB_POOL_SIZE', 10))
+REQUEST_TIMEOUT = float(os.environ.get('GITHUB_REQUEST_TIMEOUT', 30))
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0     # seconds; doubles on every retry
+BACKOFF_MAX = 30.0
+RETRY_STATUSES = {500, 502, 503, 504}
+USER_AGENT = 'SmolHub-Website'
+API_URL = os.environ.get('GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+RAW_URL = os.environ.get('GITHUB_RAW_URL', 'https://raw.githubusercontent.com').rstrip('/')
+GRAPHQL_URL = os.environ.get('GITHUB_GRAPHQL_URL', f"{API_URL}/graphql")
+
+
+class ClientStats:
+    """Per-run request counters."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes = 0
+        self.listeners = []
+        self._lock = threading.Lock()
+
+    def add(self, requests=0, retries=0, errors=0, nbytes=0):
+        with self._lock:
+            self.requests += requests
+            self.retries += retries
+            self.errors += errors
+            self.bytes += nbytes
+        if requests or nbytes:
+            for listener in self.listeners:
+                listener(requests, nbytes)
+
+
+STATS = ClientStats()
+_session = None
+_session_lock = threading.Lock()
+_run_deadline = None
+
+
+def set_run_deadline(seconds):
+    """Fail every request issued more than `seconds` from now (None disables the deadline)."""
+    global _run_deadline
+    _run_deadline = time.monotonic() + seconds if seconds else None
+
+
+set_run_deadline(float(os.environ.get('GITHUB_RUN_DEADLINE', 0)))
+
+
+def _time_left():
+    """Seconds until the run deadline, or None when there is no deadline."""
+    if _run_deadline is None:
+        return None
+    return _run_deadline - time.monotonic()
+
+
+def _timeout(requested):
+    """Per-request timeout, shortened so it never runs past the run deadline."""
+    timeout = requested or REQUEST_TIMEOUT
+    left = _time_left()
+    if left is not None:
+        timeout = min(timeout, max(left, 0.1))
+    return timeout
+
+
+def _backoff(attempt):
+    """Sleep before retry `attempt`; returns False when the run deadline leaves no room."""
+    delay = min(BACKOFF_BASE * (2 ** attempt), BACKOFF_MAX)
+    left = _time_left()
+    if left is not None and left <= delay:
+        return False
+    time.sleep(delay)
+    return True
+
+
+def github_headers(token=None, accept='application/vnd.github.v3+json'):
+    """Standard request headers for the GitHub API (token optional)."""
+    headers = {'Accept': accept, 'User-Agent': USER_AGENT}
+    if token:
+        headers['Authorization'] = f'token {token}'
+    return headers
+
+
+def get_session():
+    """The shared keep-alive session, created on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['User-Agent'] = USER_AGENT
+            _session = session
+        return _session
+
+
+def request(method, url, timeout=None, **kwargs):
+    """Session request with timeouts, the run deadline and 5xx/connection retries.
+
+    Raises requests.exceptions.Timeout once the run deadline has passed, so
+    existing `except requests.exceptions.RequestException` handlers apply.
+    """
+    with span(f"HTTP {method}", url=url):
+        return _request(method, url, timeout, **kwargs)
+
+
+def _request(method, url, timeout, **kwargs):
+    import requests
+
+    session = get_session()
+    attempt = 0
+    while True:
+        left = _time_left()
+        if left is not None and left <= 0:
+            STATS.add(errors=1)
+            raise requests.exceptions.Timeout(f"Run deadline exceeded before requesting {url}")
+        try:
+            response = session.request(method, url, timeout=_timeout(timeout), **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            STATS.add(requests=1)
+            if attempt < MAX_RETRIES and _backoff(attempt):
+                print(f"🔁 {e.__class__.__name__} on {url}; retry {attempt + 1}/{MAX_RETRIES}")
+                STATS.add(retries=1)
+                attempt += 1
+                continue
+            STATS.add(errors=1)
+            raise
+        # Streamed bodies are counted by whoever consumes them
+        STATS.add(requests=1, nbytes=0 if kwargs.get('stream') else len(response.content))
+        if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES and _backoff(attempt):
+            print(f"🔁 HTTP {response.status_code} on {url}; retry {attempt + 1}/{MAX_RETRIES}")
+            response.close()
+            STATS.add(retries=1)
+            attempt += 1
+            continue
+        return response
+
+
+def get(url, **kwargs):
+    """Drop-in for requests.get through the shared session."""
+    return request('GET', url, **kwargs)
+
+
+def urlopen(req, timeout=None):
+    """urllib counterpart of request(); returns (status, headers, body bytes).
+
+    HTTP errors that are not retried are re-raised as urllib.error.HTTPError.
+    """
+    with span(f"HTTP {req.get_method()}", url=req.full_url):
+        return _urlopen(req, timeout)
+
+
+def _urlopen(req, timeout):
+    attempt = 0
+    while True:
+        left = _time_left()
+        if left is not None and left <= 0:
+            STATS.add(errors=1)
+            raise urllib.error.URLError(f"Run deadline exceeded before requesting {req.full_url}")
+        try:
+            with urllib.request.urlopen(req, timeout=_timeout(timeout)) as resp:
+                body = resp.read()
+                STATS.add(requests=1, nbytes=len(body))
+                return resp.status, resp.headers, body
+        except urllib.error.HTTPError as e:
+            STATS.add(requests=1)
+            if e.code in RETRY_STATUSES and attempt < MAX_RETRIES and _backoff(attempt):
+                print(f"🔁 HTTP {e.code} on {req.full_url}; retry {attempt + 1}/{MAX_RETRIES}")
+                STATS.add(retries=1)
+                attempt += 1
+                continue
+            raise
+        except (urllib.error.URLError, OSError) as e:
+            STATS.add(requests=1)
+            if attempt < MAX_RETRIES and _backoff(attempt):
+                print(f"🔁 {e.__class__.__name__} on {req.full_url}; retry {attempt + 1}/{MAX_RETRIES}")
+                STATS.add(retries=1)
+                attempt += 1
+                continue
+            STATS.add(errors=1)
+            raise
+
+
+def report():
+    """Print request/byte counts for this run."""
+    if not STATS.requests:
+        return
+    print(f"🌐 HTTP client: {STATS.requests} requests, {STATS.retries} retries, "
+          f"{STATS.errors} failures, {STATS.bytes / 1024:.1f} KiB received")
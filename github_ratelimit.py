@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Shared rate-limit-aware request scheduler for every GitHub fetcher in this repo.
+
+Instead of fixed sleeps between requests, each host gets a token bucket whose
+refill rate follows the budget GitHub reports in X-RateLimit-Remaining /
+X-RateLimit-Reset:
+
+- plenty of budget left  -> requests go out at up to MAX_RATE per second
+- budget running low     -> the rest of the budget is spread over the time
+                            left until the reset (never slower than MIN_RATE)
+- budget exhausted       -> wait for the reset (up to MAX_WAIT seconds)
+
+Secondary-limit 403 / 429 answers are retried after Retry-After (or an
+exponential backoff when GitHub does not send one).
+
+Only the standard library is used so .github/scripts/update_stars.py can share
+it. github_cache.cached_get / cached_urlopen call acquire() and observe()
+around every request; scripts only need to read the budget:
+
+    from github_ratelimit import SCHEDULER
+
+    budget = SCHEDULER.budget('https://api.github.com/')
+    if budget['remaining'] is not None and budget['remaining'] < needed: ...
+    if SCHEDULER.exhausted('https://api.github.com/'): stop early
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+MAX_RATE = float(os.environ.get('GITHUB_MAX_RATE', 10))   # requests/second with a healthy budget
+MIN_RATE = 0.2        # slowest pacing while the budget runs low
+BURST = 10            # requests allowed back to back
+LOW_WATER = 0.1       # start pacing below this fraction of the limit
+MAX_WAIT = float(os.environ.get('GITHUB_MAX_WAIT', 300))  # longest single wait before giving up
+MAX_RETRIES = 3
+SECONDARY_BACKOFF = 60  # GitHub asks for at least a minute without Retry-After
+
+
+class TokenBucket:
+    """Classic token bucket; reserve() returns how long the caller must sleep."""
+
+    def __init__(self, rate=MAX_RATE, capacity=BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now=None):
+        """Take one token (possibly going into debt) and return the wait in seconds."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def set_rate(self, rate, now=None):
+        self._refill(time.monotonic() if now is None else now)
+        self.rate = rate
+
+
+class HostState:
+    """Budget last reported by one host plus its token bucket."""
+
+    def __init__(self):
+        self.bucket = TokenBucket()
+        self.limit = None
+        self.remaining = None
+        self.reset = None          # epoch seconds
+        self.blocked_until = 0.0   # epoch seconds; set by exhausted budget / secondary limits
+
+
+class RateLimitScheduler:
+    """Per-host token buckets driven by GitHub's rate-limit headers."""
+
+    def __init__(self):
+        self.hosts = {}
+        self.requests = 0
+        self.waited = 0.0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def _host(self, url):
+        host = urlsplit(url).netloc.lower()
+        if host not in self.hosts:
+            self.hosts[host] = HostState()
+        return self.hosts[host]
+
+    def acquire(self, url):
+        """Block until a request to this URL's host may be sent."""
+        with self._lock:
+            state = self._host(url)
+            now = time.time()
+            wait = state.bucket.reserve()
+            if state.blocked_until > now:
+                wait = max(wait, state.blocked_until - now)
+            self.requests += 1
+        if wait > MAX_WAIT:
+            # Budget cannot come back in time; send anyway and let the caller see GitHub's error
+            print(f"⚠️  Rate limit for {urlsplit(url).netloc} resets in {wait:.0f}s (> {MAX_WAIT:.0f}s); not waiting")
+            return
+        if wait > 0:
+            if wait >= 1:
+                print(f"⏳ Rate limit: waiting {wait:.1f}s for {urlsplit(url).netloc}")
+            with self._lock:
+                self.waited += wait
+            time.sleep(wait)
+
+    def observe(self, url, status, headers, body=b'', attempt=0):
+        """Record a response's rate-limit headers.
+
+        Returns the number of seconds to wait before retrying when the response
+        was a rate-limit rejection worth retrying, otherwise None.
+        """
+        now = time.time()
+        with self._lock:
+            state = self._host(url)
+            limit = _int_header(headers, 'X-RateLimit-Limit')
+            remaining = _int_header(headers, 'X-RateLimit-Remaining')
+            reset = _int_header(headers, 'X-RateLimit-Reset')
+            if limit is not None:
+                state.limit = limit
+            if remaining is not None:
+                state.remaining = remaining
+            if reset is not None:
+                state.reset = reset
+            self._adapt(state, now)
+
+            if not _is_rate_limited(status, headers, body, remaining):
+                return None
+
+            retry_after = _int_header(headers, 'Retry-After')
+            if retry_after is not None:
+                delay = retry_after
+            elif remaining == 0 and state.reset:
+                delay = max(state.reset - now, 0) + 1
+            else:
+                delay = SECONDARY_BACKOFF * (2 ** attempt)
+            state.blocked_until = max(state.blocked_until, now + delay)
+
+            if attempt >= MAX_RETRIES or delay > MAX_WAIT:
+                return None
+            self.retries += 1
+            return delay
+
+    def _adapt(self, state, now):
+        """Pick the bucket rate from the reported budget."""
+        if state.remaining is None:
+            return
+        if state.remaining <= 0:
+            if state.reset and state.reset > now:
+                state.blocked_until = max(state.blocked_until, state.reset + 1)
+            return
+        low_water = (state.limit or 0) * LOW_WATER
+        if state.remaining > low_water:
+            rate = MAX_RATE
+        else:
+            window = max((state.reset or now) - now, 1)
+            rate = max(min(state.remaining / window, MAX_RATE), MIN_RATE)
+        state.bucket.set_rate(rate)
+
+    def budget(self, url):
+        """Remaining budget last reported for this URL's host.
+
+        Returns {'limit', 'remaining', 'reset'}; values are None until the host
+        has answered at least once.
+        """
+        with self._lock:
+            state = self._host(url)
+            return {'limit': state.limit, 'remaining': state.remaining, 'reset': state.reset}
+
+    def exhausted(self, url):
+        """True when the host's budget is used up and will not reset within MAX_WAIT."""
+        budget = self.budget(url)
+        if budget['remaining'] != 0:
+            return False
+        return (budget['reset'] or 0) - time.time() > MAX_WAIT
+
+    def report(self):
+        """Print request/wait counts and the budget left per host."""
+        if not self.requests:
+            return
+        print(f"🚦 Rate limiter: {self.requests} requests, {self.retries} retries, "
+              f"{self.waited:.1f}s spent waiting")
+        for host, state in sorted(self.hosts.items()):
+            if state.remaining is not None:
+                print(f"   {host}: {state.remaining}/{state.limit} remaining")
+
+
+def _int_header(headers, name):
+    value = headers.get(name) if headers is not None else None
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _is_rate_limited(status, headers, body, remaining):
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    if remaining == 0 or headers.get('Retry-After') is not None:
+        return True
+    return b'rate limit' in (body or b'')[:2000].lower()
+
+
+SCHEDULER = RateLimitScheduler()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Shared link and image rewriting for the markdown generators.
+
+Every generator used to carry its own copy of this: refresh_rl and
+add_rl_item made four full re.sub passes per README (images, links, src=,
+href=) with patterns compiled on every call, and the five
+convert_images_to_links variants added passes of their own. None of them
+knew about code, so a README that documented `![x](y)` or `src="..."`
+inside a fenced block had its example rewritten.
+
+Here one precompiled pattern tokenizes a README in a single left-to-right
+scan into:
+
+    fence   ``` / ~~~ fenced code blocks (an unclosed fence runs to the end)
+    code    `inline code` spans
+    image   ![alt](url "title")
+    link    [text](url "title"), including [![badge](img)](url)
+    tag     <img src=...>, <a href=...> and other HTML tags
+
+and rewrite_links() calls back only for the token kinds a caller cares
+about, copying everything else (code in particular) through untouched.
+
+Usage:
+    from link_rewriter import absolutize_links, images_to_links
+
+    absolutize_links(readme, "https://raw.githubusercontent.com/owner/repo/master", "PPO/Atari")
+    images_to_links(readme, raw_base_url)
+
+    python link_rewriter.py bench                  # single scan vs. the old multi-pass rewrite
+    python link_rewriter.py bench --size-kb 2048 --repeat 5
+"""
+
+import argparse
+import posixpath
+import re
+import sys
+import time
+
+TOKEN_RE = re.compile(r'''
+    (?=[`~!\[<])                           # every token starts with one of these
+    (?:
+        (?P<fence>(?:^|(?<=\n[ ])|(?<=\n[ ]{2})|(?<=\n[ ]{3}))(?P<fchar>`{3,}|~{3,})[^\n]*
+            (?:\n.*?)??
+            (?:\n[ ]{0,3}(?P=fchar)[`~]*[ \t]*(?=\n|\Z)|\Z))
+      | (?P<code>(?<!`)(?P<ticks>`+)(?!`)              # a whole backtick run opens the span
+            [^`\n]*(?:(?:\n(?![ \t]*\n)                # which may wrap, but not across a blank line,
+                       |(?!(?P=ticks)(?!`))`+(?!`))   # may hold runs of any other length
+                    [^`\n]*)*
+            (?P=ticks)(?!`))                          # and closes at the first run of the same length
+      | (?P<image>!\[(?P<alt>[^\]]*)\]\((?P<idest>[^)]*)\))
+      | (?P<link>\[(?P<text>(?:[^\[\]]|!\[[^\]]*\]\([^)]*\))+)\]\((?P<ldest>[^)]*)\))
+      | (?P<tag><(?P<tagname>[a-zA-Z][\w-]*)\b[^>]*>)
+    )
+''', re.MULTILINE | re.DOTALL | re.VERBOSE)
+
+# url plus an optional "title", as in (img.png "Loss curve")
+DEST_RE = re.compile(r'(\S+)(\s+"[^"]*")?')
+ATTR_RE = re.compile(r'''(\b(?:src|href)=)(["'])(.*?)\2''', re.IGNORECASE)
+ABSOLUTE_RE = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//|#)')
+WHITESPACE_RE = re.compile(r'\s')
+
+IMAGE_EXTENSIONS = ('jpg', 'jpeg', 'png', 'gif', 'svg')
+WEB_IMAGE_EXTENSIONS = IMAGE_EXTENSIONS + ('webp',)
+
+
+def split_destination(dest):
+    """(url, title) of a link destination; title keeps its leading space, '' when absent."""
+    match = DEST_RE.fullmatch(dest)
+    if not match:
+        return dest, ''
+    return match.group(1), match.group(2) or ''
+
+
+def is_absolute(url):
+    """True for scheme URLs (https:, mailto:, data:), protocol-relative // and #anchors."""
+    return bool(ABSOLUTE_RE.match(url))
+
+
+def has_extension(url, extensions, ignore_case=False):
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    if ignore_case:
+        path = path.lower()
+    return path.endswith(tuple(f".{ext}" for ext in extensions))
+
+
+def rewrite_links(text, on_image=None, on_link=None, on_attr=None, on_text=None):
+    """Rewrite markdown in one scan, leaving fenced blocks and code spans alone.
+
+    on_image(alt, url, title) and on_link(text, url, title) return the
+    replacement markdown for the whole token, or None to keep it.
+    on_attr(tag, attr, url) returns a new src/href value or None.
+    on_text(segment) rewrites the plain text between tokens (not link text).
+    A link's text is rewritten first, so images inside badges are seen too.
+    """
+    if not text:
+        return text
+    out = []
+    pos = 0
+    for match in TOKEN_RE.finditer(text):
+        start = match.start()
+        if start > pos:
+            segment = text[pos:start]
+            out.append(on_text(segment) if on_text else segment)
+        pos = match.end()
+        kind = match.lastgroup
+        token = match.group(0)
+
+        if kind == 'image' and on_image:
+            url, title = split_destination(match.group('idest'))
+            replacement = on_image(match.group('alt'), url, title)
+            if replacement is not None:
+                token = replacement
+        elif kind == 'link' and (on_link or on_image or on_attr):
+            inner = match.group('text')
+            new_inner = inner
+            if '![' in inner or '<' in inner:
+                new_inner = rewrite_links(inner, on_image, on_link, on_attr)
+            url, title = split_destination(match.group('ldest'))
+            replacement = on_link(new_inner, url, title) if on_link else None
+            if replacement is not None:
+                token = replacement
+            elif new_inner != inner:
+                token = f"[{new_inner}]({match.group('ldest')})"
+        elif kind == 'tag' and on_attr:
+            tag = match.group('tagname').lower()
+
+            def replace_attr(attr_match):
+                new_url = on_attr(tag, attr_match.group(1)[:-1].lower(), attr_match.group(3))
+                if new_url is None:
+                    return attr_match.group(0)
+                quote = attr_match.group(2)
+                return f"{attr_match.group(1)}{quote}{new_url}{quote}"
+
+            token = ATTR_RE.sub(replace_attr, token)
+        out.append(token)
+
+    if pos < len(text):
+        segment = text[pos:]
+        out.append(on_text(segment) if on_text else segment)
+    return ''.join(out)
+
+
+def rewrite_urls(text, to_url):
+    """Apply to_url(url) -> url to every image, link and HTML src/href outside code."""
+    def on_image(alt, url, title):
+        new_url = to_url(url)
+        return None if new_url == url else f"![{alt}]({new_url}{title})"
+
+    def on_link(link_text, url, title):
+        return f"[{link_text}]({to_url(url)}{title})"
+
+    def on_attr(tag, attr, url):
+        new_url = to_url(url.strip())
+        return None if new_url == url else new_url
+
+    return rewrite_links(text, on_image, on_link, on_attr)
+
+
+def absolutizer(raw_base_url, base_path=''):
+    """url -> absolute URL under raw_base_url, resolving relative paths against base_path."""
+    raw_base_url = raw_base_url.rstrip('/')
+    seen = {}  # READMEs repeat the same few paths; resolve each once
+
+    def to_absolute(url):
+        if url in seen:
+            return seen[url]
+        if not url or is_absolute(url) or WHITESPACE_RE.search(url):
+            resolved_url = url
+        else:
+            if url.startswith('/'):
+                resolved = url.lstrip('/')
+            else:
+                # Join with the folder that the README belongs to
+                joined = posixpath.join(base_path, url) if base_path else url
+                resolved = posixpath.normpath(joined)
+            resolved_url = f"{raw_base_url}/{resolved}"
+        seen[url] = resolved_url
+        return resolved_url
+
+    return to_absolute
+
+
+def absolutize_links(text, raw_base_url, base_path=''):
+    """Point relative markdown and HTML links/images of a README at raw_base_url.
+
+    Absolute, mailto: and #anchor links are left unchanged.
+    """
+    return rewrite_urls(text, absolutizer(raw_base_url, base_path))
+
+
+def raw_base_url_for(github_url):
+    """raw.githubusercontent.com base for a github.com/<owner>/<repo>/tree/<branch>/... URL."""
+    return (
+        github_url
+        .replace('https://github.com/', 'https://raw.githubusercontent.com/')
+        .replace('/tree/master/', '/master/')
+        .replace('/tree/main/', '/main/')
+    )
+
+
+def image_link_text(alt_text):
+    """Link text for an image that is turned into a link."""
+    alt_lower = alt_text.lower()
+    if 'loss' in alt_lower:
+        return "📊 View Training Loss Curves"
+    elif 'train' in alt_lower and 'val' in alt_lower:
+        return "📈 View Train and Validation Loss"
+    elif 'result' in alt_lower:
+        return "🖼️ View Results"
+    elif 'sample' in alt_lower:
+        return "🎨 View Generated Samples"
+    elif 'architecture' in alt_lower:
+        return "🏗️ View Model Architecture"
+    elif 'output' in alt_lower:
+        return "📋 View Model Output"
+    elif 'arithmetic' in alt_lower:
+        return "🔢 View Latent Arithmetic"
+    return f"🔗 View {alt_text}"
+
+
+def images_to_links(text, raw_base_url, extensions=IMAGE_EXTENSIONS, on_attr=None):
+    """Replace image embeds with links to the files under raw_base_url.
+
+    Model pages link to their figures instead of embedding them; absolute
+    image URLs are linked as they are. on_attr is passed to rewrite_links
+    so HTML tags can be handled in the same scan.
+    """
+    def on_image(alt, url, title):
+        if not has_extension(url, extensions):
+            return None
+        image_url = url if is_absolute(url) else f"{raw_base_url}/{url}"
+        return f"[{image_link_text(alt)}]({image_url})"
+
+    return rewrite_links(text, on_image=on_image, on_attr=on_attr)
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmark
+
+
+def _multipass_reference(markdown_text, raw_base_url, base_path):
+    """The previous refresh_rl/add_rl_item algorithm: four re.sub passes, compiled per call."""
+    def to_absolute(url):
+        url = url.strip()
+        if re.match(r"^(?:https?:)?//", url) or url.startswith("mailto:") or url.startswith("#"):
+            return url
+        if url.startswith('/'):
+            return f"{raw_base_url}/{url.lstrip('/')}"
+        return f"{raw_base_url}/{posixpath.normpath(posixpath.join(base_path, url) if base_path else url)}"
+
+    md_image_pattern = re.compile(r"!\[([^\]]*)\]\(([^\)\s]+)(\s+\"[^\"]*\")?\)")
+    md_link_pattern = re.compile(r"(?<!\!)\[([^\]]+)\]\(([^\)\s]+)(\s+\"[^\"]*\")?\)")
+    html_src_pattern = re.compile(r"(src=\")([^\"]+)(\")", re.IGNORECASE)
+    html_href_pattern = re.compile(r"(href=\")([^\"]+)(\")", re.IGNORECASE)
+    updated = md_image_pattern.sub(lambda m: f"![{m.group(1)}]({to_absolute(m.group(2))}{m.group(3) or ''})", markdown_text)
+    updated = md_link_pattern.sub(lambda m: f"[{m.group(1)}]({to_absolute(m.group(2))}{m.group(3) or ''})", updated)
+    updated = html_src_pattern.sub(lambda m: f"{m.group(1)}{to_absolute(m.group(2))}{m.group(3)}", updated)
+    return html_href_pattern.sub(lambda m: f"{m.group(1)}{to_absolute(m.group(2))}{m.group(3)}", updated)
+
+
+def synthetic_readme(size_kb):
+    """A README of roughly size_kb KB mixing prose, links, images, HTML and code."""
+    section = (
+        "## Results\n\n"
+        "Training follows the [paper](https://arxiv.org/abs/1707.06347) with the settings in "
+        "[config](configs/train.yaml \"Config\") and [notes](../docs/NOTES.md).\n\n"
+        "![Loss curve](images/loss.png)\n"
+        "[![badge](https://img.shields.io/badge/x-y-green)](LICENSE)\n\n"
+        "<p align=\"center\"><img src=\"images/demo.gif\" width=\"400\"> "
+        "<a href=\"results/eval.md\">eval</a></p>\n\n"
+        "Run it with `python train.py --env CartPole-v1` and compare with ![ref](/assets/ref.jpg).\n\n"
+        "```python\n# README example: ![not an image](x.png) and <img src=\"y.png\">\n"
+        "for step in range(1000):\n    loss = update(batch)\n```\n\n"
+        + "Plain prose without any markup, just to pad the section out to a realistic length. " * 6
+        + "\n\n"
+    )
+    return section * max(1, (size_kb * 1024) // len(section))
+
+
+def bench(size_kb=512, repeat=10):
+    text = synthetic_readme(size_kb)
+    raw_base_url = "https://raw.githubusercontent.com/owner/repo/master"
+    base_path = "PPO/Atari"
+    print(f"⏱️  {len(text) / 1024:.0f} KB README, best of {repeat}")
+
+    results = {}
+    for name, func in (('multi-pass (old)', _multipass_reference), ('single scan', absolutize_links)):
+        best = float('inf')
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            func(text, raw_base_url, base_path)
+            best = min(best, time.perf_counter() - t0)
+        results[name] = best
+        print(f"   {name:<18}{best * 1000:>9.1f} ms  {len(text) / 1024 / 1024 / best:>7.1f} MB/s")
+
+    old, new = results['multi-pass (old)'], results['single scan']
+    print(f"   speed-up: {old / new:.2f}x")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared markdown link rewriter')
+    sub = parser.add_subparsers(dest='command', required=True)
+    bench_parser = sub.add_parser('bench', help='Time the single-scan rewriter against the old multi-pass one')
+    bench_parser.add_argument('--size-kb', type=int, default=512, help='Size of the synthetic README (default: 512)')
+    bench_parser.add_argument('--repeat', type=int, default=10, help='Runs per implementation; the best is reported')
+    args = parser.parse_args()
+    return bench(args.size_kb, args.repeat)
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Compact listing indexes for the collection pages.
+
+The catalogs in _data/ (rl.json, datasets.json, models.json) reference the
+full README of every entry (see readme_store.py). Listing pages only need what
+the cards and filters show, so the generators also write a slim index per
+collection:
+
+    _data/listings/<kind>.json    -> site.data.listings.<kind>
+
+holding name, display name, category/tags, environment, framework, format,
+date, stars, URL and a short plain-text excerpt. With a chunk size, items are
+also split into static pages under assets/data/listings/<kind>-<n>.json and
+the _data index embeds only the first page plus the URLs of the rest, so a
+listing page can paginate without ever loading the full catalog.
+
+Usage:
+    from listing_index import write_listing_index
+
+    write_listing_index('rl', implementations, chunk_size=24)
+
+    python listing_index.py                  # rebuild all indexes from _data
+    python listing_index.py rl --chunk-size 24
+"""
+
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+
+from atomic_writer import write_if_changed
+from readme_store import readme_of
+
+BASE_PATH = Path(__file__).parent
+LISTINGS_DIR = BASE_PATH / "_data" / "listings"
+CHUNKS_DIR = BASE_PATH / "assets" / "data" / "listings"
+CHUNKS_URL = "/assets/data/listings"
+EXCERPT_LENGTH = 160
+DEFAULT_CHUNK_SIZE = int(os.environ.get('LISTING_CHUNK_SIZE', 0)) or None
+
+# Card/filter fields copied as-is when an entry has them
+CARD_FIELDS = ['name', 'display_name', 'path', 'category', 'categories', 'tags', 'tasks',
+               'environment', 'framework', 'format', 'size', 'stars']
+
+# kind -> (catalog file, key holding the entries, excerpt source)
+CATALOGS = {
+    'rl': ('rl.json', 'rl_implementations', 'readme'),
+    'datasets': ('datasets.json', 'datasets', 'description'),
+    'models': ('models.json', 'models', 'readme'),
+}
+
+
+def make_excerpt(text, limit=EXCERPT_LENGTH):
+    """Plain-text excerpt of markdown: no headings, images, HTML or link targets."""
+    if not text:
+        return ""
+    text = re.sub(r'```.*?```', ' ', text, flags=re.DOTALL)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = re.sub(r'!\[[^\]]*\]\([^)]*\)', ' ', text)
+    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = re.sub(r'^\s*(#+|[-*+>|]|\d+\.)\s*', '', text, flags=re.MULTILINE)
+    text = re.sub(r'[*_`|]+', '', text)
+    # Skip a leading title line that is just the heading text
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    if len(lines) > 1 and len(lines[0]) < 60:
+        lines = lines[1:]
+    text = re.sub(r'\s+', ' ', ' '.join(lines)).strip()
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(' ', 1)[0]
+    return cut.rstrip(',.;:') + '…'
+
+
+def listing_item(entry, excerpt_from='readme'):
+    """Slim card entry for one catalog entry."""
+    item = {field: entry[field] for field in CARD_FIELDS if entry.get(field) not in (None, '', [])}
+    item['date'] = entry.get('github_date') or entry.get('created_date') or entry.get('date')
+    item['url'] = entry.get('github_url')
+    if excerpt_from == 'readme':
+        excerpt = make_excerpt(readme_of(entry)) or make_excerpt(entry.get('description'))
+    else:
+        excerpt = make_excerpt(entry.get('description')) or make_excerpt(readme_of(entry))
+    item['excerpt'] = excerpt
+    return item
+
+
+def _write_if_changed(path, data):
+    text = json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+    return write_if_changed(path, text) != 'unchanged'
+
+
+def previous_stars(kind):
+    """{url: stars} from the current index files; update_stars keeps these fresh."""
+    stars = {}
+    for path in [LISTINGS_DIR / f"{kind}.json", *sorted(CHUNKS_DIR.glob(f"{kind}-*.json"))]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                items = json.load(f).get('items', [])
+        except (OSError, ValueError):
+            continue
+        for item in items:
+            if item.get('url') and item.get('stars') is not None:
+                stars[item['url']] = item['stars']
+    return stars
+
+
+def write_listing_index(kind, entries, chunk_size=DEFAULT_CHUNK_SIZE, excerpt_from=None):
+    """Write _data/listings/<kind>.json (and its chunk pages); returns the index path.
+
+    Files are only rewritten when their content changes, and chunk pages left
+    over from a larger previous index are removed. Star counts written by
+    .github/scripts/update_stars.py are carried over.
+    """
+    if excerpt_from is None:
+        excerpt_from = CATALOGS.get(kind, (None, None, 'readme'))[2]
+    stars = previous_stars(kind)
+    items = [listing_item(entry, excerpt_from) for entry in entries]
+    for item in items:
+        if 'stars' not in item and item['url'] in stars:
+            item['stars'] = stars[item['url']]
+
+    chunk_paths = []
+    if chunk_size and len(items) > chunk_size:
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        for number, chunk in enumerate(chunks, 1):
+            chunk_path = CHUNKS_DIR / f"{kind}-{number}.json"
+            _write_if_changed(chunk_path, {'kind': kind, 'page': number, 'items': chunk})
+            chunk_paths.append(chunk_path)
+        first_items = chunks[0]
+    else:
+        first_items = items
+
+    for stale in CHUNKS_DIR.glob(f"{kind}-*.json"):
+        if stale not in chunk_paths:
+            stale.unlink()
+
+    index = {
+        'kind': kind,
+        'total': len(items),
+        'chunk_size': chunk_size if chunk_paths else None,
+        'pages': [f"{CHUNKS_URL}/{path.name}" for path in chunk_paths],
+        'items': first_items,
+    }
+    index_path = LISTINGS_DIR / f"{kind}.json"
+    changed = _write_if_changed(index_path, index)
+    status = "written" if changed else "unchanged"
+    print(f"🗂️  Listing index {index_path.relative_to(BASE_PATH)}: {len(items)} items, "
+          f"{max(len(chunk_paths), 1)} page(s) ({status})")
+    return index_path
+
+
+def load_catalog_entries(kind):
+    """Entries of a _data catalog for a listing kind."""
+    filename, key, _ = CATALOGS[kind]
+    with open(BASE_PATH / "_data" / filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get(key, []) if isinstance(data, dict) else data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the slim listing indexes from the _data catalogs')
+    parser.add_argument('kinds', nargs='*', metavar='KIND',
+                        help=f"Collections to index: {', '.join(CATALOGS)} (default: all)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Split items into static pages of this many entries (default: LISTING_CHUNK_SIZE)')
+    args = parser.parse_args()
+
+    unknown = [kind for kind in args.kinds if kind not in CATALOGS]
+    if unknown:
+        parser.error(f"unknown collection(s): {', '.join(unknown)}")
+    for kind in args.kinds or CATALOGS:
+        write_listing_index(kind, load_catalog_entries(kind), args.chunk_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Fused post-processing for the generated markdown collections.
+
+The post-processing scripts (standardize_markdowns, fix_image_links,
+fix_images_direct, convert_images_to_links, fix_tables, fix_models) each
+globbed the collection, read every file, ran their regexes and wrote it
+back. Their transforms are now passes over an in-memory document, and one
+sweep applies any sequence of them: every file is read once and written at
+most once, only when the passes changed it.
+
+A pass is a function pass(content, doc) -> content, defined next to the
+script it came from; doc carries the path, the text as read and a per-run
+context dict for data a pass loads once (e.g. models.json).
+
+Usage:
+    from markdown_pipeline import run_pipeline
+    run_pipeline(['_models'], ['fix_images_direct', 'fix_tables'])
+
+    python markdown_pipeline.py                                  # all passes over _models
+    python markdown_pipeline.py _models _rl --passes fix_tables,fix_image_links --dry-run
+"""
+
+import argparse
+import importlib
+import sys
+import time
+from pathlib import Path
+
+from atomic_writer import write_atomic
+
+# Pass name -> (module, function), in the order the scripts are usually run
+PASSES = {
+    'standardize': ('standardize_markdowns', 'standardize_pass'),
+    'fix_image_links': ('fix_image_links', 'fix_image_links_pass'),
+    'fix_images_direct': ('fix_images_direct', 'images_to_links_pass'),
+    'convert_images_to_links': ('convert_images_to_links', 'convert_images_pass'),
+    'fix_tables': ('fix_tables', 'fix_tables_pass'),
+    'fix_models': ('fix_models', 'fix_models_pass'),
+}
+DEFAULT_PATHS = ['_models']
+
+
+class Document:
+    """One markdown file going through the passes."""
+
+    def __init__(self, path, text, context):
+        self.path = Path(path)
+        self.original = text
+        self.context = context
+
+
+class PassStats:
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.changed = 0
+        self.errors = 0
+
+
+def get_pass(name):
+    """Resolve a pass name to its function (imported on first use)."""
+    if name not in PASSES:
+        raise KeyError(f"unknown pass: {name} (known: {', '.join(PASSES)})")
+    module_name, func_name = PASSES[name]
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def collect_files(paths, recursive=False):
+    """Markdown files under the given files/directories, sorted and de-duplicated."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(path.rglob('*.md') if recursive else path.glob('*.md'))
+        elif path.is_file():
+            files.append(path)
+        else:
+            print(f"Skipping non-existent path: {path}")
+    return sorted(set(files))
+
+
+def run_pipeline(paths, pass_names=None, recursive=False, dry_run=False, verbose=False, context=None):
+    """Apply passes to every file in one read/transform/write sweep; returns the changed paths.
+
+    A pass that raises on a file is reported and skipped for that file; the
+    other passes still run. `context` seeds the shared per-run dict passes
+    cache loaded data in.
+    """
+    pass_names = list(pass_names or PASSES)
+    passes = [(name, get_pass(name)) for name in pass_names]
+    stats = {name: PassStats(name) for name in pass_names}
+    context = {} if context is None else context
+    files = collect_files(paths, recursive)
+    changed_paths = []
+    reads = writes = 0
+    started = time.perf_counter()
+
+    for path in files:
+        try:
+            text = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Could not read {path}: {e}")
+            continue
+        reads += 1
+        doc = Document(path, text, context)
+        for name, func in passes:
+            t0 = time.perf_counter()
+            try:
+                new_text = func(text, doc)
+            except Exception as e:
+                stats[name].errors += 1
+                print(f"❌ {name} failed on {path}: {e.__class__.__name__}: {e}")
+                new_text = text
+            stats[name].seconds += time.perf_counter() - t0
+            if new_text != text:
+                stats[name].changed += 1
+                if verbose:
+                    print(f"  {name}: changed {path}")
+            text = new_text
+
+        if text != doc.original:
+            changed_paths.append(path)
+            if not dry_run:
+                write_atomic(path, text.encode('utf-8'))
+                writes += 1
+            print(f"✅ {'Would update' if dry_run else 'Updated'}: {path}")
+
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 {len(files)} files: {reads} reads, {writes} writes, {len(changed_paths)} changed "
+          f"in {elapsed * 1000:.1f} ms")
+    print(f"   {'pass':<26}{'ms':>10}{'changed':>10}{'errors':>8}")
+    for name in pass_names:
+        s = stats[name]
+        print(f"   {name:<26}{s.seconds * 1000:>10.1f}{s.changed:>10}{s.errors:>8}")
+    return changed_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run markdown post-processing passes in one sweep')
+    parser.add_argument('paths', nargs='*', default=DEFAULT_PATHS,
+                        help='Files or directories to process (default: _models)')
+    parser.add_argument('--passes', default=','.join(PASSES),
+                        help=f"Comma-separated passes, applied in order (default: {','.join(PASSES)})")
+    parser.add_argument('--recursive', action='store_true', help='Include .md files in subdirectories')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing files')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show which pass changed which file')
+    args = parser.parse_args()
+
+    pass_names = [name.strip() for name in args.passes.split(',') if name.strip()]
+    unknown = [name for name in pass_names if name not in PASSES]
+    if unknown:
+        parser.error(f"unknown pass(es): {', '.join(unknown)} (known: {', '.join(PASSES)})")
+    run_pipeline(args.paths, pass_names, args.recursive, args.dry_run, args.verbose)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
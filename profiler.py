@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Opt-in stage profiling for the refresh, generate and validate scripts.
+
+    add_profile_argument(parser)           # --profile [TRACE_JSON]
+    args = parser.parse_args()
+    start_profile(args.profile, 'refresh_rl')
+
+    @profiled                              # a stage named after the function
+    def fetch_github_content(path): ...
+
+    with span('write rl.json'):            # or any block
+        ...
+
+Without --profile, span() and @profiled only check a global and do nothing.
+With it, every span records:
+
+- wall time, and CPU time of the thread it ran on
+- HTTP requests and bytes received through github_client (every request is
+  also a span of its own, so network waits show up under the stage that
+  made them)
+- the tracemalloc peak while it was open
+
+Spans nest, also across the fetch_executor worker threads (the open spans
+live in a contextvar the executor copies into each task). Work done inside
+render_pool worker processes is only seen as the time of the enclosing span.
+
+When the script exits a summary table, aggregated per stage path, is
+printed; `--profile trace.json` also writes Chrome trace events, which
+ui.perfetto.dev and chrome://tracing open directly. tracemalloc slows
+allocation-heavy code, so compare profiled runs with each other rather than
+with unprofiled ones.
+"""
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+_profile = None
+_open_spans = contextvars.ContextVar('profiler_open_spans', default=())
+
+
+class Span:
+    __slots__ = ('name', 'path', 'args', 'thread', 'start', 'end', 'cpu_start', 'cpu', 'requests', 'bytes', 'peak')
+
+    def __init__(self, name, path, args):
+        self.name = name
+        self.path = path
+        self.args = args
+        self.thread = threading.get_ident()
+        self.requests = 0
+        self.bytes = 0
+        self.peak = 0
+        self.start = time.perf_counter_ns()
+        self.cpu_start = time.thread_time_ns()
+        self.end = None
+        self.cpu = 0
+
+
+class Profile:
+    """Spans of one profiled run."""
+
+    def __init__(self, name, trace_path=None):
+        self.name = name
+        self.trace_path = trace_path
+        self.spans = []
+        self.open = set()
+        self.threads = {}
+        self.origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def _update_peaks(self, reset):
+        """Fold the tracemalloc peak into every open span (optionally starting a new peak window)."""
+        if not tracemalloc.is_tracing():
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        for span in self.open:
+            if peak > span.peak:
+                span.peak = peak
+        if reset:
+            tracemalloc.reset_peak()
+
+    def enter(self, name, args):
+        stack = _open_spans.get()
+        span = Span(name, f"{stack[-1].path}/{name}" if stack else name, args)
+        with self._lock:
+            self.threads.setdefault(span.thread, threading.current_thread().name)
+            # tracemalloc has one peak per process: hand it to the spans open so far, then measure this one
+            self._update_peaks(reset=True)
+            self.open.add(span)
+        return span, _open_spans.set(stack + (span,))
+
+    def exit(self, span, token):
+        span.end = time.perf_counter_ns()
+        span.cpu = time.thread_time_ns() - span.cpu_start
+        with self._lock:
+            self._update_peaks(reset=False)
+            self.open.discard(span)
+            self.spans.append(span)
+        _open_spans.reset(token)
+
+    def on_http(self, requests, nbytes):
+        """github_client counter listener: charge requests and bytes to the open spans."""
+        stack = _open_spans.get()
+        if not stack:
+            return
+        with self._lock:
+            for span in stack:
+                span.requests += requests
+                span.bytes += nbytes
+
+    # -- output ---------------------------------------------------------------
+
+    def summary_rows(self):
+        """One row per span path, in order of first appearance."""
+        rows = {}
+        for span in sorted(self.spans, key=lambda span: span.start):
+            row = rows.setdefault(span.path, {'path': span.path, 'calls': 0, 'wall': 0, 'cpu': 0,
+                                              'requests': 0, 'bytes': 0, 'peak': 0})
+            row['calls'] += 1
+            row['wall'] += span.end - span.start
+            row['cpu'] += span.cpu
+            row['requests'] += span.requests
+            row['bytes'] += span.bytes
+            row['peak'] = max(row['peak'], span.peak)
+        # Children directly under their parents
+        ordered = []
+
+        def add(path):
+            ordered.append(rows[path])
+            for child in [row for row in rows if row.rsplit('/', 1)[0] == path and '/' in row]:
+                add(child)
+
+        for path in rows:
+            if '/' not in path:
+                add(path)
+        return ordered
+
+    def print_summary(self):
+        rows = self.summary_rows()
+        width = max([len(row['path'].split('/')[-1]) + 2 * row['path'].count('/') for row in rows] + [5])
+        print(f"\n⏱️  Profile: {self.name}")
+        print(f"{'stage':<{width}} {'calls':>7} {'wall ms':>10} {'cpu ms':>10} {'http':>6} {'KiB':>9} {'peak KiB':>9}")
+        for row in rows:
+            depth = row['path'].count('/')
+            label = '  ' * depth + row['path'].split('/')[-1]
+            print(f"{label:<{width}} {row['calls']:>7} {row['wall'] / 1e6:>10.1f} {row['cpu'] / 1e6:>10.1f} "
+                  f"{row['requests']:>6} {row['bytes'] / 1024:>9.1f} {row['peak'] / 1024:>9.0f}")
+
+    def trace_events(self):
+        """Chrome trace-event JSON (complete 'X' events plus thread names)."""
+        pid = os.getpid()
+        tids = {thread: index for index, thread in enumerate(self.threads)}
+        events = [{'ph': 'M', 'name': 'process_name', 'pid': pid, 'tid': 0, 'args': {'name': self.name}}]
+        for thread, index in tids.items():
+            events.append({'ph': 'M', 'name': 'thread_name', 'pid': pid, 'tid': index,
+                           'args': {'name': self.threads[thread]}})
+        for span in sorted(self.spans, key=lambda span: span.start):
+            args = dict(span.args, cpu_ms=round(span.cpu / 1e6, 3), http_requests=span.requests,
+                        http_bytes=span.bytes, peak_kib=round(span.peak / 1024))
+            events.append({'ph': 'X', 'name': span.name, 'cat': span.path.split('/')[0], 'pid': pid,
+                           'tid': tids[span.thread], 'ts': (span.start - self.origin) / 1000,
+                           'dur': (span.end - span.start) / 1000, 'args': args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, path):
+        from atomic_writer import write_atomic
+        write_atomic(path, json.dumps(self.trace_events()).encode('utf-8'))
+        print(f"🧭 Chrome trace: {path} ({len(self.spans)} spans; open in ui.perfetto.dev)")
+
+
+class span:
+    """Context manager timing a block as a stage (no-op unless profiling)."""
+
+    __slots__ = ('name', 'args', '_state')
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+        self._state = None
+
+    def __enter__(self):
+        if _profile is not None:
+            self._state = _profile.enter(self.name, self.args)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._state is not None:
+            _profile.exit(*self._state)
+            self._state = None
+
+
+def profiled(func=None, *, name=None):
+    """Decorator timing every call of a function as a stage: @profiled or @profiled(name='...')."""
+    if func is None:
+        return functools.partial(profiled, name=name)
+    stage = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _profile is None:
+            return func(*args, **kwargs)
+        with span(stage):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def disable_in_worker():
+    """Process-pool initializer: forked workers must not record into (or trace memory for) the parent's profile."""
+    global _profile
+    _profile = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def add_profile_argument(parser):
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='TRACE_JSON',
+                        help='Print per-stage wall/CPU time, HTTP and memory at exit; '
+                             'with a path, also write a Chrome trace there')
+
+
+def start_profile(option, name):
+    """Start profiling when --profile was given; the report is printed (and the trace written) at exit."""
+    global _profile
+    if option is None or _profile is not None:
+        return None
+    _profile = Profile(name, option or None)
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    import github_client
+    github_client.STATS.listeners.append(_profile.on_http)
+    root = _profile.enter(name, {})
+    atexit.register(_finish, _profile, root)
+    return _profile
+
+
+def _finish(profile, root):
+    global _profile
+    profile.exit(*root)
+    _profile = None
+    tracemalloc.stop()
+    profile.print_summary()
+    if profile.trace_path:
+        profile.write_trace(profile.trace_path)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for README bodies.
+
+The _data catalogs (models.json, rl.json, datasets.json,
+smolhub_playground.json) used to carry every README inline, so Jekyll parsed
+all of them on every build. Bodies now live once each under _readmes/, named
+by the SHA-256 of their UTF-8 text:
+
+    _readmes/3f/3fa9...c1.md
+
+and catalog entries keep only "readme_sha256". Identical READMEs are stored
+once. _readmes/ starts with an underscore, so Jekyll neither copies nor
+parses it.
+
+Writers call dehydrate_entries() right before dumping a catalog; scripts that
+need the text call hydrate_entries() right after loading one (or readme_of()
+for a single entry). Entries that still have inline readme_content are left
+alone by hydrate, so old and new catalogs both work.
+
+Usage:
+    python readme_store.py migrate    # move inline READMEs of all catalogs into the store
+    python readme_store.py gc         # delete blobs no catalog references
+    python readme_store.py stats
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from atomic_writer import write_atomic
+
+BASE_PATH = Path(__file__).parent
+STORE_DIR = BASE_PATH / "_readmes"
+HASH_FIELD = "readme_sha256"
+CONTENT_FIELD = "readme_content"
+
+# Catalog file -> key holding its entries
+CATALOGS = {
+    "_data/models.json": "models",
+    "_data/rl.json": "rl_implementations",
+    "_data/datasets.json": "datasets",
+    "_data/smolhub_playground.json": "projects",
+}
+
+
+def readme_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def blob_path(digest, store_dir=None):
+    return Path(store_dir or STORE_DIR) / digest[:2] / f"{digest}.md"
+
+
+def put(text, store_dir=None):
+    """Store a README body and return its hash (no write when it is already stored)."""
+    digest = readme_hash(text)
+    path = blob_path(digest, store_dir)
+    if not path.exists():
+        write_atomic(path, text.encode('utf-8'))
+    return digest
+
+
+def get(digest, store_dir=None):
+    """Read a README body by hash; raises KeyError when the blob is missing."""
+    try:
+        with open(blob_path(digest, store_dir), 'r', encoding='utf-8', newline='') as f:
+            return f.read()
+    except FileNotFoundError:
+        raise KeyError(f"README blob {digest} is missing from {store_dir or STORE_DIR}") from None
+
+
+def readme_of(entry, store_dir=None):
+    """README text of a catalog entry, whether inline or stored."""
+    if entry.get(CONTENT_FIELD) is not None:
+        return entry[CONTENT_FIELD]
+    if entry.get(HASH_FIELD):
+        return get(entry[HASH_FIELD], store_dir)
+    return ""
+
+
+def hydrate_entries(entries, store_dir=None):
+    """Fill readme_content in place from the store (for scripts that read READMEs)."""
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get(CONTENT_FIELD) is None and entry.get(HASH_FIELD):
+            entry[CONTENT_FIELD] = get(entry[HASH_FIELD], store_dir)
+    return entries
+
+
+def hydrate_entry(entry, store_dir=None):
+    """Copy of a dehydrated entry with the README back in the hash's place (inverse of dehydrate_entry)."""
+    if not isinstance(entry, dict) or not entry.get(HASH_FIELD):
+        return entry
+    return {CONTENT_FIELD if key == HASH_FIELD else key: get(value, store_dir) if key == HASH_FIELD else value
+            for key, value in entry.items()}
+
+
+def dehydrate_entry(entry, store_dir=None):
+    """Copy of an entry with its README swapped for a hash reference.
+
+    The hash takes readme_content's place so the catalog's field order stays the same.
+    """
+    if not isinstance(entry, dict) or CONTENT_FIELD not in entry:
+        return entry
+    content = entry[CONTENT_FIELD]
+    result = {}
+    for key, value in entry.items():
+        if key == HASH_FIELD:
+            continue
+        if key == CONTENT_FIELD:
+            if content:
+                result[HASH_FIELD] = put(content, store_dir)
+            else:
+                result[CONTENT_FIELD] = content
+            continue
+        result[key] = value
+    return result
+
+
+def dehydrate_entries(entries, store_dir=None):
+    """dehydrate_entry for a list (entries already holding a hash pass through)."""
+    return [dehydrate_entry(entry, store_dir) for entry in entries]
+
+
+def load_catalog_entries(catalog, data):
+    key = CATALOGS[catalog]
+    if isinstance(data, dict):
+        return data.get(key, [])
+    return data
+
+
+def referenced_hashes():
+    """Every hash referenced by a catalog."""
+    hashes = set()
+    for catalog in CATALOGS:
+        path = BASE_PATH / catalog
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for entry in load_catalog_entries(catalog, data):
+            if isinstance(entry, dict) and entry.get(HASH_FIELD):
+                hashes.add(entry[HASH_FIELD])
+    return hashes
+
+
+def migrate():
+    """Move inline READMEs of every catalog into the store."""
+    for catalog, key in CATALOGS.items():
+        path = BASE_PATH / catalog
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        data = json.loads(text)
+        entries = load_catalog_entries(catalog, data)
+        inline = sum(1 for entry in entries if isinstance(entry, dict) and entry.get(CONTENT_FIELD))
+        if not inline:
+            print(f"✅ {catalog}: no inline READMEs")
+            continue
+        entries = dehydrate_entries(entries)
+        if isinstance(data, dict):
+            data[key] = entries
+        else:
+            data = entries
+        before = path.stat().st_size
+        # Keep the catalog's line endings so the migration diff is only the README fields
+        with open(path, 'w', encoding='utf-8', newline='\r\n' if '\r\n' in text else '\n') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            if text.endswith('\n'):
+                f.write('\n')
+        print(f"📦 {catalog}: moved {inline} READMEs to {STORE_DIR.name}/ "
+              f"({before / 1024:.1f} KB -> {path.stat().st_size / 1024:.1f} KB)")
+
+
+def gc(dry_run=False):
+    """Delete blobs that no catalog references."""
+    keep = referenced_hashes()
+    removed = 0
+    for path in sorted(STORE_DIR.glob('*/*.md')):
+        if path.stem not in keep:
+            if not dry_run:
+                path.unlink()
+            removed += 1
+    for folder in STORE_DIR.glob('*'):
+        if folder.is_dir() and not any(folder.iterdir()):
+            folder.rmdir()
+    verb = "Would remove" if dry_run else "Removed"
+    print(f"🧹 {verb} {removed} unreferenced README blobs ({len(keep)} referenced)")
+
+
+def stats():
+    blobs = list(STORE_DIR.glob('*/*.md'))
+    size = sum(path.stat().st_size for path in blobs)
+    refs = 0
+    for catalog in CATALOGS:
+        path = BASE_PATH / catalog
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = load_catalog_entries(catalog, json.load(f))
+            refs += sum(1 for entry in entries if isinstance(entry, dict) and entry.get(HASH_FIELD))
+    print(f"📚 {len(blobs)} README blobs, {size / 1024:.1f} KB, {refs} catalog references")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Content-addressed README store')
+    parser.add_argument('command', choices=['migrate', 'gc', 'stats'])
+    parser.add_argument('--dry-run', action='store_true', help='gc: only report what would be removed')
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        migrate()
+    elif args.command == 'gc':
+        gc(args.dry_run)
+    else:
+        stats()
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -1,8 +1,22 @@
 #!/usr/bin/env python3
 """
 Script to refresh models from the Paper-Replications GitHub repository.
-This script clones the repo, reads folder structure and README files,
-then generates Jekyll model files.
+This script syncs a local clone of the repo, reads folder structure and README
+files, then generates Jekyll model files.
+
+The clone is kept between runs under .cache/repos/ as a blobless, sparse
+checkout that only materializes the top-level README files. Each run fetches,
+asks `git diff --name-only` which READMEs changed since the last synced commit
+(recorded in _state/models_sync.json) and regenerates only those model files.
+File names are permanent (slug_registry.py, collection "models-refresh"): a
+page whose folder moved in the listing keeps its name and only gets its
+`order` updated. Files of deleted folders are removed. Only pages with a
+matching `repository_folder` header are ever written or removed, so the
+curated pages regenerate_models.py and friends maintain in the same
+directory are left alone (smolbenchmark/check_refresh_models.py checks
+this). Use --full to regenerate everything.
+
+PAPER_REPLICATIONS_URL overrides the repository to clone (any git URL).
 """
 
 import os
@@ -10,13 +24,26 @@ import shutil
 import subprocess
 import glob
 import re
+import json
+import argparse
 from pathlib import Path
 
+from frontmatter import patch, read_header
+from slug_registry import SlugRegistry
+
 # Configuration
-REPO_URL = "https://github.com/YuvrajSingh-mist/Paper-Replications.git"
-TEMP_DIR = "_temp_paper_replications"
+REPO_URL = os.environ.get("PAPER_REPLICATIONS_URL", "https://github.com/YuvrajSingh-mist/Paper-Replications.git")
+TEMP_DIR = ".cache/repos/Paper-Replications"
 MODELS_DIR = "_models"
 BASE_PATH = Path(__file__).parent
+SYNC_STATE_FILE = "_state/models_sync.json"
+# Registry collection of the pages generated here; "models" is keyed by the
+# curated model names, which can equal folder names ("CLiP", "SigLip")
+REGISTRY_COLLECTION = "models-refresh"
+
+# Only these files are checked out (relative to the repo root)
+README_NAMES = ["README.md", "readme.md", "README.txt"]
+SPARSE_PATTERNS = [f"/*/{name}" for name in README_NAMES]
 
 def run_command(command, cwd=None):
     """Run a shell command and return the result."""
@@ -33,25 +60,89 @@ def run_command(command, cwd=None):
         return None
 
 def clean_temp_dir():
-    """Remove temporary directory if it exists."""
+    """Remove the local clone if it exists."""
     temp_path = BASE_PATH / TEMP_DIR
     if temp_path.exists():
         shutil.rmtree(temp_path)
 
 def clone_repository():
-    """Clone the Paper-Replications repository."""
-    print("Cloning repository...")
-    clean_temp_dir()
-    
-    command = f"git clone {REPO_URL} {TEMP_DIR}"
-    result = run_command(command, cwd=BASE_PATH)
+    """Create or update the persistent sparse, blobless clone; returns the new HEAD commit or None."""
+    temp_path = BASE_PATH / TEMP_DIR
     
-    if result is None:
-        print("Failed to clone repository")
-        return False
+    if (temp_path / ".git").exists():
+        print("Fetching repository...")
+        if run_command("git fetch --quiet --filter=blob:none origin", cwd=temp_path) is None:
+            print("Failed to fetch repository")
+            return None
+        if run_command("git reset --quiet --hard origin/HEAD", cwd=temp_path) is None:
+            print("Failed to update working tree")
+            return None
+    else:
+        print("Cloning repository (blobless, sparse)...")
+        clean_temp_dir()
+        temp_path.parent.mkdir(parents=True, exist_ok=True)
+        command = f'git clone --quiet --filter=blob:none --no-checkout "{REPO_URL}" "{temp_path}"'
+        if run_command(command, cwd=BASE_PATH) is None:
+            print("Failed to clone repository")
+            return None
+        patterns = ' '.join(f"'{pattern}'" for pattern in SPARSE_PATTERNS)
+        if run_command(f"git sparse-checkout set --no-cone {patterns}", cwd=temp_path) is None:
+            print("Failed to configure sparse checkout")
+            return None
+        if run_command("git checkout --quiet", cwd=temp_path) is None:
+            print("Failed to check out repository")
+            return None
     
-    print("Repository cloned successfully")
-    return True
+    head = run_command("git rev-parse HEAD", cwd=temp_path)
+    if head:
+        print(f"Repository synced at {head[:12]}")
+    return head
+
+def load_sync_state():
+    """Return the last synced commit, or None if there is none for this repository."""
+    state_path = BASE_PATH / SYNC_STATE_FILE
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("repository") != REPO_URL:
+        return None
+    return state.get("commit")
+
+def save_sync_state(commit):
+    """Record the commit the model files were generated from."""
+    state_path = BASE_PATH / SYNC_STATE_FILE
+    state_path.parent.mkdir(exist_ok=True)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump({"repository": REPO_URL, "commit": commit}, f, indent=2)
+        f.write('\n')
+
+def list_folders_at(commit):
+    """Top-level folder names of the repo at a commit (trees only, no blobs needed)."""
+    temp_path = BASE_PATH / TEMP_DIR
+    output = run_command(f"git ls-tree -d --name-only {commit}", cwd=temp_path)
+    if output is None:
+        return None
+    return sorted(name for name in output.split('\n') if name and not name.startswith('.'))
+
+def get_changed_folders(old_commit, new_commit):
+    """Folders whose top-level README changed between two commits, or None if the diff is impossible."""
+    temp_path = BASE_PATH / TEMP_DIR
+    if run_command(f"git cat-file -e {old_commit}^{{commit}}", cwd=temp_path) is None:
+        return None
+    pathspecs = ' '.join(f"'*/{name}'" for name in README_NAMES)
+    # --no-renames keeps the diff tree-only so the blobless clone never fetches file contents
+    output = run_command(f"git -c core.quotePath=false diff --no-renames --name-only {old_commit} {new_commit} -- {pathspecs}",
+                         cwd=temp_path)
+    if output is None:
+        return None
+    changed = set()
+    for path in output.split('\n'):
+        parts = path.split('/')
+        if len(parts) == 2 and parts[1] in README_NAMES:
+            changed.add(parts[0])
+    return changed
 
 def read_readme_content(readme_path):
     """Read and clean README content for use as excerpt."""
@@ -83,16 +174,11 @@ def get_model_folders():
     temp_path = BASE_PATH / TEMP_DIR
     
     if not temp_path.exists():
-        print("Temporary directory not found")
+        print("Repository clone not found")
         return []
     
-    # Get all directories (excluding .git and other hidden folders)
-    folders = []
-    for item in temp_path.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):
-            folders.append(item.name)
-    
-    return sorted(folders)
+    # Read directories from git: the sparse checkout only materializes folders that have a README
+    return list_folders_at("HEAD") or []
 
 def clean_title(folder_name):
     """Clean folder name to create a nice title."""
@@ -104,7 +190,37 @@ def clean_title(folder_name):
     
     return title
 
-def create_model_file(folder_name, index):
+def model_slug(folder_name):
+    return folder_name.lower().replace('_', '-').replace(' ', '-')
+
+def model_filename(folder_name, index, registry, existing=None):
+    """Permanent filename of the model page for a folder (assigned the first time it is seen).
+
+    A page that already exists for the folder (`existing`) keeps its name; the
+    old positional name is only used to adopt such pages.
+    """
+    models_path = BASE_PATH / MODELS_DIR
+    legacy = existing.stem if existing is not None else f"model-{index+1:02d}-{model_slug(folder_name)}"
+    filename = registry.filename(REGISTRY_COLLECTION, folder_name, model_slug(folder_name),
+                                 directory=models_path, legacy=legacy)
+    target = models_path / filename
+    if target.exists() and read_repository_folder(target) != folder_name:
+        # The name was taken by a page this script does not own since it was assigned
+        print(f"Not overwriting {filename}: it is not the page of {folder_name}")
+        registry.forget(REGISTRY_COLLECTION, folder_name)
+        filename = registry.filename(REGISTRY_COLLECTION, folder_name, model_slug(folder_name),
+                                     directory=models_path, legacy=existing.stem if existing is not None else None)
+    return filename
+
+def read_repository_folder(model_file):
+    """Read repository_folder from a model file's frontmatter."""
+    try:
+        header = read_header(model_file)
+    except OSError:
+        return None
+    return header.value('repository_folder') if header else None
+
+def create_model_file(folder_name, index, filename):
     """Create a Jekyll model file from folder information."""
     temp_path = BASE_PATH / TEMP_DIR / folder_name
     models_path = BASE_PATH / MODELS_DIR
@@ -141,8 +257,6 @@ Please refer to the original repository for detailed usage instructions and impl
 This model is part of the Paper-Replications project available on GitHub.
 """
     
-    # Create filename
-    filename = f"model-{index+1:02d}-{folder_name.lower().replace('_', '-').replace(' ', '-')}.md"
     filepath = models_path / filename
     
     # Create the markdown content
@@ -151,6 +265,7 @@ title: "{title}"
 excerpt: "{description}<br/><img src='/images/500x300.png'>"
 collection: models
 repository_folder: "{folder_name}"
+order: {index + 1}
 ---
 
 {full_content}
@@ -162,45 +277,88 @@ repository_folder: "{folder_name}"
     
     print(f"Created model file: {filename}")
 
-def clear_existing_models():
-    """Remove existing model files."""
+def existing_model_files():
+    """{repository folder: page} of the pages this script generated earlier."""
     models_path = BASE_PATH / MODELS_DIR
-    
-    if models_path.exists():
-        for model_file in models_path.glob("model-*.md"):
+    existing = {}
+    if not models_path.exists():
+        return existing
+    for model_file in sorted(models_path.glob("*.md")):
+        folder_name = read_repository_folder(model_file)
+        if folder_name is not None and folder_name not in existing:
+            existing[folder_name] = model_file
+        elif model_file.name.startswith("model-"):
             model_file.unlink()
-            print(f"Removed existing model: {model_file.name}")
+            print(f"Removed unrecognized model: {model_file.name}")
+    return existing
 
-def refresh_models():
+def sync_model_files(folders, changed_folders=None):
+    """Regenerate changed folders (all when None), renumber moved ones and remove files of deleted folders."""
+    models_path = BASE_PATH / MODELS_DIR
+    registry = SlugRegistry.load()
+    existing = existing_model_files()
+    
+    for folder_name in sorted(set(existing) - set(folders)):
+        existing.pop(folder_name).unlink()
+        print(f"Removed model of deleted folder: {folder_name}")
+    
+    created = reordered = 0
+    for index, folder_name in enumerate(folders):
+        current = existing.get(folder_name)
+        filename = model_filename(folder_name, index, registry, current)
+        if changed_folders is None or folder_name in changed_folders or current is None \
+                or current.name != filename:
+            create_model_file(folder_name, index, filename)
+            if current is not None and current.name != filename:
+                current.unlink()
+            created += 1
+        elif patch(current, order=index + 1):
+            # Same page, new position in the listing
+            reordered += 1
+    registry.save()
+    return created, reordered
+
+def refresh_models(full=False):
     """Main function to refresh models from repository."""
     print("Starting model refresh process...")
     
-    # Step 1: Clone repository
-    if not clone_repository():
+    # Step 1: Sync the local clone
+    head = clone_repository()
+    if not head:
         return False
     
     # Step 2: Get model folders
     folders = get_model_folders()
-    print(f"Found {len(folders)} model folders: {folders}")
+    print(f"Found {len(folders)} model folders")
     
     if not folders:
         print("No model folders found in repository")
-        clean_temp_dir()
         return False
     
-    # Step 3: Clear existing models
-    clear_existing_models()
+    # Step 3: Work out which READMEs changed since the last sync
+    last_commit = None if full else load_sync_state()
+    changed_folders = None
+    if last_commit == head:
+        changed_folders = set()
+    elif last_commit:
+        changed_folders = get_changed_folders(last_commit, head)
     
-    # Step 4: Create new model files
-    for index, folder_name in enumerate(folders):
-        create_model_file(folder_name, index)
-    
-    # Step 5: Clean up
-    clean_temp_dir()
+    if changed_folders is None:
+        # No usable previous sync: regenerate everything
+        print("Regenerating all model files")
+        created, _ = sync_model_files(folders)
+        print(f"Successfully created {created} model files")
+    else:
+        print(f"{len(changed_folders)} folder(s) changed since {last_commit[:12]}")
+        created, reordered = sync_model_files(folders, changed_folders)
+        print(f"Regenerated {created} and renumbered {reordered} model files")
     
-    print(f"Successfully created {len(folders)} model files")
+    save_sync_state(head)
     print("Model refresh completed!")
     return True
 
 if __name__ == "__main__":
-    refresh_models()
+    parser = argparse.ArgumentParser(description='Refresh _models from the Paper-Replications repository')
+    parser.add_argument('--full', action='store_true', help='Regenerate every model file instead of only changed ones')
+    args = parser.parse_args()
+    refresh_models(full=args.full)
@@ -3,232 +3,127 @@
 Script to refresh RL implementations from the Reinforcement-Learning GitHub repository.
 This script fetches the folder structure from GitHub API and generates both 
 JSON data file and individual Jekyll markdown files.
+
+The tree and contents crawls checkpoint every finished folder (see
+crawl_checkpoint.py). When a fetch fails the crawl stops, _data/rl.json is
+left as it was, and the next run resumes where this one stopped.
 """
 
 import os
 import json
 import requests
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 import argparse
-import posixpath
+from urllib.parse import quote
+
+from github_cache import cached_get, print_cache_report
+from github_client import API_URL, RAW_URL, github_headers
+import tarball_ingest
+from listing_index import write_listing_index
+from readme_store import dehydrate_entries, dehydrate_entry, hydrate_entries, hydrate_entry
+from atomic_writer import DirectorySync, write_atomic
+from crawl_checkpoint import CrawlCheckpoint
+from slug_registry import SlugRegistry
+from render_pool import add_jobs_argument, render_ordered, report_errors
+from link_rewriter import absolutize_links
+from classifier import classify
+from profiler import add_profile_argument, profiled, span, start_profile
 
 # Configuration
 REPO_OWNER = "YuvrajSingh-mist"
 REPO_NAME = "Reinforcement-Learning"
-BASE_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}"
+REPO_BRANCH = "master"
+BASE_URL = f"{API_URL}/repos/{REPO_OWNER}/{REPO_NAME}"
+# README bodies are downloaded from RAW_FETCH_URL; links in the pages always point at GitHub's raw host
+RAW_FETCH_URL = f"{RAW_URL}/{REPO_OWNER}/{REPO_NAME}/{REPO_BRANCH}"
+RAW_BASE_URL = f"https://raw.githubusercontent.com/{REPO_OWNER}/{REPO_NAME}/{REPO_BRANCH}"
 DATA_FILE = "_data/rl.json"
+MANIFEST_FILE = "_state/rl_manifest.json"
+SKIP_DIRS = ['.git', '__pycache__', 'node_modules', '.vscode']
 MODELS_DIR = "_rl"
 BASE_PATH = Path(__file__).parent
 
 # GitHub Authentication
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+HEADERS = github_headers(GITHUB_TOKEN)
 if GITHUB_TOKEN:
-    HEADERS = {'Authorization': f'token {GITHUB_TOKEN}'}
     print("🔑 Using GitHub token authentication")
 else:
-    HEADERS = {}
     print("⚠️  No GitHub token found - using unauthenticated requests (rate limited)")
 
+@profiled
 def fetch_github_content(path=""):
-    """Fetch repository content from GitHub API."""
+    """Fetch repository content from GitHub API (None when the path does not exist).
+
+    Any other failure raises requests.exceptions.RequestException: a crawl has
+    to stop there (and resume later) instead of taking it for an empty folder.
+    """
     url = f"{BASE_URL}/contents/{path}"
     print(f"🔍 Fetching: {url}")
     
+    response = cached_get(url, headers=HEADERS)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
+
+@profiled
+def fetch_repo_tree(ref=REPO_BRANCH):
+    """Fetch the whole repository listing with one recursive git-tree request."""
+    url = f"{BASE_URL}/git/trees/{quote(ref)}?recursive=1"
+    print(f"🌳 Fetching tree: {url}")
+
     try:
-        response = requests.get(url, headers=HEADERS)
+        response = cached_get(url, headers=HEADERS)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         print(f"❌ Error fetching {url}: {e}")
         return None
 
+@profiled
+def fetch_raw_file(path):
+    """Fetch a file body straight from the raw host (one request, no metadata call).
+
+    Returns "" when the file does not exist; other failures raise.
+    """
+    url = f"{RAW_FETCH_URL}/{quote(path)}"
+
+    response = cached_get(url, headers=HEADERS)
+    if response.status_code == 404:
+        return ""
+    response.raise_for_status()
+    return response.text
+
 def fetch_readme_content(path):
-    """Fetch README content from a specific folder."""
+    """Fetch README content from a specific folder ("" when it has none; failures raise)."""
     readme_file = "README.md"  # Always README.md
     
     readme_path = f"{path}/{readme_file}" if path else readme_file
     content = fetch_github_content(readme_path)
     
     if content and isinstance(content, dict) and content.get('download_url'):
-        try:
-            readme_response = requests.get(content['download_url'], headers=HEADERS)
-            readme_response.raise_for_status()
-            # Ensure we get the FULL content without any truncation
-            full_content = readme_response.text
-            print(f"✅ README fetched for {path}: {len(full_content)} characters")
-            return full_content
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching README for {path}: {e}")
-            return ""
+        readme_response = cached_get(content['download_url'], headers=HEADERS)
+        readme_response.raise_for_status()
+        # Ensure we get the FULL content without any truncation
+        full_content = readme_response.text
+        print(f"✅ README fetched for {path}: {len(full_content)} characters")
+        return full_content
     
     return ""
 
+@profiled
 def absolutize_markdown_links(markdown_text, base_path):
     """Convert relative markdown and HTML links/images to absolute raw.githubusercontent.com URLs.
 
     - Handles markdown images ![alt](src) and links [text](href)
     - Handles HTML <img src="..."> and <a href="..."> attributes
-    - Leaves http(s), mailto, and anchor (#) links unchanged
+    - Leaves http(s), mailto, and anchor (#) links unchanged, and code untouched
     """
-    if not markdown_text:
-        return markdown_text
-
-    def to_absolute(url):
-        if not url:
-            return url
-        url = url.strip()
-        # Ignore absolute and anchor/mailto links
-        if re.match(r"^(?:https?:)?//", url) or url.startswith("http://") or url.startswith("https://") or url.startswith("mailto:") or url.startswith("#"):
-            return url
-        # Normalize path relative to repo
-        if url.startswith('/'):
-            resolved = url.lstrip('/')
-        else:
-            # Join with the folder that the README belongs to
-            joined = posixpath.join(base_path, url) if base_path else url
-            resolved = posixpath.normpath(joined)
-        return f"https://raw.githubusercontent.com/{REPO_OWNER}/{REPO_NAME}/master/{resolved}"
-
-    # Markdown images ![alt](...)
-    def repl_md_image(match):
-        alt = match.group(1)
-        url = match.group(2)
-        title = match.group(3) or ''
-        abs_url = to_absolute(url)
-        return f"![{alt}]({abs_url}{title})"
-
-    # Markdown links [text](...)
-    def repl_md_link(match):
-        text = match.group(1)
-        url = match.group(2)
-        title = match.group(3) or ''
-        abs_url = to_absolute(url)
-        return f"[{text}]({abs_url}{title})"
-
-    # HTML src and href attributes
-    def repl_html_src(match):
-        prefix = match.group(1)
-        url = match.group(2)
-        suffix = match.group(3)
-        abs_url = to_absolute(url)
-        return f"{prefix}{abs_url}{suffix}"
-
-    # Patterns (support optional title in markdown links/images: (url "title"))
-    md_image_pattern = re.compile(r"!\[([^\]]*)\]\(([^\)\s]+)(\s+\"[^\"]*\")?\)")
-    md_link_pattern = re.compile(r"(?<!\!)\[([^\]]+)\]\(([^\)\s]+)(\s+\"[^\"]*\")?\)")
-    html_src_pattern = re.compile(r"(src=\")([^\"]+)(\")", re.IGNORECASE)
-    html_href_pattern = re.compile(r"(href=\")([^\"]+)(\")", re.IGNORECASE)
-
-    # Apply replacements
-    updated = md_image_pattern.sub(repl_md_image, markdown_text)
-    updated = md_link_pattern.sub(repl_md_link, updated)
-    updated = html_src_pattern.sub(repl_html_src, updated)
-    updated = html_href_pattern.sub(repl_html_src, updated)
-    return updated
-
-def categorize_rl_algorithm(name, path, readme_content=""):
-    """Categorize RL algorithms based on name and content (single primary category)."""
-    name_lower = name.lower()
-    path_lower = path.lower()
-    content_lower = readme_content.lower()
-    
-    # Prefer Multi-agent FIRST to avoid matching 'ppo' inside 'ippo' etc.
-    multi_agent_terms = ['marl', 'multi-agent', 'multi agent', 'ippo', 'mappo', 'self-play', 'self play']
-    if any(term in name_lower or term in path_lower or term in content_lower for term in multi_agent_terms):
-        return "Multi-Agent"
-
-    # Map policy keywords to Actor-Critic (we don't expose Policy-Based)
-    if re.search(r'(^|[^a-z0-9])ppo([^a-z0-9]|$)', name_lower) or 'reinforce' in name_lower or 'policy' in name_lower:
-        return "Actor-Critic"
-    
-    # Actor-Critic
-    if any(term in name_lower for term in ['a2c', 'a3c', 'sac', 'td3', 'ddpg']) or ('actor' in name_lower or 'critic' in name_lower):
-        return "Actor-Critic"
-        
-    # Exploration
-    if any(term in name_lower for term in ['rnd', 'exploration', 'curiosity']):
-        return "Exploration"
-        
-    # Imitation learning
-    if any(term in name_lower for term in ['imitation', 'behavioral', 'cloning']):
-        return "Imitation Learning"
-        
-    # Game environments
-    if any(term in name_lower for term in ['vizdoom', 'flappybird', 'game']):
-        return "Game Environments"
-        
-    # Unity ML-Agents
-    if any(term in name_lower for term in ['ml-agents', 'unity']):
-        return "Unity ML-Agents"
-    
-    return "Other"
-
-def collect_categories(name, path, readme_content=""):
-    """Collect all applicable categories for a project (multi-category support)."""
-    name_lower = name.lower()
-    path_lower = path.lower()
-    content_lower = readme_content.lower()
-
-    categories = set()
-
-    # Multi-Agent
-    if any(term in name_lower or term in path_lower or term in content_lower for term in ['marl', 'multi-agent', 'multi agent', 'ippo', 'mappo', 'self-play', 'self play']):
-        categories.add("Multi-Agent")
-
-    # Map PPO/REINFORCE/policy to Actor-Critic
-    if (re.search(r'(^|[^a-z0-9])ppo([^a-z0-9]|$)', name_lower) or
-        re.search(r'(^|[^a-z0-9])ppo([^a-z0-9]|$)', content_lower) or
-        'reinforce' in name_lower or 'policy' in name_lower or 'policy gradient' in content_lower):
-        categories.add("Actor-Critic")
-
-    # Actor-Critic
-    if any(term in name_lower for term in ['a2c', 'a3c', 'sac', 'td3', 'ddpg']) or ('actor' in name_lower or 'critic' in name_lower) or 'actor-critic' in content_lower:
-        categories.add("Actor-Critic")
-
-    # Do not add Value-Based category (hidden)
-
-    # Exploration
-    if any(term in name_lower for term in ['rnd']) or any(term in content_lower for term in ['exploration', 'curiosity']):
-        categories.add("Exploration")
-
-    # Imitation Learning
-    if any(term in name_lower for term in ['imitation', 'behavioral', 'cloning']) or 'dagger' in content_lower:
-        categories.add("Imitation Learning")
-
-    # If none matched, default to Other
-    if not categories:
-        categories.add("Other")
-
-    return sorted(categories)
-
-def detect_environment(name, readme_content=""):
-    """Detect the environment used by the RL algorithm."""
-    name_lower = name.lower()
-    content_lower = readme_content.lower()
-    
-    # Specific environments
-    if 'atari' in name_lower or 'atari' in content_lower:
-        return "Atari"
-    elif 'mujoco' in name_lower or 'mujoco' in content_lower:
-        return "MuJoCo"
-    elif 'lunar' in name_lower or 'lunarlander' in content_lower:
-        return "LunarLander"
-    elif 'taxi' in name_lower or 'taxi' in content_lower:
-        return "Taxi"
-    elif 'frozenlake' in name_lower or 'frozen' in content_lower:
-        return "Frozenlake"
-    elif 'flappybird' in name_lower or 'flappy' in content_lower:
-        return "Flappybird"
-    elif 'vizdoom' in name_lower or 'vizdoom' in content_lower:
-        return "Vizdoom"
-    elif 'pong' in content_lower:
-        return "Atari"
-    elif any(env in content_lower for env in ['gymnasium', 'gym']):
-        return "Gymnasium"
-    
-    return "Custom Environment"
+    return absolutize_links(markdown_text, RAW_BASE_URL, base_path)
 
 def clean_display_name(name):
     """Clean folder name to create a display name."""
@@ -250,67 +145,75 @@ def clean_display_name(name):
     
     return ' '.join(cleaned_words)
 
-def process_directory_recursive(path="", parent_name="", max_depth=10):
-    """Recursively process directories and find ALL folders with README files."""
+@profiled
+def build_implementation(path, parent_name, readme_content):
+    """Build the rl.json entry for a folder that has a README."""
+    item_name = path.split('/')[-1]
+    # Convert relative links/images to absolute raw URLs for site rendering
+    processed_readme_content = absolutize_markdown_links(readme_content, path)
+    
+    # Create display name with full hierarchy
+    if parent_name:
+        display_name = f"{clean_display_name(item_name)} ({parent_name})"
+    else:
+        display_name = clean_display_name(item_name)
+    
+    # Determine categories (multi) and primary category, plus environment (rules in _rules/classification.json)
+    with span('classify'):
+        labels = classify(['rl_categories', 'rl_environment'], name=item_name, path=path, readme=readme_content)
+    categories = labels['rl_categories']
+    category = categories[0]
+    environment = labels['rl_environment']
+    
+    return {
+        "name": item_name,
+        "path": path,
+        "display_name": display_name,
+        "description": f"Implementation of {item_name} reinforcement learning algorithm",
+        "readme_content": processed_readme_content if processed_readme_content else "",
+        "github_url": f"https://github.com/{REPO_OWNER}/{REPO_NAME}/tree/master/{path}",
+        "api_url": f"{BASE_URL}/contents/{path}",
+        "download_url": None,
+        "created_date": datetime.now().strftime('%Y-%m-%d'),
+        "github_date": datetime.now().strftime('%Y-%m-%d'),
+        "category": category,
+        "categories": categories,
+        "framework": "PyTorch",  # Default assumption
+        "environment": environment
+    }
+
+def crawl_folder(path, parent_name, max_depth=10):
+    """Visit one folder of the contents crawl.
+
+    Returns (implementation or None, [[child path, child parent name], ...]).
+    """
     content = fetch_github_content(path)
     if not content:
-        return []
+        return None, []
     
-    implementations = []
+    implementation = None
     current_depth = path.count('/') if path else 0
     
-    # Check if current directory has a README
-    readme_content = fetch_readme_content(path)
-    # Convert relative links/images to absolute raw URLs for site rendering
-    processed_readme_content = absolutize_markdown_links(readme_content, path)
-    
     # If this directory has a README and it's not the root, add it as an implementation
-    if readme_content and path:  # Don't add root directory
+    # (the root README describes the repository, so it is not fetched at all)
+    readme_content = fetch_readme_content(path) if path else ""
+    if readme_content:
         item_name = path.split('/')[-1]  # Get last part of path
         
         # Skip common non-algorithm directories
-        if item_name.lower() not in ['.git', '__pycache__', 'node_modules', '.vscode']:
-            # Create display name with full hierarchy
-            if parent_name:
-                display_name = f"{clean_display_name(item_name)} ({parent_name})"
-            else:
-                display_name = clean_display_name(item_name)
-            
-            # Determine categories (multi) and primary category, plus environment
-            categories = collect_categories(item_name, path, readme_content)
-            category = categories[0] if categories else categorize_rl_algorithm(item_name, path, readme_content)
-            environment = detect_environment(item_name, readme_content)
-            
-            # Create implementation entry
-            implementation = {
-                "name": item_name,
-                "path": path,
-                "display_name": display_name,
-                "description": f"Implementation of {item_name} reinforcement learning algorithm",
-                "readme_content": processed_readme_content if processed_readme_content else "",
-                "github_url": f"https://github.com/{REPO_OWNER}/{REPO_NAME}/tree/master/{path}",
-                "api_url": f"{BASE_URL}/contents/{path}",
-                "download_url": None,
-                "created_date": datetime.now().strftime('%Y-%m-%d'),
-                "github_date": datetime.now().strftime('%Y-%m-%d'),
-                "category": category,
-                "categories": categories,
-                "framework": "PyTorch",  # Default assumption
-                "environment": environment
-            }
-            
-            implementations.append(implementation)
-            print(f"📁 Found README in: {path} -> {display_name}")
+        if item_name.lower() not in SKIP_DIRS:
+            implementation = build_implementation(path, parent_name, readme_content)
+            print(f"📁 Found README in: {path} -> {implementation['display_name']}")
     
-    # Continue recursively processing subdirectories if not at max depth
+    # Subdirectories are visited next unless this one is at max depth
+    children = []
     if current_depth < max_depth:
         for item in content:
             if item['type'] == 'dir':
                 item_name = item['name']
-                item_path = item['path']
                 
                 # Skip common non-algorithm directories
-                if item_name.lower() in ['.git', '__pycache__', 'node_modules', '.vscode']:
+                if item_name.lower() in SKIP_DIRS:
                     continue
                 
                 # Create parent name for nested items
@@ -318,105 +221,345 @@ def process_directory_recursive(path="", parent_name="", max_depth=10):
                     new_parent_name = f"{parent_name} {clean_display_name(item_name.split('/')[-1])}" if parent_name else clean_display_name(item_name)
                 else:
                     new_parent_name = clean_display_name(item_name)
-                
-                # Recursively process this directory
-                sub_implementations = process_directory_recursive(item_path, new_parent_name, max_depth)
-                implementations.extend(sub_implementations)
+                children.append([item['path'], new_parent_name])
+    
+    return implementation, children
+
+def resume_contents_crawl(checkpoint, path, parent_name):
+    """Replay a contents-crawl checkpoint: (folders still to visit, implementations found so far)."""
+    pending = [[path, parent_name]]
+    implementations = []
+    try:
+        for record in checkpoint.records:
+            # Records are in visiting order, so each one is the folder on top of the stack
+            if not pending or pending[-1][0] != record['path']:
+                raise KeyError(record['path'])
+            pending.pop()
+            if record['entry']:
+                implementations.append(hydrate_entry(record['entry'], checkpoint.blobs))
+            pending.extend(reversed(record['children']))
+    except (KeyError, TypeError):
+        print("⚠️  Checkpoint does not replay against this crawl; starting over")
+        checkpoint.reset()
+        return [[path, parent_name]], []
+    if checkpoint.records:
+        print(f"♻️  Resuming the contents crawl: {len(checkpoint.records)} folders already visited, "
+              f"{len(pending)} pending")
+    return pending, implementations
+
+def process_directory_recursive(path="", parent_name="", max_depth=10, checkpoint=None):
+    """Walk the contents API from path and find ALL folders with README files.
+
+    Folders are visited depth-first in listing order (the order of the old
+    recursive walk). With a checkpoint, every visited folder is recorded as it
+    completes, and a checkpoint left by an interrupted run is replayed first so
+    only the folders it had not reached are fetched. Fetch failures raise.
+    """
+    if checkpoint is not None:
+        pending, implementations = resume_contents_crawl(checkpoint, path, parent_name)
+    else:
+        pending, implementations = [[path, parent_name]], []
+    
+    while pending:
+        folder, folder_parent_name = pending.pop()
+        implementation, children = crawl_folder(folder, folder_parent_name, max_depth)
+        if implementation:
+            implementations.append(implementation)
+        # Last child on top, so children are visited in listing order
+        pending.extend(reversed(children))
+        if checkpoint is not None:
+            entry = dehydrate_entry(implementation, checkpoint.blobs) if implementation else None
+            checkpoint.append({'path': folder, 'entry': entry, 'children': children})
     
     return implementations
 
-def process_directory(path="", parent_name=""):
-    """Wrapper function for backward compatibility."""
-    return process_directory_recursive(path, parent_name, max_depth=10)
+def find_readme_folders(tree_entries, max_depth=10):
+    """Pick the folders that hold a README.md out of a recursive git-tree listing.
 
-def generate_rl_json():
-    """Generate the RL JSON data file."""
-    print("🚀 Starting RL data generation...")
+    Mirrors the walk done by process_directory_recursive: skipped directories are
+    not descended into, the depth limit is the same, and folders come back in the
+    listing's pre-order so entries keep the order of the contents-API crawl.
+    Returns (folder_path, readme_blob_sha) pairs.
+    """
+    readme_shas = {
+        entry['path'].rsplit('/', 1)[0]: entry.get('sha')
+        for entry in tree_entries
+        if entry.get('type') == 'blob' and entry['path'].endswith('/README.md')
+    }
     
-    # Fetch all RL implementations
-    implementations = process_directory()
+    folders = []
+    for entry in tree_entries:
+        if entry.get('type') != 'tree':
+            continue
+        parts = entry['path'].split('/')
+        if any(part.lower() in SKIP_DIRS for part in parts):
+            continue
+        # Same reach as the recursive crawl: a folder is visited when its parent is above max_depth
+        if len(parts) - 2 >= max_depth:
+            continue
+        if entry['path'] in readme_shas:
+            folders.append((entry['path'], readme_shas[entry['path']]))
+    return folders
+
+def resume_tree_crawl(checkpoint):
+    """{path: (README blob sha, entry or None)} of the READMEs a tree-crawl checkpoint already holds."""
+    resumed = {}
+    for record in checkpoint.records:
+        try:
+            entry = hydrate_entry(record['entry'], checkpoint.blobs) if record['entry'] else None
+        except KeyError:
+            # README blob gone from the checkpoint store: download it again
+            continue
+        resumed[record['path']] = (record['sha'], entry)
+    if resumed:
+        print(f"♻️  Resuming the tree crawl: {len(resumed)} README downloads already done")
+    return resumed
+
+@profiled
+def process_repository_tree(max_depth=10, known_shas=None, previous_entries=None, checkpoint=None):
+    """Find ALL folders with README files from a single recursive git-tree listing.
+
+    Costs one listing request plus one raw download per README, instead of the
+    three requests per folder made by process_directory_recursive.
+
+    known_shas ({path: README blob sha} from the last run) and previous_entries
+    ({path: rl.json entry}) make the crawl incremental: a folder whose README
+    blob is unchanged keeps its previous entry as-is, so only added or changed
+    READMEs are downloaded, categorized and absolutized.
+
+    With a checkpoint every README download is recorded as it completes, and
+    downloads an interrupted run already made are reused when the blob SHA
+    still matches. A failed download raises.
+
+    Returns (implementations, readme_shas), or None when the listing is
+    unavailable or truncated so callers can fall back.
+    """
+    known_shas = known_shas or {}
+    previous_entries = previous_entries or {}
+    resumed = resume_tree_crawl(checkpoint) if checkpoint is not None else {}
     
-    if not implementations:
-        print("❌ No RL implementations found!")
-        return False
+    tree = fetch_repo_tree()
+    if not tree or 'tree' not in tree:
+        return None
+    if tree.get('truncated'):
+        print("⚠️  Git tree listing was truncated by GitHub")
+        return None
     
-    # Create the JSON structure
-    rl_data = {
-        "rl_implementations": implementations
-    }
+    folders = find_readme_folders(tree['tree'], max_depth)
+    print(f"🌳 Tree listing has {len(folders)} folders with a README")
     
-    # Write to JSON file
-    data_path = BASE_PATH / DATA_FILE
-    data_path.parent.mkdir(exist_ok=True)
+    implementations = []
+    readme_shas = {}
+    reused = fetched = resumed_count = 0
+    for path, sha in folders:
+        if sha and known_shas.get(path) == sha:
+            # Unchanged README; folders without an entry had an empty README last time
+            if path in previous_entries:
+                implementations.append(previous_entries[path])
+            readme_shas[path] = sha
+            reused += 1
+            continue
+        
+        if sha and path in resumed and resumed[path][0] == sha:
+            # Downloaded by the interrupted run this one resumes
+            implementation = resumed[path][1]
+            if implementation:
+                implementations.append(implementation)
+            readme_shas[path] = sha
+            resumed_count += 1
+            continue
+        
+        readme_content = fetch_raw_file(f"{path}/README.md")
+        fetched += 1
+        readme_shas[path] = sha
+        implementation = None
+        if readme_content:
+            print(f"✅ README fetched for {path}: {len(readme_content)} characters")
+            
+            parent_name = ' '.join(clean_display_name(part) for part in path.split('/'))
+            implementation = build_implementation(path, parent_name, readme_content)
+            implementations.append(implementation)
+            status = "changed" if path in previous_entries else "new"
+            print(f"📁 Found README in: {path} -> {implementation['display_name']} ({status})")
+        if checkpoint is not None:
+            entry = dehydrate_entry(implementation, checkpoint.blobs) if implementation else None
+            checkpoint.append({'path': path, 'sha': sha, 'entry': entry})
     
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(rl_data, f, indent=2, ensure_ascii=False)
+    removed = sorted(set(previous_entries) - {impl['path'] for impl in implementations})
+    for path in removed:
+        print(f"➖ Removed: {path}")
+    resumed_note = f", ⏯️  {resumed_count} from the checkpoint" if resumed_count else ""
+    print(f"♻️  {reused} unchanged, 🔄 {fetched} README downloads{resumed_note}, ➖ {len(removed)} removed")
     
-    print(f"✅ Generated {DATA_FILE} with {len(implementations)} RL implementations")
-    return True
+    return implementations, readme_shas
 
-def generate_markdown_files():
-    """Generate individual markdown files for each RL implementation."""
-    # Read the JSON data
+@profiled
+def process_repository_tarball(max_depth=10):
+    """Find ALL folders with README files from one streamed repository tarball.
+
+    Produces the same entries, in the same order, as the tree and contents
+    crawls with a single request. Returns None when the tarball is unavailable.
+    """
+    snapshot = tarball_ingest.fetch_snapshot(REPO_NAME, REPO_OWNER, REPO_BRANCH, GITHUB_TOKEN)
+    if snapshot is None:
+        return None
+    
+    # Present the archive as tree entries so folder selection matches the tree crawl exactly
+    tree_entries = [{'path': folder, 'type': 'tree'} for folder in snapshot.folders]
+    tree_entries += [{'path': f"{folder}/README.md", 'type': 'blob'} for folder in snapshot.readmes if folder]
+    
+    implementations = []
+    for path, _ in find_readme_folders(tree_entries, max_depth):
+        readme_content = snapshot.readmes.get(path, "")
+        if not readme_content:
+            continue
+        parent_name = ' '.join(clean_display_name(part) for part in path.split('/'))
+        implementation = build_implementation(path, parent_name, readme_content)
+        implementations.append(implementation)
+        print(f"📁 Found README in: {path} -> {implementation['display_name']}")
+    
+    return implementations
+
+def load_manifest():
+    """Load the README blob SHA manifest written by the last tree crawl."""
+    manifest_path = BASE_PATH / MANIFEST_FILE
+    if not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable manifest {MANIFEST_FILE}: {e}")
+        return {}
+    if manifest.get('repository') != f"{REPO_OWNER}/{REPO_NAME}" or manifest.get('ref') != REPO_BRANCH:
+        return {}
+    return manifest.get('readmes', {})
+
+def save_manifest(readme_shas):
+    """Persist {implementation path: README blob sha} for the next incremental refresh."""
+    manifest = {
+        "repository": f"{REPO_OWNER}/{REPO_NAME}",
+        "ref": REPO_BRANCH,
+        "readmes": readme_shas,
+    }
+    text = json.dumps(manifest, indent=2, ensure_ascii=False, sort_keys=True) + '\n'
+    write_atomic(BASE_PATH / MANIFEST_FILE, text.encode('utf-8'))
+
+def load_existing_implementations():
+    """Load the current rl.json entries keyed by path."""
     data_path = BASE_PATH / DATA_FILE
     if not data_path.exists():
-        print("❌ RL JSON data not found. Run JSON generation first.")
-        return False
+        return {}
+    try:
+        with open(data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {impl['path']: impl for impl in data.get('rl_implementations', []) if impl.get('path')}
+
+@profiled
+def process_directory(path="", parent_name="", checkpoint=None):
+    """Wrapper function for backward compatibility."""
+    return process_directory_recursive(path, parent_name, max_depth=10, checkpoint=checkpoint)
+
+def crawl_key(crawl, max_depth=10):
+    """What a crawl checkpoint must match to be resumed."""
+    return {"repository": f"{REPO_OWNER}/{REPO_NAME}", "ref": REPO_BRANCH, "crawl": crawl, "max_depth": max_depth}
+
+@profiled
+def generate_rl_json(crawl="tree", incremental=True, resume=True):
+    """Generate the RL JSON data file.
+
+    The tree crawl is incremental by default: only READMEs whose blob SHA differs
+    from the manifest are refetched. Pass incremental=False to rebuild everything.
+    The tarball crawl always rebuilds everything from a single download.
+
+    The tree and contents crawls checkpoint their progress under .cache/crawls/.
+    If a fetch fails the crawl stops, rl.json is left untouched and the next run
+    resumes from the checkpoint (resume=False discards it). rl.json and the
+    manifest are only written once a crawl is complete.
+    """
+    print("🚀 Starting RL data generation...")
     
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Fetch all RL implementations
+    implementations = None
+    readme_shas = None
+    previous_entries = {}
+    checkpoints = []
+    try:
+        if crawl == "tree":
+            known_shas = load_manifest() if incremental else {}
+            if known_shas:
+                previous_entries = load_existing_implementations()
+            if previous_entries:
+                print(f"📒 Manifest has {len(known_shas)} README SHAs from the last refresh")
+            else:
+                # Without the entries the manifest describes there is nothing to reuse
+                known_shas = {}
+            checkpoints.append(CrawlCheckpoint('rl-tree', crawl_key('tree'), resume=resume))
+            result = process_repository_tree(known_shas=known_shas, previous_entries=previous_entries,
+                                             checkpoint=checkpoints[-1])
+            if result is None:
+                print("↩️  Falling back to the contents API crawl")
+            else:
+                implementations, readme_shas = result
+        elif crawl == "tarball":
+            implementations = process_repository_tarball()
+            if implementations is None:
+                print("↩️  Falling back to the contents API crawl")
+        if implementations is None:
+            checkpoints.append(CrawlCheckpoint('rl-contents', crawl_key('contents'), resume=resume))
+            implementations = process_directory(checkpoint=checkpoints[-1])
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Crawl stopped: {e}")
+        if checkpoints:
+            print(f"⏸️  {len(checkpoints[-1])} folders saved to {checkpoints[-1].path}; run again to resume")
+        print(f"✋ {DATA_FILE} was left unchanged")
+        return False
+    finally:
+        for checkpoint in checkpoints:
+            checkpoint.close()
     
-    implementations = data.get('rl_implementations', [])
     if not implementations:
-        print("❌ No RL implementations found in JSON data.")
+        print("❌ No RL implementations found!")
+        for checkpoint in checkpoints:
+            checkpoint.clear()
         return False
     
-    # Create output directory
-    models_path = BASE_PATH / MODELS_DIR
-    models_path.mkdir(exist_ok=True)
-    
-    # Clear existing files
-    for existing_file in models_path.glob('*.md'):
-        existing_file.unlink()
-        print(f"🗑️  Removed old file: {existing_file.name}")
+    # The crawl is complete: commit it
+    # READMEs go to the blob store; rl.json keeps only their hashes
+    with span('dehydrate_entries'):
+        implementations = dehydrate_entries(implementations)
     
-    # Filter out obvious non-algorithm directories but keep all with README content
-    main_implementations = []
-    for impl in implementations:
-        name_lower = impl['name'].lower()
-        path_lower = impl['path'].lower()
-        
-        # Skip obvious non-algorithm folders
-        skip_patterns = ['images', 'assets', 'docs', '__pycache__', 'node_modules', '.git']
-        
-        # Skip if it's clearly a non-algorithm folder
-        if any(skip in name_lower for skip in skip_patterns):
-            continue
-            
-        # Skip if path contains obvious non-algorithm patterns
-        if any(skip in path_lower for skip in skip_patterns):
-            continue
-            
-        # Include if it has substantial README content (likely an algorithm)
-        if impl['readme_content'] and len(impl['readme_content'].strip()) > 50:
-            main_implementations.append(impl)
-        # Also include top-level directories even without README
-        elif impl['path'].count('/') == 0:
-            main_implementations.append(impl)
+    if previous_entries and implementations == list(previous_entries.values()):
+        print(f"✅ {DATA_FILE} is already up to date ({len(implementations)} RL implementations)")
+    else:
+        rl_data = {
+            "rl_implementations": implementations
+        }
+        with span('write rl.json'):
+            write_atomic(BASE_PATH / DATA_FILE, json.dumps(rl_data, indent=2, ensure_ascii=False).encode('utf-8'))
+        print(f"✅ Generated {DATA_FILE} with {len(implementations)} RL implementations")
     
-    # Generate markdown files
-    successful_count = 0
-    for index, impl in enumerate(main_implementations, 1):
-        try:
-            name = impl['display_name']
-            slug = re.sub(r'[^\w\s-]', '', name.lower())
-            slug = re.sub(r'[-\s]+', '-', slug).strip('-')
-            
-            filename = f"{index:02d}-{slug}.md"
-            filepath = models_path / filename
-            
-            # Generate markdown content
-            content = f"""---
+    # The manifest describes rl.json, so it is only saved once rl.json is
+    if readme_shas is not None:
+        save_manifest(readme_shas)
+    write_listing_index('rl', implementations)
+    for checkpoint in checkpoints:
+        checkpoint.clear()
+    return True
+
+def rl_slug(impl):
+    """File slug of an implementation's page (used for first-time registry names)."""
+    name = impl.get('display_name', impl['name'])
+    slug = re.sub(r'[^\w\s-]', '', name.lower())
+    return re.sub(r'[-\s]+', '-', slug).strip('-')
+
+@profiled
+def render_rl_markdown(impl, index):
+    """Markdown page of one RL implementation (runs in a render worker)."""
+    name = impl['display_name']
+    return f"""---
 title: "{name}"
 excerpt: "{impl['description']}"
 collection: rl
@@ -427,6 +570,7 @@ framework: "{impl['framework']}"
 environment: "{impl['environment']}"
 github_url: "{impl['github_url']}"
 date: {impl['github_date']}
+order: {index}
 ---
 
 ## Overview
@@ -458,35 +602,113 @@ Please refer to the GitHub repository for detailed usage instructions and traini
 
 View the complete implementation, training scripts, and documentation on GitHub.
 """
+
+@profiled
+def generate_markdown_files(jobs=None):
+    """Generate individual markdown files for each RL implementation."""
+    # Read the JSON data
+    data_path = BASE_PATH / DATA_FILE
+    if not data_path.exists():
+        print("❌ RL JSON data not found. Run JSON generation first.")
+        return False
+    
+    with span('load rl.json'):
+        with open(data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        implementations = hydrate_entries(data.get('rl_implementations', []))
+    if not implementations:
+        print("❌ No RL implementations found in JSON data.")
+        return False
+    
+    # Pages are only rewritten when their content changes; stale ones are removed at the end
+    sync = DirectorySync(BASE_PATH / MODELS_DIR, '*.md')
+    registry = SlugRegistry.load()
+    
+    # Filter out obvious non-algorithm directories but keep all with README content
+    main_implementations = []
+    for impl in implementations:
+        name_lower = impl['name'].lower()
+        path_lower = impl['path'].lower()
+        
+        # Skip obvious non-algorithm folders
+        skip_patterns = ['images', 'assets', 'docs', '__pycache__', 'node_modules', '.git']
+        
+        # Skip if it's clearly a non-algorithm folder
+        if any(skip in name_lower for skip in skip_patterns):
+            continue
             
-            # Write the file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ Generated: {filename}")
-            successful_count += 1
+        # Skip if path contains obvious non-algorithm patterns
+        if any(skip in path_lower for skip in skip_patterns):
+            continue
             
-        except Exception as e:
-            print(f"❌ Error generating file for {impl['name']}: {e}")
+        # Include if it has substantial README content (likely an algorithm)
+        if impl['readme_content'] and len(impl['readme_content'].strip()) > 50:
+            main_implementations.append(impl)
+        # Also include top-level directories even without README
+        elif impl['path'].count('/') == 0:
+            main_implementations.append(impl)
+    
+    # Permanent filenames are assigned here, in list order
+    filenames = []
+    for index, impl in enumerate(main_implementations, 1):
+        slug = rl_slug(impl)
+        # File names are permanent; the list position only goes into the frontmatter
+        filenames.append(registry.filename('rl', impl['path'], slug, directory=sync.directory,
+                                           legacy=f"{index:02d}-{slug}"))
     
+    # Render in worker processes; results come back in list order and are written here
+    with span('render', pages=len(main_implementations)):
+        results = render_ordered(render_rl_markdown,
+                                 [(impl, index) for index, impl in enumerate(main_implementations, 1)], jobs)
+    
+    successful_count = 0
+    errors = []
+    with span('write pages'):
+        for impl, filename, (content, error) in zip(main_implementations, filenames, results):
+            if error:
+                # Keep the previous page rather than deleting it as stale
+                sync.keep(filename)
+                errors.append((impl['name'], error))
+                continue
+            status = sync.write(filename, content)
+            if status != 'unchanged':
+                print(f"✅ {status.capitalize()}: {filename}")
+            successful_count += 1
+        
+        registry.save()
+        sync.remove_stale()
+    sync.report()
     print(f"\n🎉 Successfully generated {successful_count} RL markdown files")
-    return True
+    report_errors(errors)
+    return not errors
 
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description='Refresh RL implementations data')
     parser.add_argument('--json-only', action='store_true', help='Only generate JSON data')
     parser.add_argument('--md-only', action='store_true', help='Only generate markdown files')
+    parser.add_argument('--crawl', choices=['tree', 'tarball', 'contents'], default='tree',
+                        help='tree: one recursive git-tree listing (default); tarball: one streamed repository '
+                             'tarball; contents: per-folder contents API walk')
+    parser.add_argument('--full', action='store_true',
+                        help='Ignore the README SHA manifest and refetch every README')
+    parser.add_argument('--restart', action='store_true',
+                        help='Discard the checkpoint of an interrupted crawl instead of resuming it')
+    add_jobs_argument(parser)
+    add_profile_argument(parser)
     args = parser.parse_args()
+    start_profile(args.profile, 'refresh_rl')
     
     if args.md_only:
-        generate_markdown_files()
+        return generate_markdown_files(args.jobs)
     elif args.json_only:
-        generate_rl_json()
+        return generate_rl_json(args.crawl, incremental=not args.full, resume=not args.restart)
     else:
         # Generate both
-        if generate_rl_json():
-            generate_markdown_files()
+        return (generate_rl_json(args.crawl, incremental=not args.full, resume=not args.restart)
+                and generate_markdown_files(args.jobs))
 
 if __name__ == "__main__":
-    main()
+    success = main()
+    print_cache_report()
+    sys.exit(0 if success else 1)
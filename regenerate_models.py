@@ -9,6 +9,12 @@ import os
 import re
 from datetime import datetime
 
+from atomic_writer import DirectorySync
+from slug_registry import SlugRegistry
+from readme_store import readme_of
+from link_rewriter import images_to_links, raw_base_url_for
+from classifier import classify
+
 def slugify(text):
     """Convert text to a URL-friendly slug"""
     slug = re.sub(r'[^\w\s-]', '', text.lower())
@@ -17,116 +23,20 @@ def slugify(text):
 
 def convert_images_to_links(content, github_url):
     """Convert image markdown to hyperlinks pointing to raw.githubusercontent.com"""
-    raw_base_url = (
-        github_url
-        .replace('https://github.com/', 'https://raw.githubusercontent.com/')
-        .replace('/tree/master/', '/master/')
-        .replace('/tree/main/', '/main/')
-    )
-    
-    def replace_image(match):
-        alt_text = match.group(1)
-        image_path = match.group(2)
-        
-        # Create appropriate link text based on alt text
-        if 'loss' in alt_text.lower():
-            link_text = "📊 View Training Loss Curves"
-        elif 'train' in alt_text.lower() and 'val' in alt_text.lower():
-            link_text = "📈 View Train and Validation Loss"
-        elif 'result' in alt_text.lower():
-            link_text = "🖼️ View Results"
-        elif 'sample' in alt_text.lower():
-            link_text = "🎨 View Generated Samples"
-        elif 'architecture' in alt_text.lower():
-            link_text = "🏗️ View Model Architecture"
-        elif 'output' in alt_text.lower():
-            link_text = "📋 View Model Output"
-        elif 'arithmetic' in alt_text.lower():
-            link_text = "🔢 View Latent Arithmetic"
-        else:
-            link_text = f"🔗 View {alt_text}"
-        
-        # Skip if already an absolute URL
-        if image_path.startswith('http://') or image_path.startswith('https://'):
-            github_image_url = image_path
-        else:
-            # Create raw GitHub URL
-            github_image_url = f"{raw_base_url}/{image_path}"
-        
-        # Return as hyperlink
-        return f"[{link_text}]({github_image_url})"
-    
-    # Find and replace all image references
-    image_pattern = r'!\[([^\]]*)\]\(([^)]+\.(jpg|jpeg|png|gif|svg))\)'
-    return re.sub(image_pattern, replace_image, content)
-
-def extract_framework_and_dataset(readme_content, description):
-    """Extract framework and dataset information from readme content"""
-    framework = "PyTorch"  # Default
-    dataset = "Custom"     # Default
-    category = "Machine Learning"  # Default
-    
-    # Look for framework mentions
-    content_lower = (readme_content + " " + description).lower()
-    if 'pytorch' in content_lower:
-        framework = "PyTorch"
-    elif 'tensorflow' in content_lower:
-        framework = "TensorFlow"
-    elif 'jax' in content_lower:
-        framework = "JAX"
-    elif 'huggingface' in content_lower:
-        framework = "HuggingFace"
-    
-    # Look for dataset mentions
-    if 'mnist' in content_lower:
-        dataset = "MNIST"
-    elif 'imagenet' in content_lower:
-        dataset = "ImageNet"
-    elif 'cifar' in content_lower:
-        dataset = "CIFAR"
-    elif 'coco' in content_lower:
-        dataset = "COCO"
-    elif 'flickr' in content_lower:
-        dataset = "Flickr"
-    elif 'cornell' in content_lower:
-        dataset = "Cornell Movie Dialog"
-    elif 'ultrafeedback' in content_lower:
-        dataset = "UltraFeedback"
-    elif 'gigaspeech' in content_lower:
-        dataset = "Gigaspeech"
-    elif 'custom' in content_lower:
-        dataset = "Custom"
-    
-    # Determine category based on model name and content
-    model_lower = (readme_content + " " + description).lower()
-    if any(term in model_lower for term in ['gpt', 'bert', 'llama', 'gemma', 'transformer', 'language', 'dpo', 'orpo', 'peft', 'lora']):
-        category = "Language Models"
-    elif any(term in model_lower for term in ['gan', 'dcgan', 'wgan', 'cgan', 'cyclegan', 'pix2pix']):
-        category = "Generative Models"
-    elif any(term in model_lower for term in ['vit', 'clip', 'vision', 'image', 'siglip', 'paligemma']):
-        category = "Computer Vision"
-    elif any(term in model_lower for term in ['whisper', 'tts', 'audio', 'clap']):
-        category = "Audio Processing"
-    elif any(term in model_lower for term in ['vae', 'autoencoder']):
-        category = "Unsupervised Learning"
-    elif any(term in model_lower for term in ['rnn', 'lstm', 'gru', 'seq2seq', 'encoder', 'decoder']):
-        category = "Sequential Models"
-    elif any(term in model_lower for term in ['attention']):
-        category = "Attention Mechanisms"
-    elif any(term in model_lower for term in ['distributed', 'ddp', 'training']):
-        category = "Training Optimization"
-    
-    return framework, dataset, category
+    return images_to_links(content, raw_base_url_for(github_url))
 
 def create_markdown_from_json(model_data, file_number):
     """Create markdown content from JSON model data"""
     name = model_data.get('name', 'Unknown Model')
     description = model_data.get('description', 'No description available')
-    readme_content = model_data.get('readme_content', '')
+    readme_content = readme_of(model_data)
     github_url = model_data.get('github_url', '')
     
-    # Extract additional metadata
-    framework, dataset, category = extract_framework_and_dataset(readme_content, description)
+    # Extract additional metadata (rules in _rules/classification.json)
+    labels = classify(['model_framework', 'model_dataset', 'model_content_category'],
+                      description=description, readme=readme_content)
+    framework, dataset = labels['model_framework'], labels['model_dataset']
+    category = labels['model_content_category']
     
     # Use GitHub date if available, otherwise use current date as fallback
     github_date = model_data.get('github_date') or model_data.get('created_date')
@@ -161,6 +71,7 @@ framework: "{framework}"
 dataset: "{dataset}"
 github_url: "{github_url}"
 date: {model_date}
+order: {file_number}
 ---
 
 ## Overview
@@ -196,8 +107,9 @@ def main():
         print("No models found in JSON!")
         return
     
-    # Create models directory if it doesn't exist
-    os.makedirs(models_dir, exist_ok=True)
+    # Unchanged pages are not rewritten; only registry-named pages are ever removed
+    sync = DirectorySync(models_dir, '*.md')
+    registry = SlugRegistry.load()
     
     print(f"Regenerating {len(models)} model files from models.json...")
     
@@ -205,19 +117,19 @@ def main():
     for i, model in enumerate(models, 1):
         name = model.get('name', f'Model {i}')
         
-        # Create filename
-        filename = f"{i:02d}-{slugify(name)}.md"
-        filepath = os.path.join(models_dir, filename)
+        # Permanent filename; the list position only goes into the frontmatter
+        filename = registry.filename('models', name, slugify(name), directory=models_dir,
+                                     legacy=f"{i:02d}-{slugify(name)}")
         
         # Generate markdown content using ONLY JSON data
         markdown_content = create_markdown_from_json(model, i)
         
-        # Write file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        print(f"Created: {filename} -> {name}")
+        if sync.write(filename, markdown_content) != 'unchanged':
+            print(f"Written: {filename} -> {name}")
     
+    registry.save()
+    sync.remove_stale(owned=registry.owned('models'))
+    sync.report()
     print(f"\nSuccessfully regenerated {len(models)} model files!")
     print("All files now use EXACT data from models.json (GitHub API)")
 
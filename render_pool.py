@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Process-pool rendering for the markdown generators.
+
+Rendering a page runs several regex passes over a full README, which is CPU
+bound, so the generators fan it out over a process pool (threads would just
+take turns on the GIL). Each item is rendered by a top-level function in a
+worker; results come back in input order and the parent process writes them
+through its DirectorySync, so output is identical to a sequential run.
+
+A failing item does not stop the run: its error is collected and returned
+next to the other results, and report_errors() prints one line per item.
+
+Usage:
+    results = render_ordered(generate_model_markdown, [(model, i) for i, model in ...], jobs)
+    for (content, error), model in zip(results, models):
+        ...
+
+    add_jobs_argument(parser)        # adds --jobs N (default: CPU count)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from profiler import disable_in_worker
+
+DEFAULT_JOBS = os.cpu_count() or 1
+
+
+def add_jobs_argument(parser):
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS,
+                        help=f'Render pages in N worker processes (default: CPU count, {DEFAULT_JOBS}; 1 disables the pool)')
+
+
+def _render(func, args):
+    """Run one render call, turning an exception into an error string."""
+    try:
+        return func(*args), None
+    except Exception as e:
+        return None, f"{e.__class__.__name__}: {e}"
+
+
+def render_ordered(func, arg_tuples, jobs=None):
+    """[(content, error), ...] for func(*args) over arg_tuples, in input order.
+
+    func must be a module-level function so the workers can unpickle it.
+    """
+    arg_tuples = list(arg_tuples)
+    jobs = max(1, min(jobs or DEFAULT_JOBS, len(arg_tuples) or 1))
+    call = partial(_render, func)
+    if jobs == 1:
+        return [call(args) for args in arg_tuples]
+    # A few chunks per worker keeps pickling overhead low and the load balanced
+    chunksize = max(1, len(arg_tuples) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=disable_in_worker) as pool:
+        return list(pool.map(call, arg_tuples, chunksize=chunksize))
+
+
+def report_errors(errors):
+    """Print collected render errors; errors is a list of (item label, message)."""
+    if not errors:
+        return
+    print(f"\n❌ {len(errors)} item(s) failed to render:")
+    for label, message in errors:
+        print(f"   - {label}: {message}")
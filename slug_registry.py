@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Permanent file names for the generated collections.
+
+Generated pages used to be named "<list position>-<slug>.md", so one folder
+inserted upstream renamed every page after it. Collection permalinks are
+/:collection/:path/, which means every one of those renames was also a
+changed URL. The registry in _state/slugs.json instead maps each item's
+stable key (RL path, model/dataset/project name) to a file name that is
+assigned the first time the item is seen and never changes afterwards:
+
+    {"rl": {"PPO/Atari": "17-atari-ppo-atari", "GRPO": "grpo"}, ...}
+
+Items that already have a page adopt its current name, so introducing the
+registry renames nothing. New items get their bare slug (with -2, -3, ...
+on a clash). The list position is written to the page frontmatter as
+`order` instead of into the name, and the listing pages (_pages/rl.html,
+models.html, datasets.html, smolhub.html) sort their collection by it.
+
+Usage:
+    registry = SlugRegistry.load()
+    filename = registry.filename('rl', impl['path'], slug, directory='_rl',
+                                 legacy=f"{index:02d}-{slug}")
+    ...
+    registry.save()
+
+    python slug_registry.py            # show the registry
+"""
+
+import json
+from pathlib import Path
+
+from atomic_writer import write_if_changed
+
+BASE_PATH = Path(__file__).parent
+REGISTRY_FILE = BASE_PATH / "_state" / "slugs.json"
+
+
+class SlugRegistry:
+    """{collection: {item key: file stem}} persisted in _state/slugs.json."""
+
+    def __init__(self, data=None, path=REGISTRY_FILE):
+        self.path = Path(path)
+        self.data = data or {}
+
+    @classmethod
+    def load(cls, path=REGISTRY_FILE):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f), path)
+        except FileNotFoundError:
+            return cls({}, path)
+
+    def save(self):
+        """Write the registry if it changed; returns True when it was written."""
+        text = json.dumps(self.data, indent=2, ensure_ascii=False, sort_keys=True) + '\n'
+        return write_if_changed(self.path, text) != 'unchanged'
+
+    def filename(self, collection, key, slug, directory=None, legacy=None):
+        """Permanent file name for an item, assigning one on first sight.
+
+        `legacy` is the name the item's page had before the registry existed;
+        when that page is present in `directory` and unclaimed it is adopted.
+        """
+        names = self.data.setdefault(collection, {})
+        if key in names:
+            return f"{names[key]}.md"
+
+        taken = set(names.values())
+        directory = Path(directory) if directory else None
+        if legacy and legacy not in taken and directory and (directory / f"{legacy}.md").exists():
+            stem = legacy
+        else:
+            stem, n = slug, 2
+            while stem in taken or (directory and (directory / f"{stem}.md").exists()):
+                stem = f"{slug}-{n}"
+                n += 1
+        names[key] = stem
+        return f"{stem}.md"
+
+    def forget(self, collection, key):
+        """Drop an item's name, so the next filename() call assigns a fresh one."""
+        self.data.get(collection, {}).pop(key, None)
+
+    def owned(self, collection):
+        """Every file name ever assigned in a collection."""
+        return {f"{stem}.md" for stem in self.data.get(collection, {}).values()}
+
+
+def main():
+    registry = SlugRegistry.load()
+    for collection, names in sorted(registry.data.items()):
+        print(f"📛 {collection}: {len(names)} permanent names")
+        for key, stem in sorted(names.items()):
+            print(f"   {key} -> {stem}.md")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the generation pipeline.
+
+Times every stage from stages.py on the checked-in fixture corpora
+(smolbenchmark/fixtures/) and reports, per stage:
+
+- the best of --repeat timed runs over the corpus repeated --scale times
+  (the runs of the different stages are interleaved)
+- throughput in documents/s and MB/s of input text
+- peak memory: Python allocations during one pass (tracemalloc) for the
+  in-process stages, the child's max RSS for the generator runs
+
+Results go to smolbenchmark/results/latest.json (or --output). With
+--compare the run is checked against a saved baseline: a stage that got
+slower or bigger than the baseline by more than --threshold (and by more
+than a small absolute amount, so tiny stages do not flap) is reported as a
+regression and the exit status is 1. The comparison is made in units of a
+fixed calibration workload timed right before every run, so a machine that
+is uniformly slower today (load, frequency scaling) does not read as a
+regression of every stage.
+
+Usage:
+    python smolbenchmark/bench.py                        # everything
+    python smolbenchmark/bench.py --only classify,tables # stage names containing these
+    python smolbenchmark/bench.py --no-generators
+    python smolbenchmark/bench.py --compare              # against smolbenchmark/baseline.json
+    python smolbenchmark/bench.py --save-baseline        # make this run the baseline
+    python smolbenchmark/bench.py --freeze-fixtures      # re-snapshot fixtures from the site (invalidates the baseline)
+
+Baselines are machine-specific: save one on the machine that compares
+against it.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+from stages import (BENCH_DIR, CATALOG_FIXTURES, FIXTURES_DIR, GENERATORS, PAGES_DIR, REPO_ROOT,
+                    build_stages, load_corpora)
+
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+RESULTS_FILE = BENCH_DIR / "results" / "latest.json"
+# Pages copied into fixtures/pages by --freeze-fixtures
+FIXTURE_PAGES = {"_models": 20, "_rl": 10}
+# Regressions smaller than these are treated as noise
+MIN_SECONDS_DELTA = 0.002
+MIN_PEAK_KB_DELTA = 64
+CALIBRATION_RE = re.compile(r'[0-9]+$')
+
+# Runs a script as __main__ and records its max RSS (KB) in $BENCH_RSS_FILE.
+# On Linux ru_maxrss survives fork+exec, so it would report the bench process
+# itself whenever that is bigger; VmHWM is reset at exec and is the child's own.
+RSS_WRAPPER = """
+import atexit, os, resource, runpy, sys
+def _peak_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+def _record():
+    rss = _peak_kb()
+    with open(os.environ['BENCH_RSS_FILE'], 'w') as f:
+        f.write(str(rss))
+atexit.register(_record)
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.getcwd())
+runpy.run_path(sys.argv[0], run_name='__main__')
+"""
+
+
+def fixtures_digest():
+    """SHA-256 over every fixture file, so results on different fixtures are never compared."""
+    digest = hashlib.sha256()
+    for path in sorted(FIXTURES_DIR.rglob('*')):
+        if path.is_file():
+            digest.update(path.relative_to(FIXTURES_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def stage_result(times, docs, size, peak_kb, calibrations):
+    """Result of a stage from its run times and the calibration time measured just before each run."""
+    best = min(times)
+    relative = statistics.median(seconds / calibration for seconds, calibration in zip(times, calibrations))
+    return {
+        'seconds': round(best, 6),
+        'median_seconds': round(statistics.median(times), 6),
+        'docs': docs,
+        'bytes': size,
+        'docs_per_s': round(docs / best, 1) if best else None,
+        'mb_per_s': round(size / best / 1e6, 3) if best else None,
+        'peak_kb': peak_kb,
+        # per-document time in units of the calibration workload: what --compare compares
+        'relative': round(relative / docs, 9),
+    }
+
+
+def time_stage(func, docs, scale):
+    """Seconds for one pass of func over docs x scale."""
+    started = time.perf_counter()
+    for _ in range(scale):
+        for doc in docs:
+            func(doc)
+    return time.perf_counter() - started
+
+
+def trace_stage(func, docs):
+    """Peak KB of Python allocations during one pass of func over docs."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    for doc in docs:
+        func(doc)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return round(peak / 1024)
+
+
+def calibration():
+    """A fixed pure-Python workload (string building, regex, dicts, sorting) timing the machine itself."""
+    words = [f"word{i % 997}-{i}" for i in range(20000)]
+    counts = {}
+    for word in words:
+        key = CALIBRATION_RE.sub('', word)
+        counts[key] = counts.get(key, 0) + len(word)
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:10]
+
+
+def time_calibration():
+    started = time.perf_counter()
+    calibration()
+    return time.perf_counter() - started
+
+
+def run_stages(stages, corpora, scale, repeat):
+    """{stage: result}, the timed passes interleaved round-robin over the stages.
+
+    A slow patch of the machine (another process, frequency scaling) then
+    costs every stage one run instead of costing one stage all of its runs,
+    and the best-of-repeat drops it.
+    """
+    for name, (corpus, func) in stages.items():
+        print(f"⏱️  {name} ...", flush=True)
+        for doc in corpora[corpus]:
+            func(doc)  # warm up: imports, regex compilation, memo tables
+    times = {name: [] for name in stages}
+    calibrations = {name: [] for name in stages}
+    for _ in range(repeat):
+        for name, (corpus, func) in stages.items():
+            calibrations[name].append(time_calibration())
+            times[name].append(time_stage(func, corpora[corpus], scale))
+
+    results = {}
+    for name, (corpus, func) in stages.items():
+        docs = corpora[corpus]
+        size = sum(len(doc['text'].encode('utf-8')) for doc in docs)
+        results[name] = dict(stage_result(times[name], len(docs) * scale, size * scale, trace_stage(func, docs),
+                                          calibrations[name]), kind='stage', corpus=corpus)
+    return results
+
+
+def make_workspace():
+    """A scratch copy of the site code whose _data catalogs are the fixtures."""
+    workspace = Path(tempfile.mkdtemp(prefix='smolbenchmark-'))
+    for path in REPO_ROOT.glob('*.py'):
+        shutil.copy2(path, workspace / path.name)
+    for directory in ('_rules', '_templates'):
+        if (REPO_ROOT / directory).is_dir():
+            shutil.copytree(REPO_ROOT / directory, workspace / directory)
+    (workspace / '_data').mkdir()
+    for fixture, (catalog, _) in CATALOG_FIXTURES.items():
+        shutil.copy2(FIXTURES_DIR / fixture, workspace / catalog)
+    return workspace
+
+
+def run_generator(workspace, argv, output_dir):
+    """(wall seconds, max RSS KB) of one generator run starting from empty output."""
+    env = dict(os.environ, BENCH_RSS_FILE=str(workspace / '.rss'),
+               GITHUB_CACHE_DIR=str(workspace / '.cache' / 'github'))
+    shutil.rmtree(workspace / output_dir, ignore_errors=True)
+    shutil.rmtree(workspace / '_state', ignore_errors=True)
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', RSS_WRAPPER, *argv], cwd=workspace, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"{argv[0]} exited with {proc.returncode}: {proc.stderr.strip()[-500:]}")
+    return elapsed, int((workspace / '.rss').read_text())
+
+
+def run_generators(generators, repeat):
+    """{generator: result} in a scratch workspace, the timed runs interleaved like run_stages."""
+    workspace = make_workspace()
+    try:
+        for name, (argv, _, output_dir) in generators.items():
+            print(f"⏱️  {name} ...", flush=True)
+            run_generator(workspace, argv, output_dir)  # warm up the bytecode cache
+        runs = {name: [] for name in generators}
+        for _ in range(repeat):
+            for name, (argv, _, output_dir) in generators.items():
+                calibration_seconds = time_calibration()
+                runs[name].append((*run_generator(workspace, argv, output_dir), calibration_seconds))
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    results = {}
+    for name, (_, fixture, _) in generators.items():
+        with open(FIXTURES_DIR / fixture, 'r', encoding='utf-8') as f:
+            entries = json.load(f)[CATALOG_FIXTURES[fixture][1]]
+        size = sum(len((entry.get('readme_content') or '').encode('utf-8')) for entry in entries)
+        times = [seconds for seconds, _, _ in runs[name]]
+        peak_kb = max(peak for _, peak, _ in runs[name])
+        calibrations = [calibration_seconds for _, _, calibration_seconds in runs[name]]
+        results[name] = dict(stage_result(times, len(entries), size, peak_kb, calibrations),
+                             kind='generator', corpus=fixture)
+    return results
+
+
+def run_all(args):
+    selected = [name.strip() for name in args.only.split(',')] if args.only else None
+
+    def wanted(name):
+        return not selected or any(part in name for part in selected)
+
+    stages = {name: spec for name, spec in build_stages().items() if wanted(name)}
+    results = run_stages(stages, load_corpora(), args.scale, args.repeat)
+
+    generators = {name: spec for name, spec in GENERATORS.items() if wanted(name)}
+    if generators and not args.no_generators:
+        results.update(run_generators(generators, args.generator_repeat))
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'scale': args.scale,
+            'repeat': args.repeat,
+            'generator_repeat': args.generator_repeat,
+            'fixtures_sha256': fixtures_digest(),
+        },
+        'stages': results,
+    }
+
+
+def compare(results, baseline, threshold, memory_threshold):
+    """{stage: verdict} against a baseline; returns (rows, regressions)."""
+    rows, regressions = {}, []
+    if baseline['meta'].get('fixtures_sha256') != results['meta']['fixtures_sha256']:
+        regressions.append("fixtures differ from the baseline's; re-run with --save-baseline")
+        return rows, regressions
+    for name, result in results['stages'].items():
+        base = baseline['stages'].get(name)
+        if not base:
+            rows[name] = 'new'
+            continue
+        # Per-document times, so baselines taken at another --scale still apply; the ratio is
+        # taken in calibration units so a uniformly slower machine does not fail every stage
+        now, before = result['seconds'] / result['docs'], base['seconds'] / base['docs']
+        ratio = result['relative'] / base['relative'] if base.get('relative') else now / before
+        verdicts = [f"{(ratio - 1) * 100:+.0f}%"]
+        if ratio > 1 + threshold and (ratio - 1) * before * result['docs'] > MIN_SECONDS_DELTA:
+            regressions.append(f"{name}: {ratio:.2f}x the baseline's calibrated time per document "
+                               f"(raw {base['docs_per_s']} -> {result['docs_per_s']} docs/s)")
+            verdicts.append('❌ slower')
+        if (base.get('peak_kb') and result['peak_kb'] > base['peak_kb'] * (1 + memory_threshold)
+                and result['peak_kb'] - base['peak_kb'] > MIN_PEAK_KB_DELTA):
+            regressions.append(f"{name}: peak memory {base['peak_kb']} -> {result['peak_kb']} KB")
+            verdicts.append('❌ memory')
+        rows[name] = ' '.join(verdicts)
+    return rows, regressions
+
+
+def print_table(results, verdicts):
+    print(f"\n{'stage':<52} {'docs':>6} {'ms':>9} {'docs/s':>10} {'MB/s':>8} {'peak KB':>9}  baseline")
+    for name, result in results['stages'].items():
+        print(f"{name:<52} {result['docs']:>6} {result['seconds'] * 1000:>9.1f} "
+              f"{result['docs_per_s'] or 0:>10.1f} {result['mb_per_s'] or 0:>8.2f} {result['peak_kb']:>9}  "
+              f"{verdicts.get(name, '')}")
+
+
+def freeze_fixtures():
+    """Snapshot the site catalogs (README bodies inline) and a few pages as the fixture corpora."""
+    from atomic_writer import write_if_changed
+    from readme_store import hydrate_entries
+
+    for fixture, (catalog, key) in CATALOG_FIXTURES.items():
+        with open(REPO_ROOT / catalog, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        hydrate_entries(data[key])
+        write_if_changed(FIXTURES_DIR / fixture, json.dumps(data, indent=2, ensure_ascii=False) + '\n')
+        print(f"📦 {fixture}: {len(data[key])} entries")
+    PAGES_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in PAGES_DIR.glob('*.md'):
+        stale.unlink()
+    for directory, count in FIXTURE_PAGES.items():
+        for path in sorted((REPO_ROOT / directory).glob('*.md'))[:count]:
+            shutil.copy2(path, PAGES_DIR / f"{directory.lstrip('_')}-{path.name}")
+    print(f"📄 pages: {len(list(PAGES_DIR.glob('*.md')))}")
+    print("⚠️  Fixtures changed: save a new baseline with --save-baseline")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the generation pipeline on fixture corpora')
+    parser.add_argument('--only', help='Comma-separated substrings; run only stages whose name contains one')
+    parser.add_argument('--no-generators', action='store_true', help='Skip the full generator runs')
+    parser.add_argument('--scale', type=int, default=20, help='Repeat each corpus N times per timed run (default: 20)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per stage; the best counts (default: 5)')
+    parser.add_argument('--generator-repeat', type=int, default=5, help='Timed runs per generator (default: 5)')
+    parser.add_argument('--output', default=str(RESULTS_FILE), help=f'Results JSON (default: {RESULTS_FILE.relative_to(REPO_ROOT)})')
+    parser.add_argument('--compare', nargs='?', const=str(BASELINE_FILE), metavar='BASELINE',
+                        help='Fail on regressions against a baseline JSON (default: smolbenchmark/baseline.json)')
+    parser.add_argument('--threshold', type=float, default=0.5, help='Allowed slowdown before failing (default: 0.5)')
+    parser.add_argument('--memory-threshold', type=float, default=0.25,
+                        help='Allowed peak memory growth before failing (default: 0.25)')
+    parser.add_argument('--save-baseline', action='store_true', help=f'Also write the results to {BASELINE_FILE.name}')
+    parser.add_argument('--freeze-fixtures', action='store_true', help='Re-snapshot the fixture corpora from the site and exit')
+    args = parser.parse_args()
+
+    if args.freeze_fixtures:
+        freeze_fixtures()
+        return True
+
+    from atomic_writer import write_atomic
+
+    results = run_all(args)
+    payload = (json.dumps(results, indent=2) + '\n').encode('utf-8')
+    write_atomic(args.output, payload)
+
+    verdicts, regressions = {}, []
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            verdicts, regressions = compare(results, json.load(f), args.threshold, args.memory_threshold)
+
+    print_table(results, verdicts)
+    print(f"\n💾 Results: {args.output}")
+    if args.save_baseline:
+        write_atomic(BASELINE_FILE, payload)
+        print(f"📌 Baseline saved: {BASELINE_FILE}")
+
+    if regressions:
+        print("\n" + "!" * 72)
+        print(f"❌ PERFORMANCE REGRESSION ({len(regressions)}) against {args.compare}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        print("!" * 72)
+        return False
+    if args.compare:
+        print(f"✅ No regressions against {args.compare}")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Check that refresh_models.py leaves the curated model pages alone.
+
+refresh_models.py writes its generated pages into _models/, next to the
+curated pages regenerate_models.py, generate_model_files.py and
+update_models.py maintain. This check runs it, in a scratch copy of the
+site, against a local Paper-Replications stand-in whose folders are named
+exactly like the curated models ("CLiP", "SigLip", ...), which is the case
+where the two used to claim the same file names:
+
+1. a --full refresh
+2. an incremental refresh after a README edit, an inserted folder (so every
+   later folder moves in the listing) and a deleted folder
+
+After each run every checked-in _models/*.md page must be byte-identical,
+and every upstream folder must have exactly one generated page carrying its
+repository_folder header.
+
+Usage:
+    python smolbenchmark/check_refresh_models.py
+    python smolbenchmark/check_refresh_models.py --keep    # leave the scratch copy for inspection
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from frontmatter import read_header
+
+# Folders added on top of the curated model names
+EXTRA_FOLDERS = ["Brand-New-Model"]
+
+
+def git(cwd, *args):
+    subprocess.run(["git", "-c", "user.name=check", "-c", "user.email=check@localhost", *args],
+                   cwd=cwd, check=True, capture_output=True)
+
+
+def make_upstream(path, folders):
+    """A git repository with one README per folder, like Paper-Replications."""
+    path.mkdir()
+    git(path, "init", "--quiet")
+    for folder in folders:
+        write_readme(path, folder, f"# {folder}\n\nImplementation of {folder} from scratch.\n")
+    git(path, "add", "-A")
+    git(path, "commit", "--quiet", "-m", "initial")
+
+
+def write_readme(upstream, folder, text):
+    (upstream / folder).mkdir(exist_ok=True)
+    (upstream / folder / "README.md").write_text(text, encoding="utf-8")
+
+
+def make_workspace(path):
+    """A scratch copy of the site code, catalogs, state and model pages."""
+    path.mkdir()
+    for source in REPO_ROOT.glob("*.py"):
+        shutil.copy2(source, path / source.name)
+    for directory in ("_data", "_models", "_rules", "_state", "_templates"):
+        if (REPO_ROOT / directory).is_dir():
+            shutil.copytree(REPO_ROOT / directory, path / directory)
+
+
+def run_refresh(workspace, upstream, *args):
+    env = dict(os.environ, PAPER_REPLICATIONS_URL=upstream.as_uri())
+    proc = subprocess.run([sys.executable, "refresh_models.py", *args], cwd=workspace, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(proc.stdout + proc.stderr)
+    return proc.returncode == 0
+
+
+def problems(workspace, curated, folders):
+    """What went wrong in a refresh: changed curated pages, missing or duplicate generated ones."""
+    found = []
+    models_dir = workspace / "_models"
+    for name, content in curated.items():
+        page = models_dir / name
+        if not page.exists():
+            found.append(f"curated page {name} was removed")
+        elif page.read_bytes() != content:
+            found.append(f"curated page {name} was modified")
+    pages = {}
+    for page in sorted(models_dir.glob("*.md")):
+        if page.name in curated:
+            continue
+        header = read_header(page)
+        folder = header.value("repository_folder") if header else None
+        pages.setdefault(folder, []).append(page.name)
+    for folder in folders:
+        if len(pages.get(folder, [])) != 1:
+            found.append(f"{folder}: {len(pages.get(folder, []))} generated pages {pages.get(folder, [])}")
+    for folder in set(pages) - set(folders):
+        found.append(f"page(s) {pages[folder]} of {folder!r}, which is not an upstream folder")
+    return found
+
+
+def check(scratch):
+    with open(REPO_ROOT / "_data" / "models.json", "r", encoding="utf-8") as f:
+        data = json.load(f)
+    models = data.get("models", data) if isinstance(data, dict) else data
+    folders = sorted({model["name"] for model in models if isinstance(model, dict)} | set(EXTRA_FOLDERS))
+    curated = {page.name: page.read_bytes() for page in sorted((REPO_ROOT / "_models").glob("*.md"))}
+
+    upstream, workspace = scratch / "Paper-Replications", scratch / "site"
+    make_upstream(upstream, folders)
+    make_workspace(workspace)
+    print(f"🧪 {len(folders)} upstream folders, {len(curated)} curated pages")
+
+    ok = True
+    steps = [("full refresh", ["--full"]), ("incremental refresh", [])]
+    for step, args in steps:
+        if step == "incremental refresh":
+            # Edit one README, insert a folder that sorts first, delete one
+            write_readme(upstream, "CLiP", "# CLiP\n\nUpdated README.\n")
+            write_readme(upstream, "0-Inserted-Model", "# Inserted\n\nA new folder.\n")
+            git(upstream, "rm", "--quiet", "-r", EXTRA_FOLDERS[0])
+            git(upstream, "add", "-A")
+            git(upstream, "commit", "--quiet", "-m", "update")
+            folders = sorted(set(folders) - {EXTRA_FOLDERS[0]} | {"0-Inserted-Model"})
+        if not run_refresh(workspace, upstream, *args):
+            print(f"❌ {step}: refresh_models.py failed")
+            return False
+        found = problems(workspace, curated, folders)
+        if found:
+            ok = False
+            print(f"❌ {step}: {len(found)} problem(s)")
+            for problem in found:
+                print(f"   - {problem}")
+        else:
+            print(f"✅ {step}: curated pages unchanged, one generated page per folder")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that refresh_models.py leaves the curated model pages alone')
+    parser.add_argument('--keep', action='store_true', help='Keep the scratch directory')
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix='check-refresh-models-'))
+    try:
+        return check(scratch)
+    finally:
+        if args.keep:
+            print(f"📁 Scratch copy: {scratch}")
+        else:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the parts of GitHub the fetch scripts talk to.
+
+Serves the repositories of a directory tree (see synthetic_corpus.py; any
+<root>/<owner>/<repo>/ layout works) over HTTP:
+
+    GET  /repos/<owner>/<repo>                          stargazers_count, default_branch
+    GET  /repos/<owner>/<repo>/contents/<path>          folder listings and base64 files
+    GET  /repos/<owner>/<repo>/commits?path=&per_page=  paginated history with Link headers
+    GET  /repos/<owner>/<repo>/git/trees/<ref>?recursive=1
+    GET  /repos/<owner>/<repo>/tarball/<ref>            302 to a streamed .tar.gz, like codeload
+    GET  /raw/<owner>/<repo>/<ref>/<path>               raw.githubusercontent.com
+    POST /graphql                                       repository(owner:, name:) { stargazerCount }
+    GET  /rate_limit, /_stats
+
+Blob SHAs are real git blob hashes, so incremental crawls see exactly the
+files that changed; commit histories and star counts are made up but stable.
+Responses carry ETags (If-None-Match answers 304, free of charge as on
+GitHub) and X-RateLimit-* headers, and faults can be injected:
+
+    --latency / --jitter     milliseconds added to every response
+    --rate-limit / --rate-window
+                             API budget per window; past it, 403 "API rate
+                             limit exceeded" until the reset
+    --error-rate / --error-status
+                             fraction of requests answered with a 5xx
+    --secondary-rate / --retry-after
+                             fraction answered with a secondary-limit 403
+    --fail REGEX=STATUS      always answer matching paths with STATUS
+
+Point the scripts at it through the endpoint variables github_client.py
+reads (GITHUB_API_URL, GITHUB_RAW_URL, GITHUB_GRAPHQL_URL); given a command
+after '--', the server runs it with them set and prints what it served.
+github_ratelimit paces clients at GITHUB_MAX_RATE (10) requests/second; raise
+it to measure the scripts rather than the pacing.
+
+Usage:
+    python smolbenchmark/synthetic_corpus.py /tmp/corpus --rl 100000
+    python smolbenchmark/mock_github.py /tmp/corpus --port 8765          # serve until Ctrl-C
+    GITHUB_MAX_RATE=1000 python smolbenchmark/mock_github.py /tmp/corpus --latency 20 \\
+        -- python refresh_rl.py --crawl tree
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlsplit
+
+DEFAULT_BRANCH = "master"
+TREE_LIMIT = 100_000   # entries GitHub returns before marking a recursive tree truncated
+GRAPHQL_FIELD_RE = re.compile(
+    r'(\w+)\s*:\s*repository\(\s*owner:\s*"([^"]*)"\s*,\s*name:\s*"([^"]*)"\s*\)\s*\{\s*stargazerCount\s*\}')
+LATEST_COMMIT = datetime(2025, 6, 30, 12, 0, tzinfo=timezone.utc)
+
+
+def stable_number(text):
+    return int(hashlib.sha1(text.encode('utf-8')).hexdigest()[:8], 16)
+
+
+def git_order(entries):
+    """Directory entries in git tree order (names compared with a trailing '/' on folders)."""
+    return sorted(entries, key=lambda entry: entry.name + ('/' if entry.is_dir() else ''))
+
+
+class Repo:
+    """One <root>/<owner>/<repo>/ directory served as a repository."""
+
+    def __init__(self, owner, name, root):
+        self.owner = owner
+        self.name = name
+        self.root = Path(root)
+        self.full_name = f"{owner}/{name}"
+        self.head = hashlib.sha1(f"commit {self.full_name}".encode()).hexdigest()
+        self._blob_shas = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, path):
+        """Absolute path of a repository path, or None when it is outside the repository."""
+        target = (self.root / path).resolve() if path else self.root.resolve()
+        root = self.root.resolve()
+        return target if target == root or root in target.parents else None
+
+    def blob_sha(self, path):
+        """git's blob hash of a file, memoised by size and mtime."""
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            sha = self._blob_shas.get(key)
+        if sha is None:
+            data = path.read_bytes()
+            sha = hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+            with self._lock:
+                self._blob_shas[key] = sha
+        return sha
+
+    def tree_sha(self, relative):
+        return hashlib.sha1(f"tree {self.full_name}/{relative}".encode()).hexdigest()
+
+    def walk(self, relative=''):
+        """(relative path, DirEntry) for everything below a folder, in git's pre-order."""
+        with os.scandir(self.root / relative if relative else self.root) as scan:
+            entries = git_order([entry for entry in scan if entry.name != '.git'])
+        for entry in entries:
+            path = f"{relative}/{entry.name}" if relative else entry.name
+            yield path, entry
+            if entry.is_dir():
+                yield from self.walk(path)
+
+    def stars(self):
+        return stable_number(self.full_name) % 5000
+
+    def history(self, path):
+        """Commits touching a path, newest first: stable, 1-6 per folder, 60 for the whole repository."""
+        seed = stable_number(f"{self.full_name}:{path}")
+        count = 60 if not path else 1 + seed % 6
+        date = LATEST_COMMIT - timedelta(days=seed % 600)
+        commits = []
+        for index in range(count):
+            sha = hashlib.sha1(f"{self.full_name}:{path}:{index}".encode()).hexdigest()
+            stamp = date.strftime('%Y-%m-%dT%H:%M:%SZ')
+            person = {'name': 'Yuvraj Singh', 'email': f"{self.owner.lower()}@users.noreply.github.com",
+                      'date': stamp}
+            commits.append({
+                'sha': sha,
+                'commit': {'author': person, 'committer': person,
+                           'message': f"Update {path or self.name} ({index + 1})"},
+                'author': {'login': self.owner},
+                'html_url': f"https://github.com/{self.full_name}/commit/{sha}",
+            })
+            date -= timedelta(days=7 + (seed >> index) % 30)
+        return commits
+
+
+class Faults:
+    """Injected latency, errors and rate limiting; decisions come from one seeded RNG."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_statuses=(502,), secondary_rate=0.0,
+                 retry_after=1, rate_limit=5000, rate_window=3600, fail_rules=(), seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = list(error_statuses)
+        self.secondary_rate = secondary_rate
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.fail_rules = [(re.compile(pattern), status) for pattern, status in fail_rules]
+        self.random = random.Random(seed)
+        self.budgets = {}
+        self._lock = threading.Lock()
+
+    def delay(self):
+        with self._lock:
+            extra = self.random.uniform(0, self.jitter) if self.jitter else 0.0
+        if self.latency or extra:
+            time.sleep(self.latency + extra)
+
+    def roll(self):
+        with self._lock:
+            return self.random.random()
+
+    def budget(self, resource):
+        """{'used', 'reset'} of a rate-limit resource, starting a new window when the last one ended."""
+        now = int(time.time())
+        budget = self.budgets.get(resource)
+        if budget is None or now >= budget['reset']:
+            budget = self.budgets[resource] = {'used': 0, 'reset': now + self.rate_window}
+        return budget
+
+    def headers(self, resource):
+        with self._lock:
+            budget = self.budget(resource)
+            return {
+                'X-RateLimit-Limit': str(self.rate_limit),
+                'X-RateLimit-Remaining': str(max(self.rate_limit - budget['used'], 0)),
+                'X-RateLimit-Reset': str(budget['reset']),
+                'X-RateLimit-Used': str(budget['used']),
+                'X-RateLimit-Resource': resource,
+            }
+
+    def exhausted(self, resource):
+        with self._lock:
+            return self.budget(resource)['used'] >= self.rate_limit
+
+    def charge(self, resource):
+        with self._lock:
+            self.budget(resource)['used'] += 1
+
+
+class Stats:
+    def __init__(self):
+        self.requests = {}
+        self.statuses = {}
+        self.faults = {}
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, endpoint, status, nbytes, fault=None):
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+            self.bytes += nbytes
+            if fault:
+                self.faults[fault] = self.faults.get(fault, 0) + 1
+
+    def to_dict(self):
+        with self._lock:
+            return {'requests': dict(self.requests), 'statuses': dict(self.statuses),
+                    'faults': dict(self.faults), 'bytes': self.bytes}
+
+    def report(self):
+        stats = self.to_dict()
+        total = sum(stats['requests'].values())
+        print(f"🛰️  Mock GitHub: {total} requests, {stats['bytes'] / 1024:.1f} KiB sent")
+        for endpoint, count in sorted(stats['requests'].items()):
+            print(f"   {endpoint}: {count}")
+        print(f"   statuses: {', '.join(f'{status}={count}' for status, count in sorted(stats['statuses'].items()))}")
+        if stats['faults']:
+            print(f"   injected: {', '.join(f'{fault}={count}' for fault, count in sorted(stats['faults'].items()))}")
+
+
+class Response:
+    def __init__(self, status=200, body=b'', content_type='application/json; charset=utf-8', headers=None,
+                 etag=True):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+        self.etag = etag and status == 200
+
+
+def json_response(data, status=200, **kwargs):
+    return Response(status, json.dumps(data).encode('utf-8'), **kwargs)
+
+
+def not_found():
+    return json_response({'message': 'Not Found', 'documentation_url': 'https://docs.github.com/rest'}, 404)
+
+
+class MockGitHub(ThreadingHTTPServer):
+    """The server: a corpus root, its fault settings and counters."""
+
+    daemon_threads = True
+
+    def __init__(self, corpus, port=0, host='127.0.0.1', faults=None, tree_limit=TREE_LIMIT, verbose=False):
+        super().__init__((host, port), MockHandler)
+        self.corpus = Path(corpus)
+        self.faults = faults or Faults()
+        self.tree_limit = tree_limit
+        self.verbose = verbose
+        self.stats = Stats()
+        self.repos = {}
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self):
+        """Environment variables pointing github_client at this server."""
+        return {'GITHUB_API_URL': self.url, 'GITHUB_RAW_URL': f"{self.url}/raw",
+                'GITHUB_GRAPHQL_URL': f"{self.url}/graphql"}
+
+    def repo(self, owner, name):
+        key = (owner, name)
+        if key not in self.repos:
+            root = self.corpus / owner / name
+            if not root.is_dir():
+                return None
+            self.repos[key] = Repo(owner, name, root)
+        return self.repos[key]
+
+    def start(self):
+        """Serve from a background thread; returns self."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server_version = 'MockGitHub/1.0'
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without this every response waits for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.handle_request()
+
+    # -- dispatch -----------------------------------------------------------
+
+    def handle_request(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        endpoint, resource = self.classify(path)
+        faults = self.server.faults
+
+        if endpoint in ('stats', 'rate_limit'):
+            response = self.route(endpoint, path, query, body)
+            return self.send(endpoint, response)
+
+        faults.delay()
+        for pattern, status in faults.fail_rules:
+            if pattern.search(path):
+                return self.send(endpoint, json_response({'message': f"Injected HTTP {status}"}, status), 'fail')
+        if faults.error_rate and faults.roll() < faults.error_rate:
+            status = faults.error_statuses[int(faults.roll() * len(faults.error_statuses))]
+            return self.send(endpoint, json_response({'message': 'Server Error'}, status), 'error')
+        if resource and faults.secondary_rate and faults.roll() < faults.secondary_rate:
+            response = json_response({'message': 'You have exceeded a secondary rate limit. '
+                                                 'Please wait a few minutes before you try again.'}, 403,
+                                     headers={'Retry-After': str(faults.retry_after)})
+            return self.send(endpoint, response, 'secondary', resource)
+        if resource and faults.exhausted(resource):
+            response = json_response({'message': 'API rate limit exceeded for 127.0.0.1.',
+                                      'documentation_url': 'https://docs.github.com/rest/rate-limit'}, 403)
+            return self.send(endpoint, response, 'rate_limit', resource)
+
+        try:
+            response = self.route(endpoint, path, query, body)
+        except BrokenPipeError:
+            return
+        if response is None:
+            return  # streamed
+        self.send(endpoint, response, None, resource)
+
+    def classify(self, path):
+        """(endpoint name for the stats, rate-limit resource or None)."""
+        if path == '/_stats':
+            return 'stats', None
+        if path == '/rate_limit':
+            return 'rate_limit', None
+        if path.startswith('/raw/'):
+            return 'raw', None
+        if path.startswith('/_codeload/'):
+            return 'codeload', None
+        if path == '/graphql':
+            return 'graphql', 'graphql'
+        match = re.match(r'^/repos/[^/]+/[^/]+(?:/(contents|commits|git/trees|tarball))?', path)
+        if match:
+            return (match.group(1) or 'repo').replace('git/trees', 'trees'), 'core'
+        return 'other', 'core'
+
+    def route(self, endpoint, path, query, body):
+        if endpoint == 'stats':
+            return json_response(self.server.stats.to_dict(), etag=False)
+        if endpoint == 'rate_limit':
+            resources = {}
+            for resource in ('core', 'graphql'):
+                headers = self.server.faults.headers(resource)
+                resources[resource] = {'limit': int(headers['X-RateLimit-Limit']),
+                                       'remaining': int(headers['X-RateLimit-Remaining']),
+                                       'reset': int(headers['X-RateLimit-Reset']),
+                                       'used': int(headers['X-RateLimit-Used'])}
+            return json_response({'resources': resources, 'rate': resources['core']}, etag=False)
+        if endpoint == 'graphql':
+            return self.graphql(body)
+        if endpoint == 'raw':
+            return self.raw(path[len('/raw/'):])
+        if endpoint == 'codeload':
+            return self.codeload(path[len('/_codeload/'):])
+
+        match = re.match(r'^/repos/([^/]+)/([^/]+)(?:/(.*))?$', path)
+        if not match:
+            return not_found()
+        repo = self.server.repo(match.group(1), match.group(2))
+        if repo is None:
+            return not_found()
+        rest = match.group(3) or ''
+        if not rest:
+            return json_response({'id': stable_number(repo.full_name), 'name': repo.name,
+                                  'full_name': repo.full_name, 'owner': {'login': repo.owner},
+                                  'default_branch': DEFAULT_BRANCH, 'stargazers_count': repo.stars(),
+                                  'html_url': f"https://github.com/{repo.full_name}"})
+        if rest == 'contents' or rest.startswith('contents/'):
+            return self.contents(repo, rest[len('contents/'):] if '/' in rest else '')
+        if rest == 'commits':
+            return self.commits(repo, query)
+        if rest.startswith('git/trees/'):
+            return self.tree(repo, query.get('recursive') not in (None, '', '0', 'false'))
+        if rest == 'tarball' or rest.startswith('tarball/'):
+            ref = (rest[len('tarball/'):] if '/' in rest else '') or DEFAULT_BRANCH
+            location = f"{self.base_url()}/_codeload/{quote(repo.owner)}/{quote(repo.name)}/legacy.tar.gz/{quote(ref)}"
+            return Response(302, b'', 'text/plain', {'Location': location}, etag=False)
+        return not_found()
+
+    def base_url(self):
+        return f"http://{self.headers.get('Host') or self.server.url[len('http://'):]}"
+
+    # -- endpoints ------------------------------------------------------------
+
+    def item(self, repo, relative, path):
+        """Contents-API entry of a file or folder."""
+        api = f"{self.base_url()}/repos/{repo.full_name}"
+        path = Path(path)
+        is_dir = path.is_dir()
+        sha = repo.tree_sha(relative) if is_dir else repo.blob_sha(path)
+        return {
+            'name': path.name,
+            'path': relative,
+            'sha': sha,
+            'size': 0 if is_dir else path.stat().st_size,
+            'url': f"{api}/contents/{quote(relative)}?ref={DEFAULT_BRANCH}",
+            'html_url': f"https://github.com/{repo.full_name}/{'tree' if is_dir else 'blob'}/{DEFAULT_BRANCH}/{relative}",
+            'git_url': f"{api}/git/{'trees' if is_dir else 'blobs'}/{sha}",
+            'download_url': None if is_dir else
+            f"{self.base_url()}/raw/{repo.full_name}/{DEFAULT_BRANCH}/{quote(relative)}",
+            'type': 'dir' if is_dir else 'file',
+        }
+
+    def contents(self, repo, relative):
+        relative = relative.strip('/')
+        target = repo.resolve(relative)
+        if target is None or not target.exists():
+            return not_found()
+        if target.is_dir():
+            with os.scandir(target) as scan:
+                entries = git_order([entry for entry in scan if entry.name != '.git'])
+            return json_response([self.item(repo, f"{relative}/{entry.name}" if relative else entry.name, entry.path)
+                                  for entry in entries])
+        data = target.read_bytes()
+        item = self.item(repo, relative, target)
+        item.update(content=base64.encodebytes(data).decode('ascii'), encoding='base64')
+        return json_response(item)
+
+    def commits(self, repo, query):
+        path = query.get('path', '').strip('/')
+        if path and (repo.resolve(path) is None or not repo.resolve(path).exists()):
+            return json_response([])
+        per_page = min(max(int(query.get('per_page', 30)), 1), 100)
+        page = max(int(query.get('page', 1)), 1)
+        history = repo.history(path)
+        last = max((len(history) + per_page - 1) // per_page, 1)
+        links = []
+
+        def link(number, rel):
+            params = dict(query, per_page=per_page, page=number)
+            links.append(f'<{self.base_url()}/repos/{repo.full_name}/commits?{urlencode(params)}>; rel="{rel}"')
+
+        if page < last:
+            link(page + 1, 'next')
+            link(last, 'last')
+        if page > 1:
+            link(1, 'first')
+            link(page - 1, 'prev')
+        headers = {'Link': ', '.join(links)} if links else {}
+        return json_response(history[(page - 1) * per_page:page * per_page], headers=headers)
+
+    def tree(self, repo, recursive):
+        api = f"{self.base_url()}/repos/{repo.full_name}"
+        entries = []
+        if recursive:
+            walk = repo.walk()
+        else:
+            with os.scandir(repo.root) as scan:
+                walk = [(entry.name, entry) for entry in git_order(list(scan)) if entry.name != '.git']
+        truncated = False
+        for relative, entry in walk:
+            if len(entries) >= self.server.tree_limit:
+                truncated = True
+                break
+            if entry.is_dir():
+                sha = repo.tree_sha(relative)
+                entries.append({'path': relative, 'mode': '040000', 'type': 'tree', 'sha': sha,
+                                'url': f"{api}/git/trees/{sha}"})
+            else:
+                sha = repo.blob_sha(Path(entry.path))
+                entries.append({'path': relative, 'mode': '100644', 'type': 'blob', 'sha': sha,
+                                'size': entry.stat().st_size, 'url': f"{api}/git/blobs/{sha}"})
+        return json_response({'sha': repo.tree_sha(''), 'url': f"{api}/git/trees/{repo.tree_sha('')}",
+                              'tree': entries, 'truncated': truncated})
+
+    def raw(self, rest):
+        parts = rest.split('/', 3)
+        if len(parts) < 4:
+            return Response(404, b'404: Not Found', 'text/plain; charset=utf-8')
+        owner, name, _, relative = parts
+        repo = self.server.repo(owner, name)
+        target = repo.resolve(relative) if repo else None
+        if target is None or not target.is_file():
+            return Response(404, b'404: Not Found', 'text/plain; charset=utf-8')
+        return Response(200, target.read_bytes(), 'text/plain; charset=utf-8')
+
+    def codeload(self, rest):
+        """Stream the repository as <owner>-<repo>-<sha>/... in a gzip tarball, as GitHub's codeload does."""
+        parts = rest.split('/')
+        repo = self.server.repo(parts[0], parts[1]) if len(parts) >= 2 else None
+        if repo is None:
+            return not_found()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-gzip')
+        self.send_header('Content-Disposition', f'attachment; filename={repo.owner}-{repo.name}-{repo.head[:7]}.tar.gz')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        writer = CountingWriter(self.wfile)
+        prefix = f"{repo.owner}-{repo.name}-{repo.head[:7]}"
+        with tarfile.open(fileobj=writer, mode='w|gz', format=tarfile.PAX_FORMAT) as archive:
+            archive.add(repo.root, arcname=prefix, recursive=False)
+            for relative, entry in repo.walk():
+                archive.add(entry.path, arcname=f"{prefix}/{relative}", recursive=False)
+        self.server.stats.add('codeload', 200, writer.bytes)
+        return None
+
+    def graphql(self, body):
+        if not self.headers.get('Authorization', '').split(' ', 1)[-1].strip():
+            return json_response({'message': 'This endpoint requires you to be authenticated.'}, 401, etag=False)
+        try:
+            query = json.loads(body or b'{}').get('query', '')
+        except ValueError:
+            return json_response({'message': 'Problems parsing JSON'}, 400, etag=False)
+        data = {}
+        for alias, owner, name in GRAPHQL_FIELD_RE.findall(query):
+            data[alias] = {'stargazerCount': stable_number(f"{owner}/{name}") % 5000}
+        return json_response({'data': data}, etag=False)
+
+    # -- sending --------------------------------------------------------------
+
+    def send(self, endpoint, response, fault=None, resource=None):
+        faults = self.server.faults
+        status, body = response.status, response.body
+        headers = dict(response.headers)
+        if response.etag:
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            headers['ETag'] = etag
+            if self.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+        # Conditional requests answered with 304 do not count against the budget, as on GitHub
+        if resource and status != 304 and fault != 'rate_limit':
+            faults.charge(resource)
+        if resource:
+            headers.update(faults.headers(resource))
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', response.content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.stats.add(endpoint, status, len(body), fault)
+
+
+class CountingWriter:
+    """Write-only file wrapper counting the bytes streamed to the client."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes = 0
+
+    def write(self, data):
+        self.raw.write(data)
+        self.bytes += len(data)
+        return len(data)
+
+
+def parse_fail_rule(rule):
+    pattern, _, status = rule.rpartition('=')
+    if not pattern or not status.isdigit():
+        raise argparse.ArgumentTypeError(f"expected REGEX=STATUS, got {rule!r}")
+    return pattern, int(status)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a corpus directory as a local stand-in for the GitHub API',
+                                     usage='%(prog)s CORPUS [options] [-- command ...]')
+    parser.add_argument('corpus', help='Directory holding <owner>/<repo>/ trees (see synthetic_corpus.py)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0, help='Port to listen on (default: any free port)')
+    parser.add_argument('--latency', type=float, default=0, help='Milliseconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0, help='Up to this many extra random milliseconds')
+    parser.add_argument('--rate-limit', type=int, default=5000, help='API requests per window (default: 5000)')
+    parser.add_argument('--rate-window', type=int, default=3600, help='Rate-limit window in seconds (default: 3600)')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of requests answered with a 5xx')
+    parser.add_argument('--error-status', default='502', help='Comma-separated statuses for --error-rate (default: 502)')
+    parser.add_argument('--secondary-rate', type=float, default=0,
+                        help='Fraction of API requests answered with a secondary-rate-limit 403')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds on secondary limits (default: 1)')
+    parser.add_argument('--fail', action='append', type=parse_fail_rule, default=[], metavar='REGEX=STATUS',
+                        help='Answer request paths matching REGEX with STATUS (repeatable)')
+    parser.add_argument('--tree-limit', type=int, default=TREE_LIMIT,
+                        help=f'Entries before a recursive tree is truncated (default: {TREE_LIMIT})')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the injected faults (default: 0)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    argv = sys.argv[1:]
+    command = []
+    if '--' in argv:
+        split = argv.index('--')
+        argv, command = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+
+    if not Path(args.corpus).is_dir():
+        print(f"❌ Corpus directory not found: {args.corpus}")
+        return False
+
+    faults = Faults(latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+                    error_statuses=[int(status) for status in args.error_status.split(',')],
+                    secondary_rate=args.secondary_rate, retry_after=args.retry_after, rate_limit=args.rate_limit,
+                    rate_window=args.rate_window, fail_rules=args.fail, seed=args.seed)
+    server = MockGitHub(args.corpus, args.port, args.host, faults, args.tree_limit, args.verbose).start()
+    env = server.env()
+    print(f"🛰️  Mock GitHub serving {args.corpus} at {server.url}")
+    try:
+        if not command:
+            for name, value in env.items():
+                print(f"   export {name}={value}")
+            while True:
+                time.sleep(3600)
+        started = time.perf_counter()
+        code = subprocess.call(command, env=dict(os.environ, **env))
+        print(f"⏱️  {' '.join(command)} exited with {code} after {time.perf_counter() - started:.1f}s")
+        return code == 0
+    except KeyboardInterrupt:
+        return True
+    finally:
+        server.stop()
+        server.stats.report()
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
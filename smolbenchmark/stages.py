@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark stages: what bench.py times, and on which fixture corpus.
+
+Each in-process stage is a function called once per document of a corpus:
+
+    readmes      README bodies of every fixture catalog entry (models, rl,
+                 datasets, smolhub), with their name/path/github_url
+    rl_readmes   only the RL ones (for the RL-specific stages)
+    pages        the generated collection pages in fixtures/pages/
+
+Generator stages run a whole script in a scratch copy of the site whose
+_data catalogs are the fixture catalogs, so they measure imports, the
+rendering and the writes together.
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+PAGES_DIR = FIXTURES_DIR / "pages"
+sys.path.insert(0, str(REPO_ROOT))
+
+# Fixture catalog -> (site catalog it stands in for, entries key)
+CATALOG_FIXTURES = {
+    "models.json": ("_data/models.json", "models"),
+    "rl.json": ("_data/rl.json", "rl_implementations"),
+    "datasets.json": ("_data/datasets.json", "datasets"),
+    "smolhub_playground.json": ("_data/smolhub_playground.json", "projects"),
+}
+
+# name -> (script and arguments, fixture catalog it renders, output directory)
+GENERATORS = {
+    "regenerate_models": (["regenerate_models.py"], "models.json", "_models"),
+    "generate_model_files": (["generate_model_files.py", "--jobs", "1"], "models.json", "_models"),
+    "update_models": (["update_models.py", "--output-dir", "_models", "--jobs", "1"], "models.json", "_models"),
+    "generate_dataset_files": (["generate_dataset_files.py", "--jobs", "1"], "datasets.json", "_datasets"),
+    "generate_smolhub_markdowns": (["generate-smolhub-markdowns.py", "--jobs", "1"], "smolhub_playground.json", "_smolhub"),
+    "refresh_rl_markdown": (["refresh_rl.py", "--md-only", "--jobs", "1"], "rl.json", "_rl"),
+}
+
+
+def load_module(filename, name):
+    """Import a repo script by file name (some have dashes in theirs)."""
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_corpora():
+    """{corpus name: [document dict]} from the checked-in fixtures."""
+    readmes = []
+    for fixture, (_, key) in CATALOG_FIXTURES.items():
+        with open(FIXTURES_DIR / fixture, 'r', encoding='utf-8') as f:
+            entries = json.load(f)[key]
+        for entry in entries:
+            text = entry.get('readme_content') or ''
+            if text:
+                readmes.append({
+                    'kind': fixture[:-len('.json')],
+                    'name': entry.get('name', ''),
+                    'path': entry.get('path', entry.get('name', '')),
+                    'github_url': entry.get('github_url', ''),
+                    'description': entry.get('description', ''),
+                    'text': text,
+                })
+    pages = [{'name': path.name, 'file': str(path), 'text': path.read_text(encoding='utf-8')}
+             for path in sorted(PAGES_DIR.glob('*.md'))]
+    return {
+        'readmes': readmes,
+        'rl_readmes': [doc for doc in readmes if doc['kind'] == 'rl'],
+        'pages': pages,
+    }
+
+
+def build_stages():
+    """{stage name: (corpus, func(doc))}; imports the repo modules."""
+    import classifier
+    import fix_tables
+    import frontmatter
+    import refresh_rl
+    import regenerate_models
+    import generate_dataset_files
+    import convert_images_to_links
+    import fix_images_direct
+    from markdown_pipeline import get_pass
+
+    smolhub = load_module("generate-smolhub-markdowns.py", "generate_smolhub_markdowns")
+    pipeline_passes = [get_pass(name) for name in
+                       ('fix_image_links', 'fix_images_direct', 'convert_images_to_links', 'fix_tables', 'fix_models')]
+
+    def run_pipeline_passes(doc):
+        text = doc['text']
+        for func in pipeline_passes:
+            text = func(text, None)
+        return text
+
+    def parse_frontmatter(doc):
+        header, _ = frontmatter.split(doc['text'])
+        return header.data
+
+    return {
+        "absolutize_markdown_links": (
+            'rl_readmes', lambda doc: refresh_rl.absolutize_markdown_links(doc['text'], doc['path'])),
+        # collect_categories and its copies became rulesets of the classifier
+        "classify_rl": (
+            'rl_readmes', lambda doc: classifier.classify('rl', name=doc['name'], path=doc['path'], readme=doc['text'])),
+        "classify_models": (
+            'readmes', lambda doc: classifier.classify('models', name=doc['name'], description=doc['description'],
+                                                       readme=doc['text'])),
+        "normalize_markdown_tables": (
+            'readmes', lambda doc: smolhub.normalize_markdown_tables(doc['text'])),
+        "fix_tables_in_text": (
+            'readmes', lambda doc: fix_tables.fix_tables_in_text(doc['text'])),
+        "convert_images_to_links[regenerate_models]": (
+            'readmes', lambda doc: regenerate_models.convert_images_to_links(doc['text'], doc['github_url'])),
+        "convert_images_to_links[generate_dataset_files]": (
+            'readmes', lambda doc: generate_dataset_files.convert_images_to_links(doc['text'], doc['github_url'])),
+        "convert_images_to_links[generate-smolhub-markdowns]": (
+            'readmes', lambda doc: smolhub.convert_images_to_links(doc['text'], doc['github_url'])),
+        "convert_images_pass": (
+            'pages', lambda doc: convert_images_to_links.convert_images_pass(doc['text'])),
+        "images_to_links_pass": (
+            'pages', lambda doc: fix_images_direct.images_to_links_pass(doc['text'])),
+        "markdown_pipeline_passes": (
+            'pages', run_pipeline_passes),
+        "frontmatter_parse": (
+            'pages', parse_frontmatter),
+        "frontmatter_read_header": (
+            'pages', lambda doc: frontmatter.read_header(doc['file']).value('title')),
+    }
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Synthetic source repositories for scale-testing the fetch-and-generate scripts.
+
+Writes Paper-Replications, Datasets-Collection and Reinforcement-Learning
+trees of any size under one directory, laid out the way
+smolbenchmark/mock_github.py serves them:
+
+    <out>/YuvrajSingh-mist/Paper-Replications/<Model>/README.md, model.py, img/loss.jpg
+    <out>/YuvrajSingh-mist/Datasets-Collection/<Dataset>/README.md, data.csv|json|parquet
+    <out>/YuvrajSingh-mist/Reinforcement-Learning/<Algo>/<Env>/<Variant>/.../README.md, train.py
+
+The READMEs look like the real ones: headings, relative and absolute images,
+HTML <img>/<a>/<details>, pipe tables (some without a separator row, as
+fix_tables expects to repair), code fences holding image and link syntax that
+must not be rewritten, math and the keywords the classifier rules react to.
+Everything is derived from --seed, so the same arguments always produce the
+same bytes.
+
+Usage:
+    python smolbenchmark/synthetic_corpus.py /tmp/corpus --models 10000 --datasets 500 --rl 100000
+    python smolbenchmark/synthetic_corpus.py /tmp/corpus --rl 20000 --rl-depth 6 --seed 7
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+
+OWNER = "YuvrajSingh-mist"
+MODELS_REPO = "Paper-Replications"
+DATASETS_REPO = "Datasets-Collection"
+RL_REPO = "Reinforcement-Learning"
+MANIFEST = "corpus.json"
+
+MODEL_NAMES = [
+    "GPT", "BERT", "Llama", "Llama4", "Mixtral", "Gemma3", "DeepSeekV3", "Kimi-K2", "ViT", "CLIP", "SigLIP",
+    "PaliGemma", "Whisper", "DCGANs", "CycleGANs", "WGANs", "VAE", "DDPM", "Mamba", "RWKV", "LSTM", "GRU",
+    "Seq2Seq", "Encoder-Decoder", "Differential-Transformer", "DPO", "ORPO", "LoRA", "Fine-Tuning-Using-PEFT",
+    "Attention-Mechanisms", "CLAP", "Moonshine", "TTS", "DDP",
+]
+MODEL_TOPICS = [
+    "transformer language model", "generative adversarial network", "diffusion model", "vision transformer",
+    "speech recognition model", "contrastive image-text model", "state space model", "preference optimization",
+    "mixture of experts", "recurrent neural network",
+]
+DATASETS = ["TinyStories", "WikiText", "OpenWebText", "Shakespeare", "Gigaspeech", "UltraFeedback", "CIFAR",
+            "MNIST", "CommonVoice", "FineWeb", "Hinglish", "LibriSpeech", "ImageNet", "COCO"]
+DATA_FILES = [("data.csv", 48_000), ("train.json", 120_000), ("train.parquet", 900_000), ("corpus.txt", 30_000)]
+
+RL_ALGOS = ["DQN", "Double-DQN", "Duel-DQN", "PPO", "A2C", "A3C", "SAC", "TD3", "DDPG", "REINFORCE", "TRPO",
+            "Rainbow", "MuZero", "QMIX", "MADDPG", "Q-Learning", "SARSA", "ICM"]
+RL_ENVS = ["CartPole", "LunarLander", "Atari-Breakout", "Atari-Pong", "MountainCar", "FrozenLake", "Taxi",
+           "Pendulum", "HalfCheetah", "BipedalWalker", "FlappyBird", "SuperMarioBros", "Pettingzoo-Pong",
+           "Minigrid", "Acrobot", "CarRacing"]
+RL_VARIANTS = ["Vanilla", "PER", "NoisyNet", "N-Step", "GAE", "LSTM", "CNN", "Multi-Env", "Frame-Stack",
+               "Continuous", "Discrete", "Curiosity", "Self-Play", "Distributed"]
+
+WORDS = ("the model is trained with a cosine schedule and warmup while gradients are clipped at one and "
+         "evaluation runs every epoch on the held out split using the same tokenizer and batch size "
+         "results improve steadily after the learning rate decays and the loss curve flattens").split()
+
+
+def sentence(rng, words=12):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def paragraph(rng, sentences=4):
+    return ' '.join(sentence(rng, rng.randint(8, 18)) for _ in range(sentences))
+
+
+def pipe_table(rng, rows, with_separator=True):
+    lines = ["| Hyperparameter | Value | Notes |"]
+    if with_separator:
+        lines.append("|---|---|---|")
+    for name in rng.sample(["Learning rate", "Batch size", "Epochs", "Warmup steps", "Dropout", "Gamma",
+                            "Hidden size", "Layers", "Heads", "Context length", "Optimizer"], rows):
+        lines.append(f"| {name} | {rng.choice(['3e-4', '64', '10', '0.1', '0.99', '512', 'AdamW'])} | {sentence(rng, 4)} |")
+    return '\n'.join(lines)
+
+
+def code_fence(rng, folder):
+    return '\n'.join([
+        "```python",
+        "import torch",
+        "from model import Model",
+        "",
+        f"# ![not an image](img/{folder}.png) and [not a link](docs/README.md) stay as written",
+        "model = Model(vocab_size=32000, n_layers=%d)" % rng.randint(2, 48),
+        "optimizer = torch.optim.AdamW(model.parameters(), lr=3e-4)",
+        "for step, batch in enumerate(loader):",
+        "    loss = model(**batch).loss",
+        "    loss.backward()",
+        "```",
+    ])
+
+
+def readme(rng, repo, folder, title, topic, keywords):
+    """A README with the mix of markup the site's rewriters deal with."""
+    blob = f"https://github.com/{OWNER}/{repo}/blob/master/{folder}"
+    parts = [
+        f"# {title}",
+        "",
+        f"From-scratch PyTorch implementation of a {topic}. {paragraph(rng, rng.randint(2, 4))}",
+        "",
+        f"Keywords: {', '.join(keywords)}. See the [paper](https://arxiv.org/abs/{rng.randint(1500, 2500)}."
+        f"{rng.randint(10000, 99999)}) and the [training script](train.py).",
+        "",
+        "## Results",
+        "",
+        "![Training loss](img/loss.jpg)",
+        "",
+        f'<p align="center"><img src="images/samples.gif" width="{rng.choice([300, 400, 600])}" alt="samples"></p>',
+        "",
+        f"![Architecture]({blob}/img/architecture.png)",
+        "",
+        pipe_table(rng, rng.randint(3, 7), with_separator=rng.random() > 0.2),
+        "",
+        "## Usage",
+        "",
+        code_fence(rng, folder.rsplit('/', 1)[-1]),
+        "",
+        "The update is $\\theta \\leftarrow \\theta - \\eta \\nabla_\\theta \\mathcal{L}$ with "
+        f"<a href=\"notes/derivation.md\">the derivation here</a>. {paragraph(rng, 2)}",
+        "",
+        "<details><summary>Training details</summary>",
+        "",
+        paragraph(rng, rng.randint(2, 6)),
+        "",
+        "</details>",
+        "",
+    ]
+    for section in range(rng.randint(0, 3)):
+        parts += [f"## Notes {section + 1}", "", paragraph(rng, rng.randint(3, 8)), ""]
+    return '\n'.join(parts)
+
+
+def unique_names(pool, count, rng):
+    """count distinct folder names from pool, numbered once the pool runs out."""
+    names = []
+    for index in range(count):
+        base = pool[index % len(pool)]
+        names.append(base if index < len(pool) else f"{base}-{index // len(pool) + 1}")
+    rng.shuffle(names)
+    return names
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    path.write_bytes(data)
+
+
+def generate_models(repo_dir, count, rng):
+    for name in unique_names(MODEL_NAMES, count, rng):
+        topic = rng.choice(MODEL_TOPICS)
+        keywords = rng.sample(["transformer", "attention", "GAN", "diffusion", "vision", "audio", "LLM",
+                               "fine-tuning", "PyTorch", "JAX", "TinyStories", "CIFAR-10"], 4)
+        write(repo_dir / name / "README.md", readme(rng, MODELS_REPO, name, name, topic, keywords))
+        write(repo_dir / name / "model.py", f"# {name}\nimport torch\n")
+        write(repo_dir / name / "img" / "loss.jpg", b"\xff\xd8\xff\xe0" + bytes(rng.randint(64, 512)))
+    write(repo_dir / "README.md", f"# {MODELS_REPO}\n\n{paragraph(rng)}\n")
+
+
+def generate_datasets(repo_dir, count, rng):
+    for name in unique_names(DATASETS, count, rng):
+        keywords = rng.sample(["text", "audio", "images", "instruction tuning", "pretraining", "evaluation"], 3)
+        body = readme(rng, DATASETS_REPO, name, f"{name} Dataset", "dataset collection and loader", keywords)
+        write(repo_dir / name / "README.md", body)
+        data_name, size = rng.choice(DATA_FILES)
+        write(repo_dir / name / data_name, bytes(rng.randint(size // 2, size)))
+    write(repo_dir / "README.md", f"# {DATASETS_REPO}\n\n{paragraph(rng)}\n")
+
+
+def rl_tree(count, max_depth, rng):
+    """count nested folder paths: algorithms, then environments, then variants, at most max_depth deep."""
+    pools = [RL_ALGOS, RL_ENVS] + [RL_VARIANTS] * max(max_depth - 2, 0)
+    paths = []
+    children = {'': 0}
+    for index in range(count):
+        # New top-level folders get rarer as the tree grows, so it gets deep as well as wide
+        if paths and rng.random() > len(RL_ALGOS) / (index + len(RL_ALGOS)):
+            parent = rng.choice(paths)
+            if parent.count('/') + 1 >= max_depth:
+                parent = parent.rsplit('/', 1)[0] if '/' in parent else ''
+        else:
+            parent = ''
+        depth = parent.count('/') + 1 if parent else 0
+        pool = pools[min(depth, len(pools) - 1)]
+        number = children.get(parent, 0)
+        children[parent] = number + 1
+        name = pool[number % len(pool)] if number < len(pool) else f"{pool[number % len(pool)]}-{number // len(pool) + 1}"
+        path = f"{parent}/{name}" if parent else name
+        paths.append(path)
+        children.setdefault(path, 0)
+    return paths
+
+
+def generate_rl(repo_dir, count, max_depth, rng):
+    paths = rl_tree(count, max_depth, rng)
+    parents = {path.rsplit('/', 1)[0] for path in paths if '/' in path}
+    for path in paths:
+        # Leaves always have a README; grouping folders only sometimes do, as in the real repository
+        if path in parents and rng.random() < 0.5:
+            continue
+        parts = path.split('/')
+        title = ' '.join(part.replace('-', ' ') for part in parts)
+        keywords = [parts[0], parts[1] if len(parts) > 1 else rng.choice(RL_ENVS), "reinforcement learning",
+                    rng.choice(["policy gradient", "value based", "actor-critic", "Gymnasium", "Atari", "MuJoCo"])]
+        write(repo_dir / path / "README.md", readme(rng, RL_REPO, path, title, f"{parts[0]} agent", keywords))
+        write(repo_dir / path / "train.py", f"# {path}\nimport gymnasium as gym\n")
+    write(repo_dir / "README.md", f"# {RL_REPO}\n\n{paragraph(rng)}\n")
+    return len(paths)
+
+
+def generate(out, models=40, datasets=10, rl=100, rl_depth=4, seed=0):
+    """Write the three repositories under out (replacing them) and return the manifest."""
+    out = Path(out)
+    owner_dir = out / OWNER
+    for repo in (MODELS_REPO, DATASETS_REPO, RL_REPO):
+        shutil.rmtree(owner_dir / repo, ignore_errors=True)
+    generate_models(owner_dir / MODELS_REPO, models, random.Random(f"{seed}:models"))
+    generate_datasets(owner_dir / DATASETS_REPO, datasets, random.Random(f"{seed}:datasets"))
+    generate_rl(owner_dir / RL_REPO, rl, rl_depth, random.Random(f"{seed}:rl"))
+    manifest = {'owner': OWNER, 'seed': seed, 'models': models, 'datasets': datasets, 'rl': rl,
+                'rl_depth': rl_depth}
+    write(out / MANIFEST, json.dumps(manifest, indent=2) + '\n')
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic source repositories for scale tests')
+    parser.add_argument('out', help='Directory to write the repositories into')
+    parser.add_argument('--models', type=int, default=40, help='Paper-Replications folders (default: 40)')
+    parser.add_argument('--datasets', type=int, default=10, help='Datasets-Collection folders (default: 10)')
+    parser.add_argument('--rl', type=int, default=100, help='Reinforcement-Learning folders (default: 100)')
+    parser.add_argument('--rl-depth', type=int, default=4, help='Deepest RL folder nesting (default: 4)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    if args.rl_depth < 1:
+        print("❌ --rl-depth must be at least 1")
+        return False
+    started = time.perf_counter()
+    generate(args.out, args.models, args.datasets, args.rl, args.rl_depth, args.seed)
+    files = sum(1 for path in Path(args.out, OWNER).rglob('*') if path.is_file())
+    print(f"✅ {args.models} models, {args.datasets} datasets, {args.rl} RL folders "
+          f"({files} files) in {args.out} ({time.perf_counter() - started:.1f}s)")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
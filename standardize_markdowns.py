@@ -17,6 +17,9 @@ import argparse
 from pathlib import Path
 from datetime import datetime
 
+from markdown_pipeline import collect_files, run_pipeline
+from frontmatter import split as split_frontmatter
+
 class MarkdownStandardizer:
     def __init__(self):
         self.models_dir = Path("_models")
@@ -59,20 +62,11 @@ class MarkdownStandardizer:
         model_info = models_data.get(model_name, {})
         
         # Extract existing frontmatter
-        frontmatter_match = re.match(r'^---\n(.*?)\n---\n(.*)$', content, re.DOTALL)
-        if not frontmatter_match:
+        header, body_content = split_frontmatter(content)
+        if header is None:
             print(f"  ⚠️  No frontmatter found in {filename}")
             return content
-        
-        frontmatter_content = frontmatter_match.group(1)
-        body_content = frontmatter_match.group(2)
-        
-        # Parse existing frontmatter
-        frontmatter_data = {}
-        for line in frontmatter_content.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                frontmatter_data[key.strip()] = value.strip().strip('"')
+        frontmatter_data = {key: header.value(key) for key in header.keys()}
         
         # Use models.json data if available, otherwise keep existing
         title = model_info.get('name', frontmatter_data.get('title', model_name))
@@ -211,31 +205,6 @@ From scratch implementation of {title}
         
         return content
     
-    def process_file(self, file_path, models_data):
-        """Process a single markdown file"""
-        filename = file_path.name
-        print(f"📝 Processing {filename}...")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Standardize frontmatter
-        content = self.standardize_frontmatter(content, filename, models_data)
-        
-        # Standardize body content
-        content = self.standardize_body_content(content)
-        
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"  ✅ Standardized {filename}")
-            return True
-        else:
-            print(f"  ℹ️  No changes needed for {filename}")
-            return False
-    
     def create_templates(self):
         """Create templates for future markdown creation"""
         self.templates_dir.mkdir(exist_ok=True)
@@ -398,12 +367,11 @@ if __name__ == "__main__":
         models_data = self.load_models_json()
         print(f"  Found {len(models_data)} models in JSON")
         
-        # Process all markdown files
+        # Process all markdown files in one read/write sweep (see markdown_pipeline.py)
         print("\\n📝 Processing markdown files...")
-        for md_file in sorted(self.models_dir.glob("*.md")):
-            self.total_count += 1
-            if self.process_file(md_file, models_data):
-                self.fixed_count += 1
+        context = {'standardizer': self, 'models_data': models_data}
+        self.total_count = len(collect_files([self.models_dir]))
+        self.fixed_count = len(run_pipeline([self.models_dir], ['standardize'], context=context))
         
         # Create templates and automation
         print("\\n📄 Creating templates and automation...")
@@ -426,6 +394,16 @@ if __name__ == "__main__":
         print("\\n📝 To create new models:")
         print("   python create_new_model.py 'Model Name' 'Category' 'Dataset' 'GitHub URL'")
 
+def standardize_pass(content, doc):
+    """Pipeline pass: standardize a model page's frontmatter and body"""
+    standardizer = doc.context.get('standardizer')
+    if standardizer is None:
+        standardizer = doc.context['standardizer'] = MarkdownStandardizer()
+    if 'models_data' not in doc.context:
+        doc.context['models_data'] = standardizer.load_models_json()
+    content = standardizer.standardize_frontmatter(content, doc.path.name, doc.context['models_data'])
+    return standardizer.standardize_body_content(content)
+
 if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Standardize markdown files')
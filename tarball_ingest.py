@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Bulk ingestion of a source repository from its tarball.
+
+One request to GitHub's tarball endpoint replaces the per-folder contents-API
+walk. The archive is stream-decompressed with tarfile mode 'r|gz' straight
+from the HTTP response: nothing is extracted to disk, only README.md members
+are read, and every other member is skipped after its header has been seen
+(its name and size are still recorded for callers such as the dataset format
+detection). Peak memory is bounded by the largest README, not the repo size.
+
+Used by `update_models.py --fetch --ingest tarball`,
+`auto_detect_datasets.py --ingest tarball` and `refresh_rl.py --crawl tarball`.
+
+Usage:
+    python tarball_ingest.py Reinforcement-Learning     # list folders and READMEs
+"""
+
+import argparse
+import os
+import sys
+import tarfile
+
+import github_client
+from github_ratelimit import SCHEDULER
+from profiler import profiled
+
+GITHUB_API_URL = github_client.API_URL
+REPO_OWNER = "YuvrajSingh-mist"
+README_NAMES = ("README.md",)
+
+
+class RepoSnapshot:
+    """What a tarball pass learned about a repository.
+
+    - folders: every directory path, in archive (git tree pre-) order
+    - files:   {folder: [(file name, size), ...]} for files directly inside a folder
+    - readmes: {folder: README text} ('' is the repository root)
+    """
+
+    def __init__(self):
+        self.folders = []
+        self.files = {}
+        self.readmes = {}
+
+    def top_level_folders(self):
+        return [folder for folder in self.folders if '/' not in folder]
+
+
+class CountingReader:
+    """File-like wrapper that counts the bytes pulled through it."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes = 0
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.bytes += len(data)
+        return data
+
+
+def tarball_url(owner, repo, ref="HEAD"):
+    return f"{GITHUB_API_URL}/repos/{owner}/{repo}/tarball/{ref}"
+
+
+def strip_root(member_name):
+    """Drop the '<owner>-<repo>-<sha>/' prefix GitHub puts on every member."""
+    parts = member_name.split('/', 1)
+    return parts[1].rstrip('/') if len(parts) > 1 else ''
+
+
+@profiled
+def read_snapshot(fileobj, readme_names=README_NAMES):
+    """Walk a gzip tar stream once and collect folders, file sizes and READMEs."""
+    snapshot = RepoSnapshot()
+    with tarfile.open(fileobj=fileobj, mode='r|gz') as archive:
+        for member in archive:
+            path = strip_root(member.name)
+            if not path:
+                continue
+            if member.isdir():
+                snapshot.folders.append(path)
+                continue
+            if not member.isfile():
+                continue
+            folder, _, name = path.rpartition('/')
+            snapshot.files.setdefault(folder, []).append((name, member.size))
+            if name in readme_names and folder not in snapshot.readmes:
+                data = archive.extractfile(member).read()
+                snapshot.readmes[folder] = data.decode('utf-8', errors='replace')
+    return snapshot
+
+
+@profiled
+def fetch_snapshot(repo, owner=REPO_OWNER, ref="HEAD", token=None, readme_names=README_NAMES):
+    """Download and scan a repository tarball; returns a RepoSnapshot or None."""
+    url = tarball_url(owner, repo, ref)
+    print(f"📦 Streaming tarball: {url}")
+    SCHEDULER.acquire(url)
+    try:
+        response = github_client.get(url, headers=github_client.github_headers(token), stream=True)
+    except Exception as e:
+        print(f"❌ Error fetching {url}: {e}")
+        return None
+    SCHEDULER.observe(url, response.status_code, response.headers)
+    if response.status_code != 200:
+        print(f"❌ Error fetching {url}: HTTP {response.status_code}")
+        response.close()
+        return None
+
+    reader = CountingReader(response.raw)
+    try:
+        snapshot = read_snapshot(reader, readme_names)
+    except (tarfile.TarError, OSError, EOFError) as e:
+        print(f"❌ Could not read tarball for {owner}/{repo}: {e}")
+        return None
+    finally:
+        response.close()
+        github_client.STATS.add(nbytes=reader.bytes)
+
+    print(f"📦 {len(snapshot.folders)} folders, {len(snapshot.readmes)} READMEs "
+          f"from {reader.bytes / 1024:.1f} KiB compressed")
+    return snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan a source repository tarball')
+    parser.add_argument('repo', help='Repository name, e.g. Paper-Replications')
+    parser.add_argument('--owner', default=REPO_OWNER, help=f'Repository owner (default: {REPO_OWNER})')
+    parser.add_argument('--ref', default='HEAD', help='Branch, tag or commit (default: HEAD)')
+    args = parser.parse_args()
+
+    snapshot = fetch_snapshot(args.repo, args.owner, args.ref, os.environ.get('GITHUB_TOKEN'))
+    if snapshot is None:
+        return False
+    for folder in snapshot.folders:
+        readme = snapshot.readmes.get(folder)
+        status = f"README {len(readme)} chars" if readme is not None else "no README"
+        print(f"  {folder}: {status}")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
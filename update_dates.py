@@ -1,43 +1,51 @@
 #!/usr/bin/env python3
 """
-Update model dates with actual GitHub commit dates from API
+Update model dates with actual GitHub commit dates
+
+Dates come from one `git log` pass over a local blobless clone of
+Paper-Replications (see git_dates.py); the per-folder GitHub API lookup is
+only used when the clone is unavailable.
 """
 
 import json
 import os
-import re
-import requests
+from pathlib import Path
 from datetime import datetime
-import time
+
+from github_cache import cached_get, print_cache_report
+from frontmatter import patch
+from collection_index import load_index, match_names, normalize_key
+from github_client import API_URL, github_headers
+import git_dates
 
 def get_github_first_commit_date(folder_name, github_token=None):
     """Get the first commit date for a specific folder from GitHub API"""
     repo_owner = "YuvrajSingh-mist"
     repo_name = "Paper-Replications"
     
-    headers = {
-        'Accept': 'application/vnd.github.v3+json',
-        'User-Agent': 'SmolHub-Website'
-    }
-    
-    if github_token:
-        headers['Authorization'] = f'token {github_token}'
+    headers = github_headers(github_token)
     
     try:
         # Get commits for the specific folder
-        url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/commits"
+        url = f"{API_URL}/repos/{repo_owner}/{repo_name}/commits"
         params = {
             'path': folder_name,
             'per_page': 1
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        response = cached_get(url, headers=headers, params=params)
         
         if response.status_code == 200:
+            # Commits are listed newest first; with per_page=1 the "last" page holds the first commit
+            last_page = response.links.get('last', {}).get('url')
+            if last_page:
+                response = cached_get(last_page, headers=headers)
+                if response.status_code != 200:
+                    print(f"Warning: Could not get commit date for {folder_name}")
+                    return None
             commits = response.json()
             if commits:
-                # Get the earliest commit (last in the list when sorted by date)
-                first_commit = commits[-1] if len(commits) == 1 else commits[0]
+                first_commit = commits[-1]
                 commit_date = first_commit['commit']['author']['date']
                 # Convert to just date (YYYY-MM-DD format)
                 date_obj = datetime.fromisoformat(commit_date.replace('Z', '+00:00'))
@@ -63,14 +71,21 @@ def update_models_json_with_dates(github_token=None):
         data = json.load(f)
     
     updated_dates = {}
+    folder_dates = git_dates.load_folder_dates('Paper-Replications')
+    if folder_dates is None:
+        print("Falling back to the GitHub API for commit dates")
     
     print("Fetching GitHub commit dates...")
     for i, model in enumerate(data.get('models', []), 1):
         model_name = model.get('name', '')
         print(f"Processing {i}/{len(data['models'])}: {model_name}")
         
-        # Get actual commit date from GitHub
-        commit_date = get_github_first_commit_date(model_name, github_token)
+        # Get actual commit date from the local history, or from GitHub
+        if folder_dates is not None:
+            dates = git_dates.lookup_folder(folder_dates, model_name)
+            commit_date = dates['first'] if dates else None
+        else:
+            commit_date = get_github_first_commit_date(model_name, github_token)
         
         if commit_date:
             updated_dates[model_name] = commit_date
@@ -79,9 +94,6 @@ def update_models_json_with_dates(github_token=None):
             # Fallback to a reasonable default
             updated_dates[model_name] = '2024-01-01'
             print(f"  Using fallback date: 2024-01-01")
-        
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
     
     # Write back the updated data with dates
     with open(json_path, 'w', encoding='utf-8') as f:
@@ -92,18 +104,7 @@ def update_models_json_with_dates(github_token=None):
 
 def update_markdown_file_date(file_path, new_date):
     """Update the date in a markdown file's frontmatter"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Update the date in frontmatter
-    content = re.sub(
-        r'date:\s*\d{4}-\d{2}-\d{2}',
-        f'date: {new_date}',
-        content
-    )
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    return patch(file_path, date=datetime.strptime(new_date[:10], '%Y-%m-%d').date())
 
 def update_all_markdown_dates(dates_dict):
     """Update all markdown files with their corresponding GitHub dates"""
@@ -113,41 +114,33 @@ def update_all_markdown_dates(dates_dict):
         print(f"Models directory '{models_dir}' not found!")
         return
     
-    # Get all markdown files
-    model_files = []
-    for filename in os.listdir(models_dir):
-        if filename.endswith('.md'):
-            model_files.append(filename)
+    # Titles come from the collection index, so unchanged pages are not reread
+    index = load_index()
+    model_entries = index.entries('models')
+    names = {}
+    for model_name in dates_dict:
+        names.setdefault(normalize_key(model_name), model_name)
     
-    print(f"\nUpdating {len(model_files)} markdown files with GitHub dates...")
+    print(f"\nUpdating {len(model_entries)} markdown files with GitHub dates...")
     
     updated_count = 0
-    for filename in sorted(model_files):
-        file_path = os.path.join(models_dir, filename)
-        
-        # Read the title from the file to match with dates_dict
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        title_match = re.search(r'title:\s*["\']([^"\']+)["\']', content)
-        if title_match:
-            title = title_match.group(1)
-            
-            # Find matching date
-            if title in dates_dict:
-                update_markdown_file_date(file_path, dates_dict[title])
-                print(f"Updated {filename} -> {dates_dict[title]}")
+    for entry in model_entries:
+        filename = Path(entry['path']).name
+        title = entry['frontmatter'].get('title')
+        if title:
+            # Exact title match, else the longest model name contained in it
+            model_name = match_names(names, str(title))
+            if model_name:
+                if update_markdown_file_date(index.path(entry), dates_dict[model_name]):
+                    index.touch(entry['path'])
+                if model_name == title:
+                    print(f"Updated {filename} -> {dates_dict[model_name]}")
+                else:
+                    print(f"Updated {filename} -> {dates_dict[model_name]} (matched with {model_name})")
                 updated_count += 1
             else:
-                # Try to find a close match
-                for model_name, date in dates_dict.items():
-                    if model_name.lower().replace(' ', '') in title.lower().replace(' ', ''):
-                        update_markdown_file_date(file_path, date)
-                        print(f"Updated {filename} -> {date} (matched with {model_name})")
-                        updated_count += 1
-                        break
-                else:
-                    print(f"No date found for {filename} (title: {title})")
+                print(f"No date found for {filename} (title: {title})")
+    index.save()
     
     print(f"\nUpdated {updated_count} markdown files with GitHub commit dates!")
 
@@ -172,3 +165,4 @@ def main():
 
 if __name__ == '__main__':
     main()
+    print_cache_report()
@@ -19,64 +19,114 @@ import json
 import os
 import re
 import argparse
+import sys
 import requests
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote
 
+from github_cache import cached_get, print_cache_report
+from github_client import API_URL, github_headers
+from fetch_executor import map_ordered
+import tarball_ingest
+from listing_index import write_listing_index
+from atomic_writer import DirectorySync
+from slug_registry import SlugRegistry
+from render_pool import add_jobs_argument, render_ordered, report_errors
+from readme_store import dehydrate_entries, hydrate_entries
+from link_rewriter import is_absolute, rewrite_links
+from classifier import classify, get_classifier
+from profiler import add_profile_argument, profiled, span, start_profile
+
+
+@profiled
+def fetch_readme(api_url, folder_name, headers):
+    """Fetch a folder's README.md through the contents API ("" when missing)"""
+    readme_url = f"{api_url}/{quote(folder_name)}/README.md"
+    try:
+        readme_response = cached_get(readme_url, headers=headers)
+        if readme_response.status_code == 200:
+            readme_data = readme_response.json()
+            if readme_data.get('content'):
+                import base64
+                return base64.b64decode(readme_data['content']).decode('utf-8')
+    except Exception as e:
+        print(f"⚠️  Warning: Could not fetch README for {folder_name}: {e}")
+    return ""
+
+
+def is_model_folder(folder_name):
+    return folder_name not in ['.git', '.github', 'README.md']
+
+
+def build_model_entry(folder_name, readme_content, repo_owner, repo_name):
+    """Create the models.json entry for a folder"""
+    return {
+        "name": folder_name,
+        "display_name": folder_name.replace('-', ' ').replace('_', ' ').title(),
+        "description": f"From scratch implementation of {folder_name}",
+        "readme_content": readme_content,
+        "github_url": f"https://github.com/{repo_owner}/{repo_name}/tree/master/{folder_name}",
+        "api_url": f"{API_URL}/repos/{repo_owner}/{repo_name}/contents/{quote(folder_name)}?ref=master",
+        "download_url": None
+    }
+
 
-def fetch_github_data(github_token=None):
+@profiled
+def fetch_github_data_from_tarball(github_token=None):
+    """Build the same models data as fetch_github_data from one repository tarball"""
+    print("🔄 Fetching latest data from the GitHub tarball...")
+    repo_owner = "YuvrajSingh-mist"
+    repo_name = "Paper-Replications"
+    
+    snapshot = tarball_ingest.fetch_snapshot(repo_name, repo_owner, token=github_token)
+    if snapshot is None:
+        return None
+    
+    models = []
+    # Archive order is git tree order, the same order the contents API lists folders in
+    for folder_name in snapshot.top_level_folders():
+        if not is_model_folder(folder_name):
+            continue
+        print(f"📁 Processing folder: {folder_name}")
+        models.append(build_model_entry(folder_name, snapshot.readmes.get(folder_name, ""), repo_owner, repo_name))
+    
+    print(f"✅ Successfully fetched {len(models)} models from GitHub")
+    return {"models": models}
+
+
+@profiled
+def fetch_github_data(github_token=None, concurrency=None):
     """Fetch the latest models data from GitHub API"""
     print("🔄 Fetching latest data from GitHub...")
     
     # GitHub API endpoint for the Paper Replications repo
     repo_owner = "YuvrajSingh-mist"
     repo_name = "Paper-Replications"
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/contents"
+    api_url = f"{API_URL}/repos/{repo_owner}/{repo_name}/contents"
     
-    headers = {'Accept': 'application/vnd.github.v3+json'}
+    headers = github_headers(github_token)
     if github_token:
-        headers['Authorization'] = f'token {github_token}'
         print("🔑 Using GitHub token for authenticated requests")
     
     try:
-        response = requests.get(api_url, headers=headers)
+        response = cached_get(api_url, headers=headers)
         response.raise_for_status()
         
         folders = response.json()
+        folder_names = [
+            folder['name'] for folder in folders
+            if folder['type'] == 'dir' and is_model_folder(folder['name'])
+        ]
+        
+        # Fetch every README at once; results come back in folder order
+        readmes = map_ordered(lambda folder_name: fetch_readme(api_url, folder_name, headers),
+                              folder_names, concurrency)
         models = []
         
-        for folder in folders:
-            if folder['type'] == 'dir' and folder['name'] not in ['.git', '.github', 'README.md']:
-                folder_name = folder['name']
-                print(f"📁 Processing folder: {folder_name}")
-                
-                # Fetch README content for this folder
-                readme_url = f"{api_url}/{quote(folder_name)}/README.md"
-                readme_content = ""
-                
-                try:
-                    readme_response = requests.get(readme_url, headers=headers)
-                    if readme_response.status_code == 200:
-                        readme_data = readme_response.json()
-                        if readme_data.get('content'):
-                            import base64
-                            readme_content = base64.b64decode(readme_data['content']).decode('utf-8')
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not fetch README for {folder_name}: {e}")
-                
-                # Create model entry
-                model = {
-                    "name": folder_name,
-                    "display_name": folder_name.replace('-', ' ').replace('_', ' ').title(),
-                    "description": f"From scratch implementation of {folder_name}",
-                    "readme_content": readme_content,
-                    "github_url": f"https://github.com/{repo_owner}/{repo_name}/tree/master/{folder_name}",
-                    "api_url": f"https://api.github.com/repos/{repo_owner}/{repo_name}/contents/{quote(folder_name)}?ref=master",
-                    "download_url": None
-                }
-                
-                models.append(model)
+        for folder_name, readme_content in zip(folder_names, readmes):
+            print(f"📁 Processing folder: {folder_name}")
+            models.append(build_model_entry(folder_name, readme_content, repo_owner, repo_name))
         
         print(f"✅ Successfully fetched {len(models)} models from GitHub")
         return {"models": models}
@@ -109,44 +159,6 @@ def clean_markdown_content(content):
     return content
 
 
-def extract_framework_and_dataset(readme_content, description):
-    """Extract framework and dataset information from readme content"""
-    framework = "PyTorch"
-    dataset = "Custom"
-    
-    content_lower = (readme_content + " " + description).lower()
-    
-    if 'pytorch' in content_lower:
-        framework = "PyTorch"
-    elif 'tensorflow' in content_lower:
-        framework = "TensorFlow"
-    elif 'jax' in content_lower:
-        framework = "JAX"
-    
-    dataset_patterns = {
-        'tinystories': 'TinyStories',
-        'tinyshakespeare': 'TinyShakespeare', 
-        'imagenet': 'ImageNet',
-        'cifar': 'CIFAR',
-        'mnist': 'MNIST',
-        'celeba': 'CelebA',
-        'flickr': 'Flickr',
-        'cornell': 'Cornell Movie Dialogs',
-        'cityscapes': 'Cityscapes',
-        'gigaspeech': 'Gigaspeech',
-        'ultrafeedback': 'UltraFeedback',
-        'fineweb': 'FineWeb',
-        'shakespeare': 'Shakespeare'
-    }
-    
-    for pattern, name in dataset_patterns.items():
-        if pattern in content_lower:
-            dataset = name
-            break
-    
-    return framework, dataset
-
-
 def categorize_model(name, description, readme_content):
     """Manual categorization - use existing category from model data or default"""
     # For update_models.py, we'll preserve existing categories
@@ -154,32 +166,7 @@ def categorize_model(name, description, readme_content):
     return "Other"
 
 
-def extract_key_features(readme_content):
-    """Extract key features from readme content"""
-    features = []
-    
-    content_lower = readme_content.lower()
-    
-    if 'mixture of experts' in content_lower or 'moe' in content_lower:
-        features.append("Mixture of Experts (MoE)")
-    if 'attention' in content_lower:
-        features.append("Attention Mechanism")
-    if 'transformer' in content_lower:
-        features.append("Transformer Architecture")
-    if 'distributed' in content_lower or 'ddp' in content_lower:
-        features.append("Distributed Training")
-    if 'gradient checkpointing' in content_lower:
-        features.append("Memory Optimization")
-    if 'fine-tuning' in content_lower or 'finetuning' in content_lower:
-        features.append("Fine-tuning")
-    if 'multimodal' in content_lower:
-        features.append("Multimodal")
-    if 'vision' in content_lower and 'language' in content_lower:
-        features.append("Vision-Language")
-    
-    return features
-
-
+@profiled
 def generate_model_markdown(model_data, index):
     """Generate markdown content for a single model"""
     name = model_data.get('name', 'Unknown Model')
@@ -188,19 +175,21 @@ def generate_model_markdown(model_data, index):
     readme_content = model_data.get('readme_content', '')
     github_url = model_data.get('github_url', '')
 
-    # Extract additional information
-    framework, dataset = extract_framework_and_dataset(readme_content, description)
+    # Extract additional information (rules in _rules/classification.json)
+    labels = classify(['model_framework', 'model_dataset', 'model_features'],
+                      name=name, description=description, readme=readme_content)
+    framework, dataset = labels['model_framework'], labels['model_dataset']
     category = categorize_model(name, description, readme_content)
-    features = extract_key_features(readme_content)
+    features = labels['model_features']
 
     # Clean the readme content
     cleaned_readme = clean_markdown_content(readme_content)
 
-    # Convert image URLs to raw GitHub user content URLs
-    cleaned_readme = re.sub(
-        r'!\[(.*?)\]\((.*?)\)',
-        lambda match: f"![{match.group(1)}](https://raw.githubusercontent.com/YuvrajSingh-mist/{match.group(2).replace('blob/', '')})",
-        cleaned_readme
+    # Convert image URLs to raw GitHub user content URLs (absolute ones and code are left alone)
+    cleaned_readme = rewrite_links(
+        cleaned_readme,
+        on_image=lambda alt, url, title: None if is_absolute(url) else
+        f"![{alt}](https://raw.githubusercontent.com/YuvrajSingh-mist/{url.replace('blob/', '')}{title})"
     )
 
     # Create the frontmatter
@@ -214,6 +203,7 @@ def generate_model_markdown(model_data, index):
     dataset: "{dataset}"
     github_url: "{github_url}"
     date: {datetime.now().strftime('%Y-%m-%d')}
+    order: {index}
     ---
 
     """
@@ -266,8 +256,15 @@ def main():
                        help='GitHub token for API authentication')
     parser.add_argument('--output-dir', default='_models', 
                         help='Output directory for markdown files')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='Maximum concurrent GitHub requests (default: GITHUB_FETCH_CONCURRENCY or 8)')
+    parser.add_argument('--ingest', choices=['api', 'tarball'], default='api',
+                        help='api: contents API per folder (default); tarball: one repository tarball download')
+    add_jobs_argument(parser)
+    add_profile_argument(parser)
     
     args = parser.parse_args()
+    start_profile(args.profile, 'update_models')
     
     script_dir = Path(__file__).parent
     models_json_path = script_dir / '_data' / 'models.json'
@@ -275,7 +272,10 @@ def main():
     
     # Fetch from GitHub if requested
     if args.fetch:
-        github_data = fetch_github_data(args.github_token)
+        if args.ingest == 'tarball':
+            github_data = fetch_github_data_from_tarball(args.github_token)
+        else:
+            github_data = fetch_github_data(args.github_token, args.concurrency)
         if github_data:
             # Backup existing models.json
             if models_json_path.exists():
@@ -283,9 +283,11 @@ def main():
                 models_json_path.rename(backup_path)
                 print(f"📄 Backed up existing models.json to {backup_path}")
             
-            # Save new data
-            with open(models_json_path, 'w', encoding='utf-8') as f:
-                json.dump(github_data, f, indent=2, ensure_ascii=False)
+            # Save new data; READMEs go to the blob store
+            with span('save models.json'):
+                github_data['models'] = dehydrate_entries(github_data['models'])
+                with open(models_json_path, 'w', encoding='utf-8') as f:
+                    json.dump(github_data, f, indent=2, ensure_ascii=False)
             print(f"💾 Saved updated models.json with {len(github_data['models'])} models")
         else:
             print("❌ Failed to fetch data from GitHub, using existing models.json")
@@ -296,12 +298,9 @@ def main():
         print("💡 Try running with --fetch to download from GitHub")
         return
     
-    # Create output directory
-    output_dir.mkdir(exist_ok=True)
-    
     # Load the models data
     try:
-        with open(models_json_path, 'r', encoding='utf-8') as f:
+        with span('load models.json'), open(models_json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
     except Exception as e:
         print(f"❌ Error reading models.json: {e}")
@@ -311,49 +310,65 @@ def main():
         print("❌ Error: 'models' key not found in JSON data")
         return
     
-    models = data['models']
+    with span('hydrate_entries'):
+        models = hydrate_entries(data['models'])
     
-    # Clean up existing files
-    for existing_file in output_dir.glob('*.md'):
-        existing_file.unlink()
-        print(f"🗑️  Removed old file: {existing_file.name}")
+    # Pages are only rewritten when their content changes; stale ones are removed at the end
+    sync = DirectorySync(output_dir, '*.md')
+    registry = SlugRegistry.load()
     
-    # Generate markdown files for each model
-    successful_count = 0
+    # Permanent filenames are assigned here, in list order
+    filenames = []
     for index, model in enumerate(models, 1):
-        try:
-            name = model.get('name', f'model-{index}')
-            slug = slugify(name)
-            filename = f"{index:02d}-{slug}.md"
-            filepath = output_dir / filename
-            
-            # Generate the markdown content
-            content = generate_model_markdown(model, index)
-            
-            # Write the file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print(f"✅ Generated: {filename}")
-            successful_count += 1
-            
-        except Exception as e:
-            print(f"❌ Error generating file for model {model.get('name', 'unknown')}: {e}")
+        name = model.get('name', f'model-{index}')
+        filenames.append(registry.filename('models', name, slugify(name), directory=output_dir,
+                                           legacy=f"{index:02d}-{slugify(name)}"))
     
+    # Render in worker processes; results come back in list order and are written here
+    with span('render', pages=len(models)):
+        results = render_ordered(generate_model_markdown,
+                                 [(model, index) for index, model in enumerate(models, 1)], args.jobs)
+    
+    successful_count = 0
+    errors = []
+    with span('write pages'):
+        for model, filename, (content, error) in zip(models, filenames, results):
+            if error:
+                # Keep the previous page rather than deleting it as stale
+                sync.keep(filename)
+                errors.append((model.get('name', 'unknown'), error))
+                continue
+            status = sync.write(filename, content)
+            if status != 'unchanged':
+                print(f"✅ {status.capitalize()}: {filename}")
+            successful_count += 1
+        
+        registry.save()
+        sync.remove_stale()
+    sync.report()
     print(f"\n🎉 Successfully generated {successful_count} model files in {output_dir}")
     print(f"📁 Files are ready to be used by Jekyll!")
     
-    # Print summary
+    # Print summary (one classification pass over the catalog)
     categories = {}
     frameworks = {}
-    for model in models:
-        readme = model.get('readme_content', '')
-        desc = model.get('description', '')
-        cat = categorize_model(model.get('name', ''), desc, readme)
-        fw, _ = extract_framework_and_dataset(readme, desc)
-        
-        categories[cat] = categories.get(cat, 0) + 1
-        frameworks[fw] = frameworks.get(fw, 0) + 1
+    listing = []
+    with span('classify'):
+        labels = get_classifier().classify_many(
+            ({'name': model.get('name', ''), 'description': model.get('description', ''),
+              'readme': model.get('readme_content', '')} for model in models),
+            ['model_framework'])
+        for model, model_labels in zip(models, labels):
+            cat = categorize_model(model.get('name', ''), model.get('description', ''), model.get('readme_content', ''))
+            fw = model_labels['model_framework']
+            
+            categories[cat] = categories.get(cat, 0) + 1
+            frameworks[fw] = frameworks.get(fw, 0) + 1
+            listing.append(dict(model, category=cat, framework=fw))
+    
+    # Slim card index for the models listing page
+    with span('write_listing_index'):
+        write_listing_index('models', listing)
     
     print(f"\n📊 Summary:")
     print(f"   - Total models processed: {len(models)}")
@@ -361,7 +376,12 @@ def main():
     print(f"   - Output directory: {output_dir}")
     print(f"   - Categories: {dict(sorted(categories.items()))}")
     print(f"   - Frameworks: {dict(sorted(frameworks.items()))}")
+    
+    report_errors(errors)
+    return not errors
 
 
 if __name__ == "__main__":
-    main()
+    success = main()
+    print_cache_report()
+    sys.exit(0 if success else 1)
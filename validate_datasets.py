@@ -6,195 +6,157 @@ This script checks that all dataset files follow the established standards.
 
 import os
 import json
-import yaml
+import argparse
 from pathlib import Path
 import re
 
-def validate_frontmatter(filepath, content):
+import yaml
+
+from validation_engine import Suite, add_engine_arguments, run_suite
+
+suite = Suite('datasets', '_datasets', '*.md')
+
+REQUIRED_FIELDS = ['title', 'excerpt', 'collection', 'github_url']
+REQUIRED_SECTIONS = [
+    "## Dataset Overview",
+    "## Technical Details", 
+    "## Applications",
+    "## Access and Usage"
+]
+LOCAL_IMAGE_PATTERNS = [
+    re.compile(r'!\[[^\]]*\]\((?!http)[^)]+\.(?:png|jpg|jpeg|gif|svg)\)', re.IGNORECASE),
+    re.compile(r'<img[^>]+src=["\'](?!http)[^"\']+\.(?:png|jpg|jpeg|gif|svg)["\']', re.IGNORECASE),
+]
+GITHUB_IMAGE_RE = re.compile(r'!\[([^\]]+)\]\((https://raw\.githubusercontent\.com/[^/]+/[^/]+/[^)]+\.(jpg|jpeg|png|gif|svg))\)', re.IGNORECASE)
+
+@suite.file_check("Frontmatter")
+def validate_frontmatter(doc, context):
     """Validate YAML frontmatter"""
     issues = []
     
+    if not doc.text.startswith('---'):
+        return ["Missing frontmatter delimiter"]
+    if doc.frontmatter_text is None:
+        return ["Missing closing frontmatter delimiter"]
+    
     try:
-        # Extract frontmatter
-        if not content.startswith('---'):
-            issues.append("Missing frontmatter delimiter")
-            return issues
-        
-        end_idx = content.find('---', 3)
-        if end_idx == -1:
-            issues.append("Missing closing frontmatter delimiter")
-            return issues
-        
-        frontmatter_str = content[3:end_idx].strip()
-        frontmatter = yaml.safe_load(frontmatter_str)
-        
-        # Required fields
-        required_fields = ['title', 'excerpt', 'collection', 'github_url']
-        for field in required_fields:
-            if field not in frontmatter:
-                issues.append(f"Missing required field: {field}")
-        
-        # Collection should be 'datasets'
-        if frontmatter.get('collection') != 'datasets':
-            issues.append(f"Collection should be 'datasets', found: {frontmatter.get('collection')}")
-        
-        # GitHub URL validation
-        github_url = frontmatter.get('github_url', '')
-        if github_url and 'github.com' not in github_url:
-            issues.append("Invalid GitHub URL")
-        
-        # Tags and tasks should be lists
-        for field in ['tags', 'tasks']:
-            if field in frontmatter:
-                if not isinstance(frontmatter[field], list):
-                    issues.append(f"{field} should be a list")
-        
+        frontmatter = doc.frontmatter
     except yaml.YAMLError as e:
-        issues.append(f"Invalid YAML frontmatter: {e}")
-    except Exception as e:
-        issues.append(f"Error parsing frontmatter: {e}")
+        return [f"Invalid YAML frontmatter: {e}"]
+    if not isinstance(frontmatter, dict):
+        return [f"Error parsing frontmatter: expected a mapping, found {type(frontmatter).__name__}"]
+    
+    # Required fields
+    for field in REQUIRED_FIELDS:
+        if field not in frontmatter:
+            issues.append(f"Missing required field: {field}")
+    
+    # Collection should be 'datasets'
+    if frontmatter.get('collection') != 'datasets':
+        issues.append(f"Collection should be 'datasets', found: {frontmatter.get('collection')}")
+    
+    # GitHub URL validation
+    github_url = frontmatter.get('github_url', '')
+    if github_url and 'github.com' not in github_url:
+        issues.append("Invalid GitHub URL")
+    
+    # Tags and tasks should be lists
+    for field in ['tags', 'tasks']:
+        if field in frontmatter:
+            if not isinstance(frontmatter[field], list):
+                issues.append(f"{field} should be a list")
     
     return issues
 
-def validate_content_structure(filepath, content):
+@suite.file_check("Content Structure")
+def validate_content_structure(doc, context):
     """Validate content structure"""
     issues = []
+    content = doc.text
     
-    # Required sections
-    required_sections = [
-        "## Dataset Overview",
-        "## Technical Details", 
-        "## Applications",
-        "## Access and Usage"
-    ]
-    
-    for section in required_sections:
+    for section in REQUIRED_SECTIONS:
         if section not in content:
             issues.append(f"Missing required section: {section}")
     
     # Check for local image references
-    local_image_patterns = [
-        r'!\[[^\]]*\]\((?!http)[^)]+\.(?:png|jpg|jpeg|gif|svg)\)',
-        r'<img[^>]+src=["\'](?!http)[^"\']+\.(?:png|jpg|jpeg|gif|svg)["\']'
-    ]
-
-    for pattern in local_image_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
+    for pattern in LOCAL_IMAGE_PATTERNS:
+        matches = pattern.findall(content)
         if matches:
             issues.append(f"Found local image references that should use GitHub URLs: {matches}")
 
     # Check for incorrect GitHub image links
-    incorrect_github_pattern = r'!\[([^\]]+)\]\((https://raw\.githubusercontent\.com/[^/]+/[^/]+/[^)]+\.(jpg|jpeg|png|gif|svg))\)'
-    matches = re.findall(incorrect_github_pattern, content, re.IGNORECASE)
-    for match in matches:
+    for match in GITHUB_IMAGE_RE.findall(content):
         if not match[1].startswith("https://raw.githubusercontent.com/YuvrajSingh-mist/"):
             issues.append(f"Incorrect GitHub image link: {match[1]}")
     
     return issues
 
-def validate_json_consistency():
+@suite.suite_check("JSON Consistency")
+def validate_json_consistency(paths, context):
     """Validate that markdown files match datasets.json entries"""
-    issues = []
-    
-    # Load datasets.json
     datasets_file = "_data/datasets.json"
     if not os.path.exists(datasets_file):
-        issues.append("datasets.json file not found")
-        return issues
+        return ["datasets.json file not found"]
     
     try:
         with open(datasets_file, 'r') as f:
             datasets_data = json.load(f)
-        
-        datasets = datasets_data.get('datasets', [])
-        dataset_names = [d.get('name', '') for d in datasets]
-        
-        # Check markdown files exist for all datasets
-        datasets_dir = Path("_datasets")
-        if not datasets_dir.exists():
-            issues.append("_datasets directory not found")
-            return issues
-        
-        markdown_files = list(datasets_dir.glob("*.md"))
-        
-        # Check count consistency
-        if len(markdown_files) != len(datasets):
-            issues.append(f"Mismatch: {len(datasets)} datasets in JSON, {len(markdown_files)} markdown files")
-        
-        return issues
-        
     except Exception as e:
-        issues.append(f"Error validating JSON consistency: {e}")
-        return issues
-
-def validate_single_file(filepath):
-    """Validate a single dataset markdown file"""
-    issues = []
+        return [f"Error validating JSON consistency: {e}"]
     
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Validate frontmatter
-        frontmatter_issues = validate_frontmatter(filepath, content)
-        issues.extend(frontmatter_issues)
-        
-        # Validate content structure
-        content_issues = validate_content_structure(filepath, content)
-        issues.extend(content_issues)
-        
-    except Exception as e:
-        issues.append(f"Error reading file: {e}")
+    datasets = datasets_data.get('datasets', [])
+    if not Path("_datasets").exists():
+        return ["_datasets directory not found"]
     
-    return issues
+    # Check count consistency
+    if len(paths) != len(datasets):
+        return [f"Mismatch: {len(datasets)} datasets in JSON, {len(paths)} markdown files"]
+    return []
 
-def main():
+def main(args):
     """Main validation function"""
     print("🔍 Validating dataset files...")
     
-    total_issues = 0
+    datasets_dir = Path("_datasets")
+    report = run_suite(suite, args)
     
-    # Validate JSON consistency
+    # JSON consistency
     print("\n📊 Checking JSON consistency...")
-    json_issues = validate_json_consistency()
+    json_issues = report.issues["JSON Consistency"]
     if json_issues:
         print("❌ JSON consistency issues:")
-        for issue in json_issues:
+        for _, issue in json_issues:
             print(f"  - {issue}")
-        total_issues += len(json_issues)
     else:
         print("✅ JSON consistency check passed")
     
-    # Validate individual markdown files
+    # Individual markdown files
     print("\n📝 Validating markdown files...")
-    datasets_dir = Path("_datasets")
-    
     if not datasets_dir.exists():
         print("❌ _datasets directory not found")
         return False
     
-    markdown_files = list(datasets_dir.glob("*.md"))
-    if not markdown_files:
+    if not report.files_checked:
         print("⚠️ No markdown files found in _datasets directory")
         return True
     
-    file_issues = 0
-    for filepath in markdown_files:
-        issues = validate_single_file(filepath)
+    issues_by_file = report.by_file()
+    for filepath in suite.files():
+        issues = issues_by_file.get(filepath.name)
         if issues:
             print(f"❌ {filepath.name}:")
             for issue in issues:
                 print(f"  - {issue}")
-            file_issues += len(issues)
         else:
             print(f"✅ {filepath.name}")
     
-    total_issues += file_issues
+    total_issues = len(report.errors())
     
     # Summary
     print(f"\n📋 Validation Summary:")
-    print(f"  - Files checked: {len(markdown_files)}")
+    print(f"  - Files checked: {report.files_checked}")
     print(f"  - Total issues: {total_issues}")
+    print(f"  {report.summary()}")
     
     if total_issues == 0:
         print("🎉 All validations passed!")
@@ -204,5 +166,7 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
-    exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Validate dataset markdown files')
+    add_engine_arguments(parser)
+    success = main(parser.parse_args())
+    exit(0 if success else 1)
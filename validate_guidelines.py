@@ -4,222 +4,159 @@ Validation script to ensure all model markdown files follow the established guid
 Run this to verify that all automation is working correctly
 """
 
-import os
 import re
 import json
 import argparse
 from pathlib import Path
 
-def check_layout_usage():
-    """Check that all model files use the correct layout"""
-    print("🔍 Checking layout usage...")
-    models_dir = Path("_models")
-    issues = []
-    
-    for md_file in models_dir.glob("*.md"):
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        layout_match = re.search(r'layout:\s*([^\n]+)', content)
-        if layout_match:
-            layout = layout_match.group(1).strip().strip('"')
-            if layout != "model-implementation":
-                issues.append(f"❌ {md_file.name}: uses '{layout}' instead of 'model-implementation'")
-        else:
-            issues.append(f"❌ {md_file.name}: no layout specified")
-    
-    if issues:
-        print(f"  Found {len(issues)} layout issues:")
-        for issue in issues:
-            print(f"    {issue}")
-        return False
-    else:
-        print("  ✅ All files use correct 'model-implementation' layout")
-        return True
-
-def check_local_images():
-    """Check for any remaining local image references"""
-    print("🖼️ Checking for local image references...")
-    models_dir = Path("_models")
-    issues = []
-    
-    image_pattern = r'!\[([^\]]*)\]\(([^)]+\.(jpg|jpeg|png|gif|svg))\)'
-    
-    for md_file in models_dir.glob("*.md"):
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        matches = re.findall(image_pattern, content)
-        if matches:
-            for match in matches:
-                image_path = match[1]
-                if not image_path.startswith('http'):
-                    issues.append(f"❌ {md_file.name}: local image '{image_path}'")
-    
-    if issues:
-        print(f"  Found {len(issues)} local image references:")
-        for issue in issues:
-            print(f"    {issue}")
-        return False
-    else:
-        print("  ✅ No local image references found")
-        return True
-
-def check_github_links():
-    """Check for proper GitHub image links using raw.githubusercontent.com"""
-    print("🔗 Checking GitHub image links...")
-    models_dir = Path("_models")
-    issues = []
-
-    # Updated pattern to check for proper raw.githubusercontent.com image links
-    github_image_pattern = r'!\[([^\]]+)\]\((https://raw\.githubusercontent\.com/[^/]+/[^/]+/[^)]+\.(jpg|jpeg|png|gif|svg|webp))\)'
+from validation_engine import Suite, add_engine_arguments, run_suite
 
-    for md_file in models_dir.glob("*.md"):
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+suite = Suite('guidelines', '_models', '*.md')
 
-        # Flag any concatenated malformed URLs like github.com/.../raw/.../https://raw.githubusercontent.com/...
-        malformed_concat = re.findall(r'https://github\.com/[^)]+/raw/[^)]+https://raw\.githubusercontent\.com/[^)]+', content)
-        for bad in malformed_concat:
-            issues.append(f"❌ {md_file.name}: malformed concatenated URL '{bad}'")
+LOCAL_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+\.(jpg|jpeg|png|gif|svg))\)')
+# Proper raw.githubusercontent.com image links
+GITHUB_IMAGE_RE = re.compile(r'!\[([^\]]+)\]\((https://raw\.githubusercontent\.com/[^/]+/[^/]+/[^)]+\.(jpg|jpeg|png|gif|svg|webp))\)')
+# Concatenated malformed URLs like github.com/.../raw/.../https://raw.githubusercontent.com/...
+MALFORMED_CONCAT_RE = re.compile(r'https://github\.com/[^)]+/raw/[^)]+https://raw\.githubusercontent\.com/[^)]+')
 
-        matches = re.findall(github_image_pattern, content)
-        for match in matches:
-            if not match[1].startswith("https://raw.githubusercontent.com/YuvrajSingh-mist/"):
-                issues.append(f"❌ {md_file.name}: incorrect GitHub image link '{match[1]}'")
+# Check name -> (heading, what an issue is called, message when it passes)
+CHECK_MESSAGES = {
+    "Layout Usage": ("🔍 Checking layout usage...", "layout issues",
+                     "✅ All files use correct 'model-implementation' layout"),
+    "Local Images": ("🖼️ Checking for local image references...", "local image references",
+                     "✅ No local image references found"),
+    "GitHub Links": ("🔗 Checking GitHub image links...", "incorrect GitHub image links",
+                     "✅ All GitHub image links are correct"),
+    "Title Consistency": ("📝 Checking title consistency...", "title inconsistencies",
+                          "✅ All titles match models.json"),
+    "File Count": ("📊 Checking file counts...", "file count issues",
+                   "✅ File count matches JSON entries"),
+    "Automation Setup": ("🤖 Checking automation setup...", "automation issues",
+                         "✅ Automation setup complete"),
+}
 
-    if issues:
-        print(f"  Found {len(issues)} incorrect GitHub image links:")
-        for issue in issues:
-            print(f"    {issue}")
-        return False
-    else:
-        print("  ✅ All GitHub image links are correct")
-        return True
-
-def check_title_consistency():
-    """Check title consistency with models.json"""
-    print("📝 Checking title consistency...")
-    
-    # Load models.json
+@suite.context
+def load_models_json():
+    """Titles and entry count from models.json, loaded once per run"""
     models_file = Path("_data/models.json")
     if not models_file.exists():
-        print("  ❌ models.json not found")
-        return False
+        return {'json_titles': None, 'json_count': None}
     
     with open(models_file, 'r') as f:
         data = json.load(f)
     
     models_list = data.get('models', data) if isinstance(data, dict) else data
-    json_titles = {model.get('name', '') for model in models_list if isinstance(model, dict)}
-    
-    # Check markdown files
-    models_dir = Path("_models")
-    issues = []
-    
-    for md_file in models_dir.glob("*.md"):
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        title_match = re.search(r'title:\s*"([^"]+)"', content)
-        if title_match:
-            title = title_match.group(1)
-            if title not in json_titles:
-                issues.append(f"❌ {md_file.name}: title '{title}' not in models.json")
-        else:
-            issues.append(f"❌ {md_file.name}: no title found")
-    
-    if issues:
-        print(f"  Found {len(issues)} title inconsistencies:")
-        for issue in issues:
-            print(f"    {issue}")
-        return False
-    else:
-        print("  ✅ All titles match models.json")
-        return True
+    models_list = [model for model in models_list if isinstance(model, dict)]
+    return {
+        # A dict so each title check is a hash lookup (and it stays JSON-serialisable)
+        'json_titles': dict.fromkeys(sorted({model.get('name', '') for model in models_list}), True),
+        'json_count': len(models_list),
+    }
 
-def check_file_count():
+@suite.file_check("Layout Usage")
+def check_layout_usage(doc, context):
+    """Check that all model files use the correct layout"""
+    layout = doc.header.value('layout') if doc.header else None
+    if not layout:
+        return ["no layout specified"]
+    if layout != "model-implementation":
+        return [f"uses '{layout}' instead of 'model-implementation'"]
+    return []
+
+@suite.file_check("Local Images")
+def check_local_images(doc, context):
+    """Check for any remaining local image references"""
+    return [f"local image '{match.group(2)}'" for match in LOCAL_IMAGE_RE.finditer(doc.text)
+            if not match.group(2).startswith('http')]
+
+@suite.file_check("GitHub Links")
+def check_github_links(doc, context):
+    """Check for proper GitHub image links using raw.githubusercontent.com"""
+    issues = [f"malformed concatenated URL '{bad}'" for bad in MALFORMED_CONCAT_RE.findall(doc.text)]
+    for match in GITHUB_IMAGE_RE.finditer(doc.text):
+        if not match.group(2).startswith("https://raw.githubusercontent.com/YuvrajSingh-mist/"):
+            issues.append(f"incorrect GitHub image link '{match.group(2)}'")
+    return issues
+
+@suite.file_check("Title Consistency")
+def check_title_consistency(doc, context):
+    """Check title consistency with models.json"""
+    if context['json_titles'] is None:
+        return []
+    title = doc.header.value('title') if doc.header else None
+    if not title:
+        return ["no title found"]
+    if title not in context['json_titles']:
+        return [f"title '{title}' not in models.json"]
+    return []
+
+@suite.suite_check("Title Consistency")
+def check_models_json(paths, context):
+    return ["models.json not found"] if context['json_titles'] is None else []
+
+@suite.suite_check("File Count")
+def check_file_count(paths, context):
     """Check that file count matches models.json"""
-    print("📊 Checking file counts...")
-    
-    # Count markdown files
-    models_dir = Path("_models")
-    md_count = len(list(models_dir.glob("*.md")))
-    
-    # Count models in JSON
-    models_file = Path("_data/models.json")
-    if models_file.exists():
-        with open(models_file, 'r') as f:
-            data = json.load(f)
-        
-        models_list = data.get('models', data) if isinstance(data, dict) else data
-        json_count = len([m for m in models_list if isinstance(m, dict)])
-        
-        print(f"  📄 Markdown files: {md_count}")
-        print(f"  📋 JSON entries: {json_count}")
-        
-        if md_count == json_count:
-            print("  ✅ File count matches JSON entries")
-            return True
-        else:
-            print(f"  ❌ Mismatch: {md_count} files vs {json_count} JSON entries")
-            return False
-    else:
-        print("  ❌ models.json not found")
-        return False
+    if context['json_count'] is None:
+        return ["models.json not found"]
+    if len(paths) != context['json_count']:
+        return [f"Mismatch: {len(paths)} files vs {context['json_count']} JSON entries"]
+    return []
 
-def check_automation_setup():
+@suite.suite_check("Automation Setup")
+def check_automation_setup(paths, context):
     """Check that automation templates and scripts are in place"""
-    print("🤖 Checking automation setup...")
-    
-    template_path = Path("_templates/model_template.md")
-    script_path = Path("create_new_model.py")
-    
     issues = []
-    
-    if not template_path.exists():
-        issues.append("❌ Template missing: _templates/model_template.md")
-    else:
-        print("  ✅ Template found: _templates/model_template.md")
-    
-    if not script_path.exists():
-        issues.append("❌ Script missing: create_new_model.py")
-    else:
-        print("  ✅ Script found: create_new_model.py")
-    
-    if issues:
-        for issue in issues:
-            print(f"    {issue}")
-        print("  💡 Run: python standardize_markdowns.py to recreate automation")
-        return False
-    else:
-        print("  ✅ Automation setup complete")
-        return True
+    if not Path("_templates/model_template.md").exists():
+        issues.append("Template missing: _templates/model_template.md")
+    if not Path("create_new_model.py").exists():
+        issues.append("Script missing: create_new_model.py")
+    return issues
 
-def main():
+def main(args):
     """Run all validation checks"""
     print("🔍 SmolHub Model Generation Validation")
     print("=" * 50)
     
-    checks = [
-        ("Layout Usage", check_layout_usage),
-        ("Local Images", check_local_images),
-        ("GitHub Links", check_github_links),
-        ("Title Consistency", check_title_consistency),
-        ("File Count", check_file_count),
-        ("Automation Setup", check_automation_setup),
-    ]
+    report = run_suite(suite, args)
     
     passed = 0
-    total = len(checks)
+    total = len(CHECK_MESSAGES)
     
-    for check_name, check_func in checks:
+    for check_name, (heading, issue_label, ok_message) in CHECK_MESSAGES.items():
         print(f"\n{check_name}:")
-        if check_func():
+        print(heading)
+        issues = report.issues[check_name]
+        if check_name == "File Count" and report.context.get('json_count') is not None:
+            print(f"  📄 Markdown files: {report.files_checked}")
+            print(f"  📋 JSON entries: {report.context['json_count']}")
+        if check_name == "Automation Setup":
+            for filename, label in (("_templates/model_template.md", "Template"), ("create_new_model.py", "Script")):
+                if Path(filename).exists():
+                    print(f"  ✅ {label} found: {filename}")
+        if issues:
+            print(f"  Found {len(issues)} {issue_label}:")
+            for filename, message in issues:
+                print(f"    ❌ {filename}: {message}" if filename else f"    ❌ {message}")
+            if check_name == "Automation Setup":
+                print("  💡 Run: python standardize_markdowns.py to recreate automation")
+        else:
+            print(f"  {ok_message}")
             passed += 1
     
+    # Checks the engine adds on its own (files that could not be read or parsed) always fail
+    for check_name, issues in report.issues.items():
+        if check_name in CHECK_MESSAGES or not issues:
+            continue
+        total += 1
+        print(f"\n{check_name}:")
+        print(f"  Found {len(issues)} files that could not be checked:")
+        for filename, message in issues:
+            print(f"    ❌ {filename}: {message}" if filename else f"    ❌ {message}")
+    
     print("\n" + "=" * 50)
     print(f"📊 Validation Results: {passed}/{total} checks passed")
+    print(f"  {report.summary()}")
     
     if passed == total:
         print("🎉 All guidelines are being followed correctly!")
@@ -233,37 +170,16 @@ def main():
         print("   - Content issues: python regenerate_models.py")
         print("   - Create new models: python create_new_model.py 'Name' 'Category' 'Dataset' 'URL'")
         return False
-    
-    passed = 0
-    total = len(checks)
-    
-    for check_name, check_func in checks:
-        print(f"\n{check_name}:")
-        if check_func():
-            passed += 1
-    
-    print("\n" + "=" * 50)
-    print(f"📊 Validation Results: {passed}/{total} checks passed")
-    
-    if passed == total:
-        print("🎉 All guidelines are being followed correctly!")
-        print("✅ The automated system is working perfectly!")
-        return True
-    else:
-        print("⚠️  Some issues found. Please run the appropriate scripts to fix them:")
-        print("   - Layout issues: find _models -name '*.md' -exec sed -i 's/layout: paper-replication/layout: model-implementation/g' {} \\;")
-        print("   - Image issues: python fix_images_direct.py")
-        print("   - Content issues: python regenerate_models.py")
-        return False
 
 if __name__ == "__main__":
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Validate markdown files against guidelines')
     parser.add_argument('--source', default='paper-replications', 
                        help='Source repository type (default: paper-replications)')
+    add_engine_arguments(parser)
     args = parser.parse_args()
     
     print(f"🔧 Validating guidelines for source: {args.source}")
     
-    success = main()
+    success = main(args)
     exit(0 if success else 1)
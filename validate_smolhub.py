@@ -5,115 +5,128 @@ SmolHub Playground Validation Script
 Validates that all SmolHub components are working correctly.
 """
 
+import argparse
 import json
-import os
 from pathlib import Path
 
-def validate_smolhub():
+from validation_engine import Suite, add_engine_arguments, run_suite
+
+suite = Suite('smolhub', '_smolhub', 'playground-*.md')
+
+DATA_FILE = Path('_data/smolhub_playground.json')
+PAGE_FILE = Path('_pages/smolhub.html')
+REQUIRED_PROJECT_FIELDS = ['name', 'display_name', 'description', 'github_url']
+REQUIRED_FRONTMATTER = ['title:', 'collection: smolhub', 'github_url:']
+REQUIRED_PAGE_ELEMENTS = [
+    'smolhub-github-data',
+    'site.data.smolhub_playground',
+    'initializeSmolHubEnhancement'
+]
+SCRIPTS = [
+    'generate-smolhub-data.js',
+    'generate-smolhub-markdowns.py',
+    'refresh_smolhub.sh'
+]
+
+@suite.context
+def load_playground_data():
+    """The playground data file, parsed once per run"""
+    if not DATA_FILE.exists():
+        return {'data': None, 'error': None}
+    try:
+        with open(DATA_FILE, 'r') as f:
+            return {'data': json.load(f), 'error': None}
+    except json.JSONDecodeError as e:
+        return {'data': None, 'error': str(e)}
+
+@suite.suite_check("Data File")
+def check_data_file(paths, context):
+    if context['error']:
+        return [f"Invalid JSON in data file: {context['error']}"]
+    if context['data'] is None:
+        return ["SmolHub data file missing: _data/smolhub_playground.json"]
+    if 'projects' not in context['data']:
+        return ["No 'projects' key in data file"]
+    return []
+
+@suite.suite_check("Project Fields", severity='warning')
+def check_project_fields(paths, context):
+    issues = []
+    for i, project in enumerate((context['data'] or {}).get('projects', [])):
+        for field in REQUIRED_PROJECT_FIELDS:
+            if field not in project:
+                issues.append(f"Project {i+1} missing field: {field}")
+    return issues
+
+@suite.suite_check("Directory")
+def check_directory(paths, context):
+    return [] if suite.directory.exists() else ["SmolHub directory missing: _smolhub/"]
+
+@suite.file_check("Frontmatter", severity='warning')
+def check_frontmatter(doc, context):
+    """Validate markdown frontmatter"""
+    issues = []
+    if not doc.text.startswith('---'):
+        issues.append("missing frontmatter")
+    # Check for required frontmatter fields
+    for field in REQUIRED_FRONTMATTER:
+        if field not in doc.text:
+            issues.append(f"missing: {field}")
+    return issues
+
+@suite.suite_check("Page")
+def check_page(paths, context):
+    if not PAGE_FILE.exists():
+        return ["SmolHub page missing: _pages/smolhub.html"]
+    return []
+
+@suite.suite_check("Page Elements", severity='warning')
+def check_page_elements(paths, context):
+    if not PAGE_FILE.exists():
+        return []
+    with open(PAGE_FILE, 'r') as f:
+        content = f.read()
+    return [f"SmolHub page missing: {element}" for element in REQUIRED_PAGE_ELEMENTS if element not in content]
+
+@suite.suite_check("Scripts", severity='warning')
+def check_scripts(paths, context):
+    return [f"Script missing: {script}" for script in SCRIPTS if not Path(script).exists()]
+
+def validate_smolhub(args):
     """Validate SmolHub playground setup"""
     print("🎮 SmolHub Playground Validation")
     print("================================")
     
-    errors = []
-    warnings = []
+    report = run_suite(suite, args)
+    context = load_playground_data()
     
-    # Check data file
-    data_file = Path('_data/smolhub_playground.json')
-    if not data_file.exists():
-        errors.append("❌ SmolHub data file missing: _data/smolhub_playground.json")
-    else:
+    if context['data'] is not None or context['error']:
         print("✅ SmolHub data file found")
-        try:
-            with open(data_file, 'r') as f:
-                data = json.load(f)
-            print(f"   📊 Projects in data: {data.get('total_projects', 0)}")
-            
-            # Validate data structure
-            if 'projects' not in data:
-                errors.append("❌ No 'projects' key in data file")
-            else:
-                projects = data['projects']
-                for i, project in enumerate(projects):
-                    required_fields = ['name', 'display_name', 'description', 'github_url']
-                    for field in required_fields:
-                        if field not in project:
-                            warnings.append(f"⚠️  Project {i+1} missing field: {field}")
-                            
-        except json.JSONDecodeError as e:
-            errors.append(f"❌ Invalid JSON in data file: {e}")
+    if context['data'] is not None:
+        print(f"   📊 Projects in data: {context['data'].get('total_projects', 0)}")
     
-    # Check markdown files
-    smolhub_dir = Path('_smolhub')
-    if not smolhub_dir.exists():
-        errors.append("❌ SmolHub directory missing: _smolhub/")
-    else:
+    if suite.directory.exists():
         print("✅ SmolHub directory found")
-        
-        # Count files
-        playground_files = list(smolhub_dir.glob('playground-*.md'))
-        project_files = list(smolhub_dir.glob('project-*.md'))
-        
-        print(f"   📄 Playground files: {len(playground_files)}")
-        print(f"   📄 Manual project files: {len(project_files)}")
-        
-        # Validate markdown frontmatter
-        for md_file in playground_files:
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                if not content.startswith('---'):
-                    warnings.append(f"⚠️  {md_file.name} missing frontmatter")
-                    
-                # Check for required frontmatter fields
-                required_fm = ['title:', 'collection: smolhub', 'github_url:']
-                for field in required_fm:
-                    if field not in content:
-                        warnings.append(f"⚠️  {md_file.name} missing: {field}")
-                        
-            except Exception as e:
-                errors.append(f"❌ Error reading {md_file.name}: {e}")
+        print(f"   📄 Playground files: {report.files_checked}")
+        print(f"   📄 Manual project files: {len(list(suite.directory.glob('project-*.md')))}")
     
-    # Check page file
-    page_file = Path('_pages/smolhub.html')
-    if not page_file.exists():
-        errors.append("❌ SmolHub page missing: _pages/smolhub.html")
-    else:
+    if PAGE_FILE.exists():
         print("✅ SmolHub page found")
-        try:
-            with open(page_file, 'r') as f:
-                content = f.read()
-            
-            required_elements = [
-                'smolhub-github-data',
-                'site.data.smolhub_playground',
-                'initializeSmolHubEnhancement'
-            ]
-            
-            for element in required_elements:
-                if element not in content:
-                    warnings.append(f"⚠️  SmolHub page missing: {element}")
-                    
-        except Exception as e:
-            errors.append(f"❌ Error reading SmolHub page: {e}")
     
-    # Check scripts
-    scripts = [
-        'generate-smolhub-data.js',
-        'generate-smolhub-markdowns.py',
-        'refresh_smolhub.sh'
-    ]
-    
-    for script in scripts:
-        if not Path(script).exists():
-            warnings.append(f"⚠️  Script missing: {script}")
-        else:
+    for script in SCRIPTS:
+        if Path(script).exists():
             print(f"✅ Script found: {script}")
     
+    errors = [f"❌ {filename}: {message}" if filename else f"❌ {message}"
+              for _, filename, message in report.errors()]
+    warnings = [f"⚠️  {filename} {message}" if filename else f"⚠️  {message}"
+                for _, filename, message in report.warnings()]
+    
     # Summary
     print("\n📋 Validation Summary:")
     print(f"   ❌ Errors: {len(errors)}")
     print(f"   ⚠️  Warnings: {len(warnings)}")
+    print(f"   {report.summary()}")
     
     if errors:
         print("\n❌ Errors found:")
@@ -137,4 +150,6 @@ def validate_smolhub():
     return True
 
 if __name__ == "__main__":
-    validate_smolhub()
+    parser = argparse.ArgumentParser(description='Validate the SmolHub playground setup')
+    add_engine_arguments(parser)
+    validate_smolhub(parser.parse_args())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Parse-once, cached, parallel validation for the collection validators.
+
+validate_guidelines, validate_datasets and validate_smolhub used to re-glob
+their directory and re-read every file once per check, and the dataset
+validator ran the pure-Python YAML loader on each file. Each validator now
+registers its checks on a Suite instead:
+
+    suite = Suite('guidelines', '_models', '*.md')
+
+    @suite.context
+    def load_context():                 # computed once, in the parent
+        return {'json_titles': [...]}
+
+    @suite.file_check('Layout Usage')
+    def check_layout_usage(doc, context):
+        return [f"uses '{doc.frontmatter.get('layout')}' ..."]   # issue messages
+
+    @suite.suite_check('File Count')
+    def check_file_count(paths, context):
+        return []
+
+    report = suite.run(jobs=4)
+    report.by_file(); report.write_json(path); report.write_junit(path)
+
+- every file is read and split into frontmatter/body once (ParsedFile, via
+  frontmatter.py); the header is YAML-parsed lazily, with the libyaml loader
+  when available, and shared by all file checks
+- file check results are cached in .cache/validation/<suite>.json keyed by
+  the file's SHA-256; a file whose size and mtime are unchanged is not even
+  re-read. The cache is dropped when the checks' source or the suite
+  context changes
+- files that do need checking are spread over a process pool (see
+  render_pool) once there are enough of them to pay for the workers
+- suite checks (counts, required files, ...) are cheap and run in the
+  parent on every run
+
+Reports: --json PATH writes every issue as JSON, --junit PATH writes one
+JUnit test case per check (warnings go to system-err and do not fail).
+--profile [TRACE_JSON] times each stage and check (see profiler.py); file
+checks are only broken down per check when they run in-process (--jobs 1).
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from frontmatter import split as split_frontmatter
+from profiler import add_profile_argument, span, start_profile
+from render_pool import render_ordered
+
+BASE_PATH = Path(__file__).parent
+CACHE_DIR = Path(os.environ.get('VALIDATION_CACHE_DIR', BASE_PATH / '.cache' / 'validation'))
+ENGINE_VERSION = 1
+# Below this many files to check, starting worker processes costs more than it saves
+POOL_THRESHOLD = 200
+
+SUITES = {}
+
+
+class ParsedFile:
+    """One file read once: text, frontmatter header and body."""
+
+    def __init__(self, path, text):
+        self.path = Path(path)
+        self.name = self.path.name
+        self.text = text
+        self.header, self.body = split_frontmatter(text)
+        self.frontmatter_text = self.header.text if self.header else None
+
+    @property
+    def frontmatter(self):
+        """Parsed YAML frontmatter ({} when absent); raises yaml.YAMLError."""
+        return self.header.data if self.header else {}
+
+
+class Check:
+    def __init__(self, name, func, severity):
+        self.name = name
+        self.func = func
+        self.severity = severity
+
+
+class Suite:
+    """A directory of files plus the checks that validate it."""
+
+    def __init__(self, name, directory, pattern='*.md'):
+        self.name = name
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.file_checks = []
+        self.suite_checks = []
+        self.context_func = None
+        SUITES[name] = self
+
+    def context(self, func):
+        """Register the function building the (JSON-serialisable) context passed to every check."""
+        self.context_func = func
+        return func
+
+    def file_check(self, name, severity='error'):
+        """Register func(doc: ParsedFile, context) -> [issue messages], run once per file."""
+        def register(func):
+            self.file_checks.append(Check(name, func, severity))
+            return func
+        return register
+
+    def suite_check(self, name, severity='error'):
+        """Register func(paths, context) -> [issue messages], run once per run."""
+        def register(func):
+            self.suite_checks.append(Check(name, func, severity))
+            return func
+        return register
+
+    @property
+    def checks(self):
+        return self.file_checks + self.suite_checks
+
+    def files(self):
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob(self.pattern))
+
+    def cache_key(self, context):
+        """Changes whenever the checks' source, their names or the context change."""
+        digest = hashlib.sha256(f"{ENGINE_VERSION}:{self.name}".encode())
+        sources = {Path(__file__)} | {Path(check.func.__code__.co_filename) for check in self.file_checks}
+        for source in sorted(sources):
+            digest.update(source.read_bytes())
+        digest.update(json.dumps([check.name for check in self.file_checks]).encode())
+        digest.update(json.dumps(context, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def run(self, jobs=None, use_cache=True, cache_dir=None):
+        started = time.perf_counter()
+        with span('context'):
+            context = self.context_func() if self.context_func else {}
+        paths = self.files()
+        key = self.cache_key(context)
+        cache_file = Path(cache_dir or CACHE_DIR) / f"{self.name}.json"
+        with span('load cache'):
+            cached = _load_cache(cache_file, key) if use_cache else {}
+
+        results = {}
+        pending = []
+        for path in paths:
+            entry = cached.get(str(path))
+            stat = path.stat()
+            if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+                results[path] = entry
+            else:
+                pending.append((path, entry['sha256'] if entry else None, stat.st_size, stat.st_mtime_ns))
+
+        workers = jobs if len(pending) >= POOL_THRESHOLD else 1
+        with span('file checks', files=len(pending)):
+            outcomes = render_ordered(_check_file, [(self.name, *item, context) for item in pending], workers)
+        reused = len(results)
+        for (path, sha, size, mtime), (outcome, error) in zip(pending, outcomes):
+            if error:
+                outcome = {'sha256': None, 'size': size, 'mtime': mtime,
+                           'issues': {'Read/Parse': [error]}}
+            elif outcome['sha256'] == sha:
+                # Touched but identical: keep the cached issues, remember the new stat
+                reused += 1
+                outcome = dict(cached[str(path)], size=size, mtime=mtime)
+            results[path] = outcome
+
+        if use_cache:
+            with span('save cache'):
+                _save_cache(cache_file, key, {str(path): entry for path, entry in results.items()
+                                              if entry['sha256'] is not None})
+
+        report = Report(self, len(paths), reused)
+        report.context = context
+        for path in paths:
+            for check_name, messages in results[path]['issues'].items():
+                for message in messages:
+                    report.add(check_name, path.name, message)
+        for check in self.suite_checks:
+            try:
+                with span(check.name):
+                    messages = check.func(paths, context)
+            except Exception as e:
+                messages = [f"check crashed: {e.__class__.__name__}: {e}"]
+            for message in messages:
+                report.add(check.name, None, message)
+        report.seconds = time.perf_counter() - started
+        return report
+
+
+def _check_file(suite_name, path, known_sha, size, mtime, context):
+    """Worker: hash a file and, when it changed, parse it once and run every file check."""
+    suite = SUITES[suite_name]
+    data = Path(path).read_bytes()
+    sha = hashlib.sha256(data).hexdigest()
+    if sha == known_sha:
+        return {'sha256': sha}
+    doc = ParsedFile(path, data.decode('utf-8'))
+    issues = {}
+    for check in suite.file_checks:
+        try:
+            with span(check.name):
+                messages = check.func(doc, context)
+        except Exception as e:
+            messages = [f"check crashed: {e.__class__.__name__}: {e}"]
+        if messages:
+            issues[check.name] = list(messages)
+    return {'sha256': sha, 'size': size, 'mtime': mtime, 'issues': issues}
+
+
+def _load_cache(cache_file, key):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('key') == key else {}
+
+
+def _save_cache(cache_file, key, files):
+    from atomic_writer import write_if_changed
+    write_if_changed(cache_file, json.dumps({'key': key, 'files': files}, sort_keys=True))
+
+
+class Report:
+    """Issues of one suite run, grouped by check."""
+
+    def __init__(self, suite, files_checked, files_cached):
+        self.suite = suite
+        self.files_checked = files_checked
+        self.files_cached = files_cached
+        self.seconds = 0.0
+        self.context = {}
+        self.severity = {check.name: check.severity for check in suite.checks}
+        self.issues = {check.name: [] for check in suite.checks}
+
+    def add(self, check_name, filename, message):
+        self.severity.setdefault(check_name, 'error')
+        self.issues.setdefault(check_name, []).append((filename, message))
+
+    def errors(self):
+        return [(check, filename, message) for check, items in self.issues.items()
+                for filename, message in items if self.severity[check] == 'error']
+
+    def warnings(self):
+        return [(check, filename, message) for check, items in self.issues.items()
+                for filename, message in items if self.severity[check] != 'error']
+
+    def by_file(self):
+        """{filename: [messages]} of file-level issues, in check order."""
+        grouped = {}
+        for items in self.issues.values():
+            for filename, message in items:
+                if filename is not None:
+                    grouped.setdefault(filename, []).append(message)
+        return grouped
+
+    def passed(self, check_name):
+        return not self.issues.get(check_name)
+
+    def summary(self):
+        return (f"⚡ {self.files_checked} files, {self.files_cached} unchanged since the last run, "
+                f"{self.seconds * 1000:.0f} ms")
+
+    def to_dict(self):
+        return {
+            'suite': self.suite.name,
+            'directory': str(self.suite.directory),
+            'files_checked': self.files_checked,
+            'files_cached': self.files_cached,
+            'seconds': round(self.seconds, 4),
+            'errors': len(self.errors()),
+            'warnings': len(self.warnings()),
+            'checks': [{
+                'name': name,
+                'severity': self.severity[name],
+                'passed': not items,
+                'issues': [{'file': filename, 'message': message} for filename, message in items],
+            } for name, items in self.issues.items()],
+        }
+
+    def write_json(self, path):
+        from atomic_writer import write_atomic
+        write_atomic(path, (json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + '\n').encode('utf-8'))
+
+    def write_junit(self, path):
+        from atomic_writer import write_atomic
+        testsuite = ET.Element('testsuite', name=self.suite.name, tests=str(len(self.issues)),
+                               failures=str(sum(1 for name, items in self.issues.items()
+                                                if items and self.severity[name] == 'error')),
+                               time=f"{self.seconds:.3f}")
+        for name, items in self.issues.items():
+            case = ET.SubElement(testsuite, 'testcase', classname=self.suite.name, name=name)
+            if not items:
+                continue
+            lines = '\n'.join(f"{filename}: {message}" if filename else message for filename, message in items)
+            if self.severity[name] == 'error':
+                failure = ET.SubElement(case, 'failure', message=f"{len(items)} issue(s)")
+                failure.text = lines
+            else:
+                ET.SubElement(case, 'system-err').text = lines
+        ET.indent(testsuite)
+        write_atomic(path, ET.tostring(testsuite, encoding='utf-8', xml_declaration=True) + b'\n')
+
+
+def add_engine_arguments(parser):
+    """--json/--junit report paths, --jobs, --no-cache and --profile for a validator CLI."""
+    from render_pool import add_jobs_argument
+    add_jobs_argument(parser)
+    parser.add_argument('--json', metavar='PATH', help='Write a JSON report of every issue')
+    parser.add_argument('--junit', metavar='PATH', help='Write a JUnit XML report (one test case per check)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-check every file, ignoring cached results')
+    add_profile_argument(parser)
+
+
+def run_suite(suite, args):
+    """Run a suite with the CLI options from add_engine_arguments and write the requested reports."""
+    start_profile(args.profile, f"validate {suite.name}")
+    with span('run'):
+        report = suite.run(jobs=args.jobs, use_cache=not args.no_cache)
+    if args.json:
+        report.write_json(args.json)
+    if args.junit:
+        report.write_junit(args.junit)
+    return report
+
+
+if __name__ == '__main__':
+    print("Run validate_guidelines.py, validate_datasets.py or validate_smolhub.py")
+    sys.exit(1)